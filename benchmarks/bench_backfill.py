@@ -0,0 +1,66 @@
+"""
+Backfill rows/sec with increasing worker counts.
+
+Shards are served by a fake facade with a fixed round-trip latency per page and
+written to a temporary SQLite store, so the numbers show where adding workers
+stops paying off on this machine's disk.
+
+Usage:
+    python benchmarks/bench_backfill.py [--chains N] [--pages N] [--latency SECONDS]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import Backfill, RecordStore  # noqa: E402
+from fixtures import vaa_record  # noqa: E402
+
+
+class _FakeAPI:
+    def __init__(self, pages: int, latency: float) -> None:
+        self.pages = pages
+        self.latency = latency
+
+    def get_vaas_by_chain(self, chain, page, page_size, sort_order):
+        time.sleep(self.latency)
+        if page >= self.pages:
+            return {"data": []}
+        rng = random.Random(chain * 100_000 + page)
+        records = []
+        for i in range(page_size):
+            record = vaa_record(page * page_size + i, rng)
+            record["id"] = f"{chain}/{record['id']}"
+            record["emitterChain"] = chain
+            records.append(record)
+        return {"data": records}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--chains", type=int, default=8)
+    parser.add_argument("--pages", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    api = _FakeAPI(args.pages, args.latency)
+    for workers in (1, 2, 4, 8):
+        with tempfile.TemporaryDirectory() as directory:
+            with RecordStore(os.path.join(directory, "mirror.db")) as store:
+                backfill = Backfill(
+                    api, store, chains=range(args.chains), workers=workers
+                )
+                progress = backfill.run()
+        print(
+            f"workers={workers:<3} {progress['rows']} rows in {progress['elapsed']:6.2f}s"
+            f" ({progress['rows_per_second']:8.0f} rows/s)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Time a pool of workers spends on an endpoint that hangs, with and without a circuit breaker.
+
+The stub server holds every response for `--hang` seconds, longer than the client's
+`--timeout`, standing in for an upstream route that has stopped answering. Without a
+breaker every call waits for the full timeout; with one, calls fail fast once the
+circuit of the endpoint group is open.
+
+Usage:
+    python benchmarks/bench_breaker.py [--calls N] [--workers N] [--timeout SECONDS] [--hang SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import (  # noqa: E402
+    APIClient,
+    CircuitBreaker,
+    Network,
+    WormholescanAPI,
+)
+from stub_server import stub_server  # noqa: E402
+
+
+def _measure(label: str, client: APIClient, calls: int, workers: int) -> None:
+    api = WormholescanAPI(api_client=client)
+
+    def call(_) -> str:
+        try:
+            api.get_x_chain_activity()
+            return "ok"
+        except requests.RequestException as e:
+            return type(e).__name__
+
+    start = time.perf_counter()
+    # Every failed call prints a line, which would drown the numbers.
+    with open(os.devnull, "w") as devnull, redirect_stdout(devnull):
+        with ThreadPoolExecutor(workers) as executor:
+            outcomes = list(executor.map(call, range(calls)))
+    elapsed = time.perf_counter() - start
+    client.close()
+
+    counts = ", ".join(
+        f"{outcomes.count(name)} {name}" for name in sorted(set(outcomes))
+    )
+    print(f"  {label:<16} {elapsed:8.2f} s   {counts}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=10)
+    parser.add_argument("--timeout", type=float, default=0.5)
+    parser.add_argument("--hang", type=float, default=2.0)
+    args = parser.parse_args()
+
+    with stub_server(delay=args.hang) as base_url:
+        print(
+            f"{args.calls} calls on {args.workers} workers, timeout {args.timeout:g} s"
+        )
+        for label, breaker in (
+            ("no breaker", None),
+            ("circuit breaker", CircuitBreaker(failure_threshold=5)),
+        ):
+            client = APIClient(
+                Network.MAINNET,
+                pool_maxsize=args.workers,
+                timeouts={"/api/v1/x-chain-activity": (1, args.timeout)},
+                breaker=breaker,
+            )
+            client.base_url = base_url
+            _measure(label, client, args.calls, args.workers)
+
+
+if __name__ == "__main__":
+    main()
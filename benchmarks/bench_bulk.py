@@ -0,0 +1,53 @@
+"""
+Throughput of one-by-one `get_vaa_by_id` calls versus `get_many_vaas_by_id`.
+
+The stub server holds every response for `--latency` seconds, standing in for the
+round trip to the API, so the numbers show how much of that wait bulk lookups overlap.
+
+Usage:
+    python benchmarks/bench_bulk.py [--ids N] [--latency SECONDS] [--concurrency N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import Network, WormholescanAPI  # noqa: E402
+from fixtures import EMITTER  # noqa: E402
+from stub_server import stub_server  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--ids", type=int, default=500)
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--concurrency", type=int, default=10)
+    args = parser.parse_args()
+
+    # A quarter of the IDs are repeats, as when reconciling overlapping batches.
+    ids = [(2, EMITTER, seq % (args.ids * 3 // 4)) for seq in range(args.ids)]
+
+    with stub_server(delay=args.latency) as base_url:
+        with WormholescanAPI(Network.MAINNET) as api:
+            api._api_client.base_url = base_url
+
+            start = time.perf_counter()
+            for vaa_id in ids:
+                api.get_vaa_by_id(*vaa_id)
+            before = time.perf_counter() - start
+            print(f"{'one by one':<28} {args.ids / before:>10.0f} ids/s")
+
+            start = time.perf_counter()
+            results = api.get_many_vaas_by_id(ids, concurrency=args.concurrency)
+            after = time.perf_counter() - start
+            assert all(result.ok for result in results)
+            print(f"{'get_many_vaas_by_id':<28} {args.ids / after:>10.0f} ids/s")
+
+    print(f"{'speedup':<28} {before / after:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
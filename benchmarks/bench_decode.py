@@ -0,0 +1,43 @@
+"""
+JSON decode throughput of each available backend over fixture payloads.
+
+Usage:
+    python benchmarks/bench_decode.py [--fixtures DIR] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan._internal.decoder import get_decoder  # noqa: E402
+from fixtures import load_fixtures  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--fixtures", help="Directory of recorded *.json bodies.")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    fixtures = load_fixtures(args.fixtures)
+    for name, content in fixtures.items():
+        print(f"{name} ({len(content) / 1024:.0f} KiB)")
+        for backend in ("json", "orjson", "msgspec"):
+            try:
+                decode = get_decoder(backend)
+            except ImportError:
+                print(f"  {backend:<8} not installed")
+                continue
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                decode(content)
+            elapsed = time.perf_counter() - start
+            mib_s = len(content) * args.repeat / elapsed / 1024 / 1024
+            print(f"  {backend:<8} {mib_s:8.1f} MiB/s")
+
+
+if __name__ == "__main__":
+    main()
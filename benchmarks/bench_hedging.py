@@ -0,0 +1,86 @@
+"""
+Tail latency of `get_vaa_by_id` against one base URL versus two mirrors with hedging.
+
+Each stub server answers after `--latency` seconds, and holds back a `--slow-ratio`
+share of its responses for `--slow` more seconds, standing in for a degraded node.
+With hedging, a request still unanswered after the p95 latency is sent again to the
+other mirror and the first answer wins.
+
+Usage:
+    python benchmarks/bench_hedging.py [--calls N] [--latency SECONDS] [--slow SECONDS] [--slow-ratio R]
+"""
+
+import argparse
+import os
+import sys
+import time
+from contextlib import ExitStack
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import (  # noqa: E402
+    APIClient,
+    HedgePolicy,
+    Network,
+    WormholescanAPI,
+)
+from fixtures import EMITTER  # noqa: E402
+from stub_server import stub_server  # noqa: E402
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def _measure(label: str, client: APIClient, calls: int) -> None:
+    api = WormholescanAPI(api_client=client)
+    samples = []
+    for seq in range(calls):
+        start = time.perf_counter()
+        api.get_vaa_by_id(2, EMITTER, seq)
+        samples.append(time.perf_counter() - start)
+    client.close()
+
+    print(
+        f"  {label:<24} p50 {_percentile(samples, 0.5) * 1000:8.2f} ms"
+        f"   p99 {_percentile(samples, 0.99) * 1000:8.2f} ms"
+        f"   max {max(samples) * 1000:8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=1000)
+    parser.add_argument("--latency", type=float, default=0.002)
+    parser.add_argument("--slow", type=float, default=0.1)
+    parser.add_argument("--slow-ratio", type=float, default=0.03)
+    args = parser.parse_args()
+
+    with ExitStack() as stack:
+        base_urls = [
+            stack.enter_context(
+                stub_server(
+                    delay=args.latency, slow=args.slow, slow_ratio=args.slow_ratio
+                )
+            )
+            for _ in range(2)
+        ]
+        print(
+            f"latency {args.latency * 1000:.0f} ms, {args.slow_ratio:.0%} of responses"
+            f" {args.slow * 1000:.0f} ms slower"
+        )
+
+        client = APIClient(Network.MAINNET)
+        client.base_url = base_urls[0]
+        _measure("one base url", client, args.calls)
+
+        client = APIClient(Network.MAINNET, base_urls=base_urls)
+        _measure("two mirrors", client, args.calls)
+
+        client = APIClient(Network.MAINNET, base_urls=base_urls, hedge=HedgePolicy())
+        _measure("two mirrors, hedged", client, args.calls)
+        print(f"  hedges: {client.router.stats()['hedges']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Scan-and-filter cost of lazy views against full decoding.
+
+Two workloads over a fixture page: reading `id` and `sequence` from every
+record, and stopping at the first record matching a sequence. Reports time per
+page and peak allocation for the decoder path and the `lazy=True` path.
+
+Usage:
+    python benchmarks/bench_lazy.py [--page-size N] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan._internal.decoder import get_decoder  # noqa: E402
+from pywormholescan._internal.lazy import lazy_view  # noqa: E402
+from fixtures import generated_fixtures  # noqa: E402
+
+
+def scan_all(page) -> int:
+    return sum(1 for record in page["data"] if record["id"] and record["sequence"])
+
+
+def find_first(page) -> int:
+    for record in page["data"]:
+        if record["sequence"] == 10:
+            return record["id"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    body = generated_fixtures(args.page_size)["vaas_page"]
+    print(f"vaas page: {args.page_size} records, {len(body) / 1024:.0f} KiB")
+    decode = get_decoder()
+    paths = (("decoded", decode), ("lazy", lambda b: lazy_view(b, decode)))
+    for workload in (scan_all, find_first):
+        print(workload.__name__)
+        for label, load in paths:
+            start = time.perf_counter()
+            for _ in range(args.repeat):
+                workload(load(body))
+            per_page = (time.perf_counter() - start) / args.repeat
+            tracemalloc.start()
+            workload(load(body))
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+            print(
+                f"  {label:<8} {per_page * 1000:8.2f} ms/page"
+                f" {peak / 1024:10.0f} KiB peak"
+            )
+
+
+if __name__ == "__main__":
+    main()
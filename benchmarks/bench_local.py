@@ -0,0 +1,59 @@
+"""
+Lookup latency of LocalWormholescanAPI over a populated RecordStore.
+
+Fills a temporary store with generated VAAs, then times `get_vaa_by_id`,
+`get_vaas_by_emitter` and `get_all_vaas(tx_hash=...)` served locally.
+
+Usage:
+    python benchmarks/bench_local.py [--rows N] [--lookups N]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import LocalWormholescanAPI, Network, RecordStore  # noqa: E402
+from fixtures import EMITTER, vaa_record  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=5_000)
+    args = parser.parse_args()
+
+    rng = random.Random(7)
+    with tempfile.TemporaryDirectory() as directory:
+        with RecordStore(os.path.join(directory, "mirror.db")) as store:
+            records = [vaa_record(seq, rng) for seq in range(args.rows)]
+            start = time.perf_counter()
+            for offset in range(0, args.rows, 10_000):
+                store.save_vaas(records[offset : offset + 10_000])
+            print(f"loaded {args.rows} rows in {time.perf_counter() - start:.2f}s")
+
+            api = LocalWormholescanAPI(store, Network.MAINNET, fallback=False)
+            sequences = [rng.randrange(args.rows) for _ in range(args.lookups)]
+            lookups = {
+                "get_vaa_by_id": lambda seq: api.get_vaa_by_id(2, EMITTER, seq),
+                "get_vaas_by_emitter": lambda seq: api.get_vaas_by_emitter(
+                    2, EMITTER, page=seq % 100, page_size=50
+                ),
+                "get_all_vaas(tx_hash)": lambda seq: api.get_all_vaas(
+                    tx_hash=records[seq]["txHash"]
+                ),
+            }
+            for name, lookup in lookups.items():
+                start = time.perf_counter()
+                for seq in sequences:
+                    lookup(seq)
+                per_call = (time.perf_counter() - start) / len(sequences)
+                print(f"  {name:<24} {per_call * 1e6:8.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Memory and decode cost of typed models against plain dicts.
+
+Decodes fixture pages, keeps every record alive, and reports retained memory
+and records/s for the dict path and for the `models=True` path.
+
+Usage:
+    python benchmarks/bench_models.py [--pages N] [--page-size N]
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import sys
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan._internal.decoder import get_decoder  # noqa: E402
+from pywormholescan.models import VAA, Observation, to_models  # noqa: E402
+from fixtures import observation_record, vaa_record  # noqa: E402
+
+
+def _pages(record, pages: int, page_size: int, wrap: bool) -> list:
+    rng = random.Random(7)
+    bodies = []
+    for page in range(pages):
+        records = [record(page * page_size + i, rng) for i in range(page_size)]
+        bodies.append(json.dumps({"data": records} if wrap else records).encode())
+    return bodies
+
+
+def _retained(bodies: list, convert) -> int:
+    decode = get_decoder()
+    gc.collect()
+    tracemalloc.start()
+    kept = [convert(decode(body)) for body in bodies]
+    gc.collect()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return retained
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=20)
+    parser.add_argument("--page-size", type=int, default=1000)
+    args = parser.parse_args()
+
+    cases = [
+        ("vaas", vaa_record, VAA, "data", True),
+        ("observations", observation_record, Observation, None, False),
+    ]
+    count = args.pages * args.page_size
+    for name, record, model, key, wrap in cases:
+        bodies = _pages(record, args.pages, args.page_size, wrap)
+        print(f"{name} ({count} records)")
+        for label, convert in (
+            ("dict", lambda page: page),
+            ("model", lambda page: to_models(page, model, key)),
+        ):
+            # Time without tracemalloc, which slows allocation down considerably.
+            decode = get_decoder()
+            start = time.perf_counter()
+            for body in bodies:
+                convert(decode(body))
+            elapsed = time.perf_counter() - start
+            retained = _retained(bodies, convert)
+            print(
+                f"  {label:<6} {count / elapsed:10.0f} records/s"
+                f" {retained / count:8.0f} B/record retained"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""
+Crawl time of a paginated walk with increasing prefetch depth.
+
+Each page is served by a fake fetch with a fixed round-trip latency, so the
+numbers isolate the effect of keeping several pages in flight.
+
+Usage:
+    python benchmarks/bench_prefetch.py [--pages N] [--latency SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan._internal.pagination import paginate  # noqa: E402
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--pages", type=int, default=40)
+    parser.add_argument("--latency", type=float, default=0.05)
+    args = parser.parse_args()
+
+    def fetch(page, page_size):
+        time.sleep(args.latency)
+        return {"data": [{"id": page}] * page_size if page < args.pages else []}
+
+    baseline = None
+    for depth in (1, 2, 4, 8):
+        start = time.perf_counter()
+        count = sum(1 for _ in paginate(fetch, page_size=100, prefetch=depth))
+        elapsed = time.perf_counter() - start
+        baseline = baseline or elapsed
+        print(
+            f"prefetch={depth:<3} {count} records in {elapsed:6.2f}s"
+            f" ({baseline / elapsed:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+"""
+Requests/sec with a fresh connection per call versus APIClient's pooled session.
+
+Usage:
+    python benchmarks/bench_session.py [--requests N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import requests
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import Network  # noqa: E402
+from pywormholescan._internal import APIClient  # noqa: E402
+from stub_server import stub_server  # noqa: E402
+
+
+def _rate(label: str, fn, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        fn()
+    elapsed = time.perf_counter() - start
+    print(f"{label:<28} {n / elapsed:>10.0f} req/s")
+    return n / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=2000)
+    args = parser.parse_args()
+
+    with stub_server() as base_url:
+        url = f"{base_url}/api/v1/health"
+        before = _rate(
+            "requests.get (no pool)", lambda: requests.get(url), args.requests
+        )
+
+        with APIClient(Network.MAINNET) as client:
+            client.base_url = base_url
+            after = _rate(
+                "APIClient (pooled)",
+                lambda: client.get("/api/v1/health"),
+                args.requests,
+            )
+
+    print(f"{'speedup':<28} {after / before:>10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
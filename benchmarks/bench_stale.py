@@ -0,0 +1,73 @@
+"""
+Call latency of a hot aggregate endpoint with a plain TTL versus stale-while-revalidate.
+
+The stub server holds every response for `--latency` seconds, standing in for a slow
+upstream. Calls are spread over several TTL periods: with a plain TTL, the first call
+after each expiry waits for a fresh response, while with a stale window it is served
+the previous body and the refresh happens in the background.
+
+Usage:
+    python benchmarks/bench_stale.py [--calls N] [--interval SECONDS] [--ttl SECONDS] [--latency SECONDS]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import (  # noqa: E402
+    APIClient,
+    Network,
+    ResponseCache,
+    WormholescanAPI,
+)
+from stub_server import stub_server  # noqa: E402
+
+
+def _percentile(samples: list, fraction: float) -> float:
+    return sorted(samples)[min(len(samples) - 1, int(len(samples) * fraction))]
+
+
+def _measure(label: str, cache: ResponseCache, base_url: str, args) -> None:
+    with APIClient(Network.MAINNET, cache=cache) as client:
+        client.base_url = base_url
+        api = WormholescanAPI(api_client=client)
+        api.get_top_symbols_by_volume()
+
+        samples = []
+        for _ in range(args.calls):
+            start = time.perf_counter()
+            api.get_top_symbols_by_volume()
+            samples.append(time.perf_counter() - start)
+            time.sleep(args.interval)
+
+    print(
+        f"  {label:<24} p50 {_percentile(samples, 0.5) * 1000:8.2f} ms"
+        f"   p99 {_percentile(samples, 0.99) * 1000:8.2f} ms"
+        f"   max {max(samples) * 1000:8.2f} ms"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--interval", type=float, default=0.005)
+    parser.add_argument("--ttl", type=float, default=0.1)
+    parser.add_argument("--latency", type=float, default=0.2)
+    args = parser.parse_args()
+
+    with stub_server(delay=args.latency) as base_url:
+        print(f"upstream latency {args.latency * 1000:.0f} ms, ttl {args.ttl:g} s")
+        _measure("ttl", ResponseCache(ttl=args.ttl), base_url, args)
+        _measure(
+            "stale-while-revalidate",
+            ResponseCache(ttl=args.ttl, stale_ttl=60),
+            base_url,
+            args,
+        )
+
+
+if __name__ == "__main__":
+    main()
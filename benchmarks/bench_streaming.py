@@ -0,0 +1,85 @@
+"""
+Peak memory and time of reading a large page with `get` versus `stream`.
+
+A VAA page is served by the local stub server once, recorded with
+RecordingTransport, and then read both over HTTP and from the ReplayTransport
+fixture, so the second set of numbers involves no network at all.
+
+Usage:
+    python benchmarks/bench_streaming.py [--page-size N] [--chunk-size BYTES]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import (  # noqa: E402
+    APIClient,
+    Network,
+    RecordingTransport,
+    ReplayTransport,
+)
+from fixtures import generated_fixtures  # noqa: E402
+from stub_server import stub_server  # noqa: E402
+
+ENDPOINT = "/api/v1/vaas?pageSize=1000"
+
+
+def _buffered(client: APIClient, chunk_size: int) -> int:
+    return sum(1 for record in client.get(ENDPOINT)["data"] if record["id"])
+
+
+def _streamed(client: APIClient, chunk_size: int) -> int:
+    records = client.stream(ENDPOINT, chunk_size=chunk_size)
+    return sum(1 for record in records if record["id"])
+
+
+def _measure(label: str, client: APIClient, chunk_size: int) -> None:
+    for name, read in (("get", _buffered), ("stream", _streamed)):
+        start = time.perf_counter()
+        count = read(client, chunk_size)
+        elapsed = time.perf_counter() - start
+        # Peak memory is measured on a separate run: tracing slows allocations down.
+        tracemalloc.start()
+        read(client, chunk_size)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(
+            f"  {label:<8} {name:<8} {count:>6} records {elapsed * 1000:8.1f} ms"
+            f" {peak / 1024:10.0f} KiB peak"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=5000)
+    parser.add_argument("--chunk-size", type=int, default=65536)
+    args = parser.parse_args()
+
+    body = generated_fixtures(args.page_size)["vaas_page"]
+    print(f"vaas page: {args.page_size} records, {len(body) / 1024:.0f} KiB")
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "vaas.jsonl.gz")
+        with stub_server(body) as base_url:
+            recorder = RecordingTransport(path)
+            with APIClient(Network.MAINNET, transport=recorder) as client:
+                client.base_url = base_url
+                client.get(ENDPOINT)
+
+            with APIClient(Network.MAINNET) as client:
+                client.base_url = base_url
+                _measure("http", client, args.chunk_size)
+
+        with APIClient(Network.MAINNET, transport=ReplayTransport(path)) as client:
+            client.base_url = base_url
+            _measure("replay", client, args.chunk_size)
+
+
+if __name__ == "__main__":
+    main()
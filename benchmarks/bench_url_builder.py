@@ -0,0 +1,73 @@
+"""
+Cost per call of `build_url`, against the previous join-and-split implementation.
+
+Usage:
+    python benchmarks/bench_url_builder.py [--calls N]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan._internal.url_builder import build_url  # noqa: E402
+from fixtures import EMITTER  # noqa: E402
+
+
+def legacy_build_url(*args, **kwargs) -> str:
+    """`build_url` as it was before templates: rebuilt from scratch on every call."""
+    path_params = "/".join(str(param) for param in args)
+
+    query_params = ""
+    if kwargs:
+        queries = "&".join(
+            f"{_legacy_camel_case(k)}={v}" for k, v in kwargs["kwargs"].items()
+        )
+        query_params = f"?{queries}"
+
+    return f"{path_params}{query_params}" if query_params else path_params
+
+
+def _legacy_camel_case(query: str) -> str:
+    splitted_query = query.split("_")
+    return f"{splitted_query[0]}" + "".join(
+        [splitted_query[i].title() for i in range(len(splitted_query)) if i != 0]
+    )
+
+
+CALLS = {
+    "vaa by id": (("/api/v1/vaas", 2, EMITTER, 12345), {"kwargs": {}}),
+    "vaas by emitter, paged": (
+        ("/api/v1/vaas", 2, EMITTER),
+        {"kwargs": {"page": 3, "page_size": 50, "sort_order": "ASC"}},
+    ),
+    "observations, paged": (
+        ("/api/v1/observations",),
+        {"kwargs": {"page": 3, "page_size": 50, "sort_order": "DESC"}},
+    ),
+}
+
+
+def _per_call(build, args, kwargs, n: int) -> float:
+    start = time.perf_counter()
+    for _ in range(n):
+        build(*args, **kwargs)
+    return (time.perf_counter() - start) / n
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'':<24} {'before':>10} {'after':>10}")
+    for name, (call_args, call_kwargs) in CALLS.items():
+        before = _per_call(legacy_build_url, call_args, call_kwargs, args.calls)
+        after = _per_call(build_url, call_args, call_kwargs, args.calls)
+        print(f"{name:<24} {before * 1e9:>8.0f}ns {after * 1e9:>8.0f}ns")
+
+
+if __name__ == "__main__":
+    main()
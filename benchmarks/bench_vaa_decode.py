@@ -0,0 +1,51 @@
+"""
+VAAs decoded per second by the offline decoder.
+
+Usage:
+    python benchmarks/bench_vaa_decode.py [--count N] [--signatures N]
+"""
+
+import argparse
+import base64
+import os
+import random
+import struct
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pywormholescan import decode_vaas  # noqa: E402
+
+
+def make_vaa(sequence: int, signatures: int, rng: random.Random) -> bytes:
+    header = struct.pack(">BIB", 1, 4, signatures)
+    sigs = b"".join(bytes([i]) + rng.randbytes(65) for i in range(signatures))
+    body = (
+        struct.pack(">IIH", 1709294400, rng.getrandbits(32), 2)
+        + rng.randbytes(32)
+        + struct.pack(">QB", sequence, 15)
+        + rng.randbytes(133)
+    )
+    return header + sigs + body
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=50_000)
+    parser.add_argument("--signatures", type=int, default=13)
+    args = parser.parse_args()
+
+    rng = random.Random(1)
+    raw = [make_vaa(seq, args.signatures, rng) for seq in range(args.count)]
+    encoded = [base64.b64encode(vaa).decode() for vaa in raw]
+
+    for label, vaas in (("raw bytes", raw), ("base64 strings", encoded)):
+        start = time.perf_counter()
+        decode_vaas(vaas)
+        elapsed = time.perf_counter() - start
+        print(f"{label:<16} {args.count / elapsed:>10.0f} VAAs/s")
+
+
+if __name__ == "__main__":
+    main()
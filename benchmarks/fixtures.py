@@ -0,0 +1,91 @@
+"""
+Representative Wormholescan payloads for offline benchmarks.
+
+The records mirror the shape of real /api/v1/vaas, /api/v1/observations and
+/api/v1/scorecards responses. Pass a directory of recorded `*.json` bodies to
+`load_fixtures` to benchmark against captured traffic instead.
+"""
+
+import base64
+import glob
+import json
+import os
+import random
+
+EMITTER = "0000000000000000000000003ee18b2214aff97000d974cf647e7c347e8fa585"
+# Observations are signed by the 19 guardians of the current set.
+GUARDIANS = ["0x" + random.Random(i).randbytes(20).hex() for i in range(19)]
+
+
+def vaa_record(seq: int, rng: random.Random) -> dict:
+    return {
+        "sequence": seq,
+        "id": f"2/{EMITTER}/{seq}",
+        "version": 1,
+        "emitterChain": 2,
+        "emitterAddr": EMITTER,
+        "emitterNativeAddr": "0x3ee18b2214aff97000d974cf647e7c347e8fa585",
+        "guardianSetIndex": 4,
+        "vaa": base64.b64encode(rng.randbytes(1100)).decode(),
+        "timestamp": "2024-03-01T12:00:00Z",
+        "updatedAt": "2024-03-01T12:00:05.123Z",
+        "indexedAt": "2024-03-01T12:00:05.123Z",
+        "txHash": rng.randbytes(32).hex(),
+        "digest": rng.randbytes(32).hex(),
+        "isDuplicated": False,
+        "payload": {
+            "payloadType": 1,
+            "amount": str(rng.randrange(10**12)),
+            "fee": "0",
+            "toChain": rng.choice([1, 4, 5, 6, 23, 30]),
+            "toAddress": rng.randbytes(32).hex(),
+            "tokenAddress": "000000000000000000000000c02aaa39b223fe8d0a0e5c4f27ead9083c756cc2",
+            "tokenChain": 2,
+        },
+    }
+
+
+def observation_record(seq: int, rng: random.Random) -> dict:
+    return {
+        "id": f"2/{EMITTER}/{seq}/{rng.randbytes(20).hex()}/{rng.randbytes(32).hex()}",
+        "emitterChain": 2,
+        "emitterAddr": EMITTER,
+        "sequence": str(seq),
+        "hash": base64.b64encode(rng.randbytes(32)).decode(),
+        "txHash": base64.b64encode(rng.randbytes(32)).decode(),
+        "guardianAddr": rng.choice(GUARDIANS),
+        "signature": base64.b64encode(rng.randbytes(65)).decode(),
+        "updatedAt": "2024-03-01T12:00:05.123Z",
+        "indexedAt": "2024-03-01T12:00:05.123Z",
+    }
+
+
+def generated_fixtures(page_size: int = 1000, seed: int = 7) -> dict:
+    """Returns a mapping of fixture name to encoded response body."""
+    rng = random.Random(seed)
+    vaas = {"data": [vaa_record(seq, rng) for seq in range(page_size)]}
+    observations = [observation_record(seq, rng) for seq in range(page_size)]
+    scorecards = {
+        "24h_messages": "1523434",
+        "24h_volume": "45873244.72",
+        "total_messages": "1112683497",
+        "total_tx_count": "2312333",
+        "total_volume": "38000000000.35",
+        "tvl": "3112367843.12",
+    }
+    return {
+        "vaas_page": json.dumps(vaas).encode(),
+        "observations_page": json.dumps(observations).encode(),
+        "scorecards": json.dumps(scorecards).encode(),
+    }
+
+
+def load_fixtures(directory: str = None, page_size: int = 1000) -> dict:
+    """Loads recorded `*.json` bodies from `directory`, or generates them when it is omitted."""
+    if directory is None:
+        return generated_fixtures(page_size)
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(directory, "*.json"))):
+        with open(path, "rb") as f:
+            fixtures[os.path.splitext(os.path.basename(path))[0]] = f.read()
+    return fixtures
@@ -0,0 +1,43 @@
+"""
+Local HTTP/1.1 server used by the benchmarks.
+
+It runs the test suite's `StubServer` (tests/http_stub.py), answering every GET
+with a fixed JSON body and keeping connections alive, so benchmarks measure the
+client side rather than the network.
+"""
+
+import os
+import sys
+from contextlib import contextmanager
+
+sys.path.insert(
+    0,
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "tests"),
+)
+
+from http_stub import StubServer  # noqa: E402
+
+
+@contextmanager
+def stub_server(
+    body: bytes = None, delay: float = 0.0, slow: float = 0.0, slow_ratio: float = 0.0
+):
+    """
+    Runs the stub server on a random local port.
+
+    Args:
+        body (bytes): Response body served for every request.
+        delay (float): Seconds each response is held back, to stand in for network latency.
+        slow (float): Extra seconds a share of the responses is held back, to stand in for tail latency.
+        slow_ratio (float): Share of the responses held back for `slow` more seconds.
+
+    Yields:
+        The base URL of the running server.
+    """
+    server = StubServer(slow=slow, slow_ratio=slow_ratio)
+    server.add_default(json={"status": "OK"}, body=body, delay=delay)
+    server.start()
+    try:
+        yield server.url
+    finally:
+        server.stop()
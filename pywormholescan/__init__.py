@@ -1,6 +1,62 @@
 from .guardian import GuardianAPI
 from .wormholescan import WormholescanAPI
-from ._internal.network import Network
+from .async_guardian import AsyncGuardianAPI
+from .async_wormholescan import AsyncWormholescanAPI
+from .vaa import ParsedVAA, decode_vaa, decode_vaas
+from .verify import GuardianSetCache, VAAVerifier
+from .backfill import Backfill
+from .local import LocalWormholescanAPI
+from ._internal import (
+    APIClient,
+    AsyncAPIClient,
+    BulkResult,
+    CircuitBreaker,
+    CircuitOpenError,
+    ConditionalCache,
+    HedgePolicy,
+    HTTPTransport,
+    Network,
+    RateLimiter,
+    RecordingTransport,
+    RecordStore,
+    ReplayTransport,
+    ResponseCache,
+    RetryBudget,
+    RetryPolicy,
+    Transport,
+    VAAStore,
+    prometheus_text,
+)
 
-
-__all__ = ["GuardianAPI", "WormholescanAPI", "Network"]
+__all__ = [
+    "GuardianAPI",
+    "WormholescanAPI",
+    "AsyncGuardianAPI",
+    "AsyncWormholescanAPI",
+    "LocalWormholescanAPI",
+    "APIClient",
+    "AsyncAPIClient",
+    "BulkResult",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ConditionalCache",
+    "HedgePolicy",
+    "HTTPTransport",
+    "Network",
+    "RateLimiter",
+    "RecordingTransport",
+    "RecordStore",
+    "ReplayTransport",
+    "ResponseCache",
+    "RetryBudget",
+    "RetryPolicy",
+    "Transport",
+    "VAAStore",
+    "prometheus_text",
+    "ParsedVAA",
+    "decode_vaa",
+    "decode_vaas",
+    "GuardianSetCache",
+    "VAAVerifier",
+    "Backfill",
+]
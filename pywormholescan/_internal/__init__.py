@@ -1,3 +1,17 @@
 from .api_client import APIClient
+from .async_api_client import AsyncAPIClient
+from .breaker import CircuitBreaker, CircuitOpenError
+from .bulk import BulkResult
+from .cache import ResponseCache
+from .conditional import ConditionalCache
+from .decoder import get_decoder
+from .lazy import LazyArray, LazyObject
 from .network import Network
+from .rate_limiter import RateLimiter, TokenBucket
+from .retry import RetryBudget, RetryPolicy
+from .routing import HedgePolicy, Router
+from .stats import ClientStats, prometheus_text
+from .store import RecordStore
+from .transport import HTTPTransport, RecordingTransport, ReplayTransport, Transport
 from .url_builder import build_url
+from .vaa_store import VAAStore
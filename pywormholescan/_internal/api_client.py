@@ -1,39 +1,391 @@
+import contextvars
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple, Union
+
 import requests
 
+from .base_client import BaseAPIClient
+from .breaker import CircuitBreaker, CircuitOpenError
+from .cache import ResponseCache
+from .conditional import ConditionalCache
+from .decoder import Decoder
 from .network import Network
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .routing import HedgePolicy
+from .singleflight import SingleFlight
+from .stats import template_name
+from .streaming import RecordParser
+from .transport import (
+    HTTPTransport,
+    RecordingTransport,
+    TimedHTTPAdapter,
+    Transport,
+    connect_time,
+    reset_connect_time,
+)
 from .url_builder import build_url
+from .vaa_store import VAAStore
+
 
+class APIClient(BaseAPIClient):
+    def __init__(
+        self,
+        network: Network,
+        *,
+        pool_connections: int = 10,
+        pool_maxsize: int = 10,
+        pool_block: bool = False,
+        keep_alive: bool = True,
+        timeout: float = 120,
+        cache: ResponseCache = None,
+        vaa_store: VAAStore = None,
+        coalesce: bool = False,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        decoder: Decoder = None,
+        lazy: bool = False,
+        conditional: ConditionalCache = None,
+        transport: Transport = None,
+        base_urls: Sequence[str] = None,
+        hedge: HedgePolicy = None,
+        breaker: CircuitBreaker = None,
+        timeouts: Dict[str, Union[float, Tuple[float, float]]] = None,
+    ) -> None:
+        """
+        Initializes the client and its pooled HTTP session.
 
-class APIClient:
-    def __init__(self, network: Network) -> None:
-        if not isinstance(network, Network):
-            raise ValueError(
-                "Invalid network provided. Please use Network.MAINNET or Network.TESTNET."
+        Args:
+            network (Network): Network to send requests to.
+            pool_connections (int): Number of host connection pools to cache.
+            pool_maxsize (int): Maximum number of connections kept alive per host.
+            pool_block (bool): Block when the pool is exhausted instead of opening extra connections.
+            keep_alive (bool): Reuse connections between requests. Disabling sends `Connection: close`.
+            timeout (float): Request timeout in seconds.
+            cache (ResponseCache): Opt-in response cache for GET requests.
+            vaa_store (VAAStore): Opt-in persistent cache for immutable signed VAA lookups.
+            coalesce (bool): Merge concurrent GETs for the same URL into a single request.
+            retry (RetryPolicy): Retry policy for failed GET requests. Disabled by default.
+            rate_limiter (RateLimiter): Client-side limiter pacing every request, shareable across clients.
+            decoder (Decoder): Function decoding response bodies. Defaults to the fastest installed JSON library.
+            lazy (bool): Return read-only lazy views over the raw body instead of decoded dicts and lists.
+            conditional (ConditionalCache): Opt-in revalidation of repeated GETs with `ETag`/`Last-Modified`.
+            transport (Transport): Sends the requests. Defaults to an HTTPTransport over the pooled
+                session; RecordingTransport and ReplayTransport capture and serve offline fixtures.
+            base_urls (Sequence[str]): Base URLs serving the network's API, such as mirrors or
+                self-hosted wormhole-explorer instances. GETs go to the fastest one for their
+                endpoint and fail over to the others. Defaults to the network's URL alone.
+            hedge (HedgePolicy): Opt-in hedging of slow GETs with a duplicate request.
+            breaker (CircuitBreaker): Opt-in circuit breaker failing GETs fast for endpoint groups
+                that keep failing, shareable across clients.
+            timeouts (Dict[str, float | Tuple[float, float]]): Per-endpoint timeouts overriding `timeout`,
+                keyed by path prefix such as "/v1/governor". A value is either one timeout or a
+                (connect, read) pair. The longest matching prefix wins.
+        """
+        super().__init__(
+            network,
+            timeout=timeout,
+            cache=cache,
+            vaa_store=vaa_store,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            decoder=decoder,
+            lazy=lazy,
+            conditional=conditional,
+            base_urls=base_urls,
+            hedge=hedge,
+            breaker=breaker,
+            timeouts=timeouts,
+        )
+        self.single_flight = SingleFlight() if coalesce else None
+        recorder = transport if isinstance(transport, RecordingTransport) else None
+        if transport is None or (recorder is not None and recorder.transport is None):
+            pooled = HTTPTransport(
+                self._build_session(
+                    pool_connections, pool_maxsize, pool_block, keep_alive
+                )
             )
+            if recorder is None:
+                transport = pooled
+            else:
+                # Recording goes through the pooled session the client would have used.
+                recorder.transport = pooled
+        self.transport = transport
+        self.session = getattr(self.transport, "session", None)
+        self._refreshes = set()
+        self._refreshes_lock = threading.Lock()
+
+    @staticmethod
+    def _build_session(
+        pool_connections: int, pool_maxsize: int, pool_block: bool, keep_alive: bool
+    ) -> requests.Session:
+        session = requests.Session()
+        adapter = TimedHTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        if not keep_alive:
+            session.headers["Connection"] = "close"
+        return session
+
+    def close(self) -> None:
+        """
+        Waits for background refreshes, then closes the transport, and with it the
+        session and every pooled connection.
+        """
+        with self._refreshes_lock:
+            refreshes = list(self._refreshes)
+        for thread in refreshes:
+            thread.join()
+        if self.router is not None:
+            self.router.close()
+        self.transport.close()
 
-        self.base_url = network.value
-        self.timeout = 120
+    def __enter__(self) -> "APIClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def get(self, endpoint: str) -> dict:
         url = f"{self.base_url}{endpoint}"
+        template = template_name(endpoint)
+        content = self._cached(url, endpoint)
+        self.stats.record_call(template, cached=content is not None)
+        if content is None:
+            content = self._load(url, endpoint)
+        return self._decoded(template, content)
+
+    def _load(self, url: str, endpoint: str) -> bytes:
+        if self.single_flight is not None:
+            return self.single_flight.do(url, lambda: self._fetch(url, endpoint))
+        return self._fetch(url, endpoint)
+
+    def _refresh_in_background(self, url: str, endpoint: str) -> None:
+        # The copied context keeps the endpoint template the refresh's metrics are labelled with.
+        thread = threading.Thread(
+            target=contextvars.copy_context().run,
+            args=(self._refresh, url, endpoint),
+            daemon=True,
+        )
+        with self._refreshes_lock:
+            self._refreshes.add(thread)
+        thread.start()
+
+    def _refresh(self, url: str, endpoint: str) -> None:
         try:
-            response = requests.get(url, timeout=self.timeout)
-            response.raise_for_status()
-            return response.json()
+            self._load(url, endpoint)
+        except requests.RequestException:
+            pass  # The stale body keeps being served until its stale window ends.
+        finally:
+            self.cache.release_refresh(url)
+            with self._refreshes_lock:
+                self._refreshes.discard(threading.current_thread())
+
+    def _fetch(self, url: str, endpoint: str) -> bytes:
+        headers = self._conditional_headers(url)
+        response = self._send(url, endpoint, headers=headers)
+        content = self._revalidated(
+            url,
+            response.status_code,
+            response.headers,
+            response.content,
+            conditional=headers is not None,
+        )
+        if content is None:
+            content = self._send(url, endpoint).content
+        self._remember(url, endpoint, content)
+        return content
+
+    def _send(
+        self,
+        url: str,
+        endpoint: str,
+        stream: bool = False,
+        headers: Optional[dict] = None,
+        template: Optional[str] = None,
+    ) -> requests.Response:
+        template = template or template_name(endpoint)
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.breaker is not None:
+                try:
+                    self.breaker.before(endpoint)
+                except CircuitOpenError:
+                    self.stats.record_error(template, "CircuitOpenError")
+                    raise
+            self._start_attempt(attempt)
+            started = time.perf_counter()
+            try:
+                if self.router is None:
+                    response = self._request(
+                        "GET", url, endpoint, template, stream=stream, headers=headers
+                    )
+                else:
+                    response = self.router.send(
+                        endpoint,
+                        self._routed_base_urls(),
+                        lambda base_url: self._request(
+                            "GET",
+                            f"{base_url}{endpoint}",
+                            endpoint,
+                            template,
+                            stream=stream,
+                            headers=headers,
+                        ),
+                    )
+                response.raise_for_status()
+            except requests.RequestException as e:
+                if e.response is not None:
+                    e.response.close()
+                reason, retry_after = _retry_reason(e)
+                self._record_circuit(endpoint, started, reason)
+                delay = self._retry_delay(attempt, reason, retry_after)
+                if delay is None:
+                    print(f"GET request failed: {e}")
+                    raise
+            else:
+                self._record_circuit(endpoint, started)
+                return response
+            time.sleep(delay)
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        endpoint: str,
+        template: str,
+        *,
+        stream: bool = False,
+        headers: Optional[dict] = None,
+        json: Optional[dict] = None,
+    ) -> requests.Response:
+        """Sends one request through the rate limiter and transport, recording its metrics."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(self.network, endpoint)
+        reset_connect_time()
+        started = time.perf_counter()
+        try:
+            response = self.transport.send(
+                method,
+                url,
+                timeout=self._timeout_for(endpoint),
+                json=json,
+                stream=stream,
+                headers=headers,
+            )
         except requests.RequestException as e:
-            print(f"GET request failed: {e}")
+            self.stats.record_error(template, type(e).__name__)
             raise
+        total = time.perf_counter() - started
+        # `elapsed` runs until the headers are parsed; the body of a buffered response is read after.
+        headers_after = response.elapsed.total_seconds() or total
+        connect = connect_time()
+        self.stats.record_response(
+            template,
+            response.status_code,
+            connect=connect,
+            ttfb=max(headers_after - connect, 0.0),
+            download=None if stream else max(total - headers_after, 0.0),
+            size=0 if stream else len(response.content),
+        )
+        return response
+
+    def stream(
+        self,
+        endpoint: str,
+        records_path: Sequence[str] = ("data",),
+        *,
+        chunk_size: int = 65536,
+        convert: Optional[Callable[[dict], Any]] = None,
+    ) -> Iterator[Any]:
+        """
+        Yields the records of a page response while its body is still downloading.
+
+        The body is read in chunks and its records array parsed incrementally, so only
+        about one chunk and one record are held in memory, however large the page.
+        Streamed responses bypass the response cache, the VAA store and coalescing;
+        a failed request is retried before its first record is yielded, never after.
+
+        Args:
+            endpoint (str): Endpoint path, including its query string.
+            records_path (Sequence[str]): Keys leading to the records list in the response.
+            chunk_size (int): Bytes read from the socket at a time.
+            convert (Callable): Applied to each decoded record, e.g. a model's `from_dict`.
+        """
+        return self._stream(
+            endpoint, template_name(endpoint), records_path, chunk_size, convert
+        )
+
+    def _stream(
+        self,
+        endpoint: str,
+        template: str,
+        records_path: Sequence[str],
+        chunk_size: int,
+        convert: Optional[Callable[[dict], Any]],
+    ) -> Iterator[Any]:
+        url = f"{self.base_url}{endpoint}"
+        self.stats.record_call(template, cached=False)
+        response = self._send(url, endpoint, stream=True, template=template)
+        parser = RecordParser(self.decoder, records_path)
+        size = 0
+        started = time.perf_counter()
+        with response:
+            for chunk in response.iter_content(chunk_size):
+                size += len(chunk)
+                for record in parser.feed(chunk):
+                    yield convert(record) if convert is not None else record
+        self.stats.record_download(template, time.perf_counter() - started, size)
+        parser.close()
 
     def get_with_url_builder(self, *args, **kwargs) -> dict:
         path = build_url(*args, **kwargs)
-        return self.get(path)
+        token = self._set_template(args)
+        try:
+            return self.get(path)
+        finally:
+            self._reset_template(token)
+
+    def stream_with_url_builder(
+        self,
+        *args,
+        records_path: Sequence[str] = ("data",),
+        chunk_size: int = 65536,
+        convert: Optional[Callable[[dict], Any]] = None,
+        **kwargs,
+    ) -> Iterator[Any]:
+        path = build_url(*args, **kwargs)
+        token = self._set_template(args)
+        try:
+            return self.stream(
+                path, records_path, chunk_size=chunk_size, convert=convert
+            )
+        finally:
+            self._reset_template(token)
 
     def post(self, endpoint: str, json: dict) -> dict:
         url = f"{self.base_url}{endpoint}"
+        template = template_name(endpoint)
+        self.stats.record_call(template, cached=False)
         try:
-            response = requests.post(url, json=json, timeout=self.timeout)
+            response = self._request("POST", url, endpoint, template, json=json)
             response.raise_for_status()
-            return response.json()
         except requests.RequestException as e:
             print(f"POST request failed: {e}")
             raise
+        return self._decoded(template, response.content)
+
+
+def _retry_reason(error: requests.RequestException) -> tuple:
+    """Returns the retry reason and `Retry-After` header for a failed request."""
+    if error.response is not None:
+        return error.response.status_code, error.response.headers.get("Retry-After")
+    if isinstance(error, (requests.ConnectionError, requests.Timeout)):
+        return type(error).__name__, None
+    return None, None
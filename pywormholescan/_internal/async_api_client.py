@@ -0,0 +1,400 @@
+import asyncio
+import time
+from typing import Any, AsyncIterator, Callable, Dict, Optional, Sequence, Tuple, Union
+
+from .base_client import BaseAPIClient
+from .breaker import CircuitBreaker, CircuitOpenError
+from .cache import ResponseCache
+from .conditional import ConditionalCache
+from .decoder import Decoder
+from .network import Network
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .routing import HedgePolicy
+from .singleflight import AsyncSingleFlight
+from .stats import template_name
+from .streaming import RecordParser
+from .url_builder import build_url
+from .vaa_store import VAAStore
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - exercised only without the extra installed
+    aiohttp = None
+
+
+class AsyncAPIClient(BaseAPIClient):
+    def __init__(
+        self,
+        network: Network,
+        *,
+        pool_maxsize: int = 100,
+        pool_maxsize_per_host: int = 0,
+        keep_alive_timeout: float = 15,
+        max_concurrency: int = 100,
+        timeout: float = 120,
+        cache: ResponseCache = None,
+        vaa_store: VAAStore = None,
+        coalesce: bool = False,
+        retry: RetryPolicy = None,
+        rate_limiter: RateLimiter = None,
+        decoder: Decoder = None,
+        lazy: bool = False,
+        conditional: ConditionalCache = None,
+        base_urls: Sequence[str] = None,
+        hedge: HedgePolicy = None,
+        breaker: CircuitBreaker = None,
+        timeouts: Dict[str, Union[float, Tuple[float, float]]] = None,
+    ) -> None:
+        """
+        Initializes the asyncio client. The aiohttp session is created lazily inside the running event loop.
+
+        Unlike APIClient, requests always go through aiohttp: the `Transport` interface, and with
+        it record/replay, is built on `requests` and covers the sync client only.
+
+        Args:
+            network (Network): Network to send requests to.
+            pool_maxsize (int): Maximum number of open connections. 0 means unlimited.
+            pool_maxsize_per_host (int): Maximum number of open connections per host. 0 means unlimited.
+            keep_alive_timeout (float): Seconds an idle connection is kept open for reuse.
+            max_concurrency (int): Maximum number of requests in flight at once.
+            timeout (float): Request timeout in seconds.
+            cache (ResponseCache): Opt-in response cache for GET requests.
+            vaa_store (VAAStore): Opt-in persistent cache for immutable signed VAA lookups.
+            coalesce (bool): Merge concurrent GETs for the same URL into a single request.
+            retry (RetryPolicy): Retry policy for failed GET requests. Disabled by default.
+            rate_limiter (RateLimiter): Client-side limiter pacing every request, shareable across clients.
+            decoder (Decoder): Function decoding response bodies. Defaults to the fastest installed JSON library.
+            lazy (bool): Return read-only lazy views over the raw body instead of decoded dicts and lists.
+            conditional (ConditionalCache): Opt-in revalidation of repeated GETs with `ETag`/`Last-Modified`.
+            base_urls (Sequence[str]): Base URLs serving the network's API, such as mirrors. GETs go
+                to the fastest one for their endpoint and fail over to the others.
+            hedge (HedgePolicy): Opt-in hedging of slow GETs with a duplicate request, run as a task.
+            breaker (CircuitBreaker): Opt-in circuit breaker failing GETs fast for endpoint groups
+                that keep failing, shareable across clients, sync and async alike.
+            timeouts (Dict[str, float | Tuple[float, float]]): Per-endpoint timeouts overriding `timeout`,
+                keyed by path prefix. A (connect, read) pair bounds connecting and each socket read.
+        """
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncAPIClient requires aiohttp. Install it with `pip install pywormholescan[async]`."
+            )
+        super().__init__(
+            network,
+            timeout=timeout,
+            cache=cache,
+            vaa_store=vaa_store,
+            retry=retry,
+            rate_limiter=rate_limiter,
+            decoder=decoder,
+            lazy=lazy,
+            conditional=conditional,
+            base_urls=base_urls,
+            hedge=hedge,
+            breaker=breaker,
+            timeouts=timeouts,
+        )
+        self.single_flight = AsyncSingleFlight() if coalesce else None
+        self.max_concurrency = max_concurrency
+        self._connector_options = {
+            "limit": pool_maxsize,
+            "limit_per_host": pool_maxsize_per_host,
+            "keepalive_timeout": keep_alive_timeout,
+        }
+        self._session = None
+        self._semaphore = None
+        self._refreshes = set()
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        if self._session is None or self._session.closed:
+            trace = aiohttp.TraceConfig()
+            trace.on_connection_create_start.append(_connect_started)
+            trace.on_connection_create_end.append(_connect_ended)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**self._connector_options),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                trace_configs=[trace],
+            )
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+        return self._session
+
+    async def close(self) -> None:
+        """Cancels pending background refreshes and closes the session and every pooled connection."""
+        for task in list(self._refreshes):
+            task.cancel()
+        if self.router is not None:
+            self.router.close()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self) -> "AsyncAPIClient":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def _request(
+        self, method: str, url: str, endpoint: str, template: str, **kwargs
+    ) -> tuple:
+        """Sends one request through the rate limiter and returns its status, headers and body."""
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(self.network, endpoint)
+        session = self.session
+        timing = {"connect": 0.0}
+        async with self._semaphore:
+            started = time.perf_counter()
+            try:
+                async with session.request(
+                    method,
+                    url,
+                    timeout=self._client_timeout(endpoint),
+                    trace_request_ctx=timing,
+                    **kwargs,
+                ) as response:
+                    headers_at = time.perf_counter()
+                    content = await response.read()
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                self.stats.record_error(template, type(e).__name__)
+                raise
+        connect = timing["connect"]
+        self.stats.record_response(
+            template,
+            response.status,
+            connect=connect,
+            ttfb=max(headers_at - started - connect, 0.0),
+            download=time.perf_counter() - headers_at,
+            size=len(content),
+        )
+        response.raise_for_status()
+        return response.status, response.headers, content
+
+    async def get(self, endpoint: str) -> dict:
+        url = f"{self.base_url}{endpoint}"
+        template = template_name(endpoint)
+        content = self._cached(url, endpoint)
+        self.stats.record_call(template, cached=content is not None)
+        if content is None:
+            content = await self._load(url, endpoint)
+        return self._decoded(template, content)
+
+    async def _load(self, url: str, endpoint: str) -> bytes:
+        if self.single_flight is not None:
+            return await self.single_flight.do(url, lambda: self._fetch(url, endpoint))
+        return await self._fetch(url, endpoint)
+
+    def _refresh_in_background(self, url: str, endpoint: str) -> None:
+        task = asyncio.get_running_loop().create_task(self._refresh(url, endpoint))
+        self._refreshes.add(task)
+        task.add_done_callback(self._refreshes.discard)
+
+    async def _refresh(self, url: str, endpoint: str) -> None:
+        try:
+            await self._load(url, endpoint)
+        except (aiohttp.ClientError, asyncio.TimeoutError, CircuitOpenError):
+            pass  # The stale body keeps being served until its stale window ends.
+        finally:
+            self.cache.release_refresh(url)
+
+    async def _fetch(self, url: str, endpoint: str) -> bytes:
+        template = template_name(endpoint)
+        headers = self._conditional_headers(url)
+        status, response_headers, content = await self._send(
+            endpoint,
+            template,
+            lambda url: self._request("GET", url, endpoint, template, headers=headers),
+        )
+        content = self._revalidated(
+            url, status, response_headers, content, conditional=headers is not None
+        )
+        if content is None:
+            _, _, content = await self._send(
+                endpoint,
+                template,
+                lambda url: self._request("GET", url, endpoint, template),
+            )
+        self._remember(url, endpoint, content)
+        return content
+
+    async def _send(self, endpoint: str, template: str, request: Callable[[str], Any]):
+        """Sends `request(url)` with retries, through the router when there are several base URLs."""
+        attempt = 0
+        while True:
+            attempt += 1
+            if self.breaker is not None:
+                try:
+                    self.breaker.before(endpoint)
+                except CircuitOpenError:
+                    self.stats.record_error(template, "CircuitOpenError")
+                    raise
+            self._start_attempt(attempt)
+            started = time.perf_counter()
+            try:
+                if self.router is None:
+                    result = await request(f"{self.base_url}{endpoint}")
+                else:
+                    result = await self.router.send_async(
+                        endpoint,
+                        self._routed_base_urls(),
+                        lambda base_url: request(f"{base_url}{endpoint}"),
+                        _failover,
+                    )
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                reason, retry_after = _retry_reason(e)
+                self._record_circuit(endpoint, started, reason)
+                delay = self._retry_delay(attempt, reason, retry_after)
+                if delay is None:
+                    print(f"GET request failed: {e}")
+                    raise
+            else:
+                self._record_circuit(endpoint, started)
+                return result
+            await asyncio.sleep(delay)
+
+    def _client_timeout(self, endpoint: str) -> "aiohttp.ClientTimeout":
+        timeout = self._timeout_for(endpoint)
+        if isinstance(timeout, tuple):
+            connect, read = timeout
+            return aiohttp.ClientTimeout(
+                total=None, sock_connect=connect, sock_read=read
+            )
+        return aiohttp.ClientTimeout(total=timeout)
+
+    async def _open(
+        self, session, url: str, endpoint: str, template: str
+    ) -> "aiohttp.ClientResponse":
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(self.network, endpoint)
+        timing = {"connect": 0.0}
+        started = time.perf_counter()
+        try:
+            response = await session.request(
+                "GET",
+                url,
+                timeout=self._client_timeout(endpoint),
+                trace_request_ctx=timing,
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            self.stats.record_error(template, type(e).__name__)
+            raise
+        connect = timing["connect"]
+        self.stats.record_response(
+            template,
+            response.status,
+            connect=connect,
+            ttfb=max(time.perf_counter() - started - connect, 0.0),
+        )
+        try:
+            response.raise_for_status()
+        except aiohttp.ClientResponseError:
+            response.release()
+            raise
+        return response
+
+    def stream(
+        self,
+        endpoint: str,
+        records_path: Sequence[str] = ("data",),
+        *,
+        chunk_size: int = 65536,
+        convert: Optional[Callable[[dict], Any]] = None,
+    ) -> AsyncIterator[Any]:
+        """Asyncio counterpart of `APIClient.stream`, consumed with `async for`."""
+        return self._stream(
+            endpoint, template_name(endpoint), records_path, chunk_size, convert
+        )
+
+    async def _stream(
+        self,
+        endpoint: str,
+        template: str,
+        records_path: Sequence[str],
+        chunk_size: int,
+        convert: Optional[Callable[[dict], Any]],
+    ) -> AsyncIterator[Any]:
+        url = f"{self.base_url}{endpoint}"
+        self.stats.record_call(template, cached=False)
+        parser = RecordParser(self.decoder, records_path)
+        session = self.session
+        async with self._semaphore:
+            response = await self._send(
+                endpoint,
+                template,
+                lambda url: self._open(session, url, endpoint, template),
+            )
+            size = 0
+            started = time.perf_counter()
+            async with response:
+                async for chunk in response.content.iter_chunked(chunk_size):
+                    size += len(chunk)
+                    for record in parser.feed(chunk):
+                        yield convert(record) if convert is not None else record
+            self.stats.record_download(template, time.perf_counter() - started, size)
+        parser.close()
+
+    async def get_with_url_builder(self, *args, **kwargs) -> dict:
+        path = build_url(*args, **kwargs)
+        token = self._set_template(args)
+        try:
+            return await self.get(path)
+        finally:
+            self._reset_template(token)
+
+    def stream_with_url_builder(
+        self,
+        *args,
+        records_path: Sequence[str] = ("data",),
+        chunk_size: int = 65536,
+        convert: Optional[Callable[[dict], Any]] = None,
+        **kwargs,
+    ) -> AsyncIterator[Any]:
+        path = build_url(*args, **kwargs)
+        token = self._set_template(args)
+        try:
+            return self.stream(
+                path, records_path, chunk_size=chunk_size, convert=convert
+            )
+        finally:
+            self._reset_template(token)
+
+    async def post(self, endpoint: str, json: dict) -> dict:
+        url = f"{self.base_url}{endpoint}"
+        template = template_name(endpoint)
+        self.stats.record_call(template, cached=False)
+        try:
+            _, _, content = await self._request(
+                "POST", url, endpoint, template, json=json
+            )
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"POST request failed: {e}")
+            raise
+        return self._decoded(template, content)
+
+
+def _failover(error: BaseException) -> bool:
+    """Whether a failed GET is sent again to the next base URL: connection errors, timeouts and 5xx."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        return error.status >= 500
+    return isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError))
+
+
+def _retry_reason(error: Exception) -> tuple:
+    """Returns the retry reason and `Retry-After` header for a failed request."""
+    if isinstance(error, aiohttp.ClientResponseError):
+        headers = error.headers or {}
+        return error.status, headers.get("Retry-After")
+    if isinstance(error, (aiohttp.ClientConnectionError, asyncio.TimeoutError)):
+        return type(error).__name__, None
+    return None, None
+
+
+async def _connect_started(session, context, params) -> None:
+    context.connect_started = time.perf_counter()
+
+
+async def _connect_ended(session, context, params) -> None:
+    """Adds the time spent opening a connection (and TLS handshake) to the request's timings."""
+    timing = context.trace_request_ctx
+    if isinstance(timing, dict):
+        timing["connect"] += time.perf_counter() - context.connect_started
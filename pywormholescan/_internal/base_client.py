@@ -0,0 +1,188 @@
+import time
+from contextvars import Token
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+from .breaker import CircuitBreaker
+from .cache import ResponseCache
+from .conditional import ConditionalCache
+from .decoder import Decoder, get_decoder
+from .lazy import lazy_view
+from .network import Network
+from .rate_limiter import RateLimiter
+from .retry import RetryPolicy
+from .routing import HedgePolicy, Router
+from .stats import ClientStats, current_template
+from .url_builder import endpoint_template
+from .vaa_store import VAAStore, is_immutable
+
+
+class BaseAPIClient:
+    """Transport-independent state shared by APIClient and AsyncAPIClient."""
+
+    def __init__(
+        self,
+        network: Network,
+        *,
+        timeout: float,
+        cache: Optional[ResponseCache],
+        vaa_store: Optional[VAAStore],
+        retry: Optional[RetryPolicy],
+        rate_limiter: Optional[RateLimiter],
+        decoder: Optional[Decoder],
+        lazy: bool = False,
+        conditional: Optional[ConditionalCache] = None,
+        base_urls: Optional[Sequence[str]] = None,
+        hedge: Optional[HedgePolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        timeouts: Optional[Dict[str, Union[float, Tuple[float, float]]]] = None,
+    ) -> None:
+        if not isinstance(network, Network):
+            raise ValueError(
+                "Invalid network provided. Please use Network.MAINNET or Network.TESTNET."
+            )
+
+        self.network = network
+        self.base_url = network.value
+        self.timeout = timeout
+        self.cache = cache
+        self.vaa_store = vaa_store
+        self.retry = retry
+        self.rate_limiter = rate_limiter
+        self.decoder = decoder or get_decoder()
+        self.lazy = lazy
+        self.conditional = conditional
+        self.base_urls = list(base_urls) if base_urls else None
+        if self.base_urls:
+            self.base_url = self.base_urls[0]
+        self.router = Router(hedge=hedge) if base_urls or hedge else None
+        self.breaker = breaker
+        self.timeouts = dict(timeouts or {})
+        self._timeout_prefixes = sorted(self.timeouts, key=len, reverse=True)
+        self.stats = ClientStats()
+
+    def _cached(self, url: str, endpoint: str) -> Optional[bytes]:
+        """
+        Returns a body from the response cache or VAA store, if either holds one for `url`.
+
+        A stale cached body is returned as is, and a background refresh is started for it unless
+        one is already in flight.
+        """
+        if self.cache is not None:
+            content, stale = self.cache.lookup(url)
+            if content is not None:
+                if stale and self.cache.claim_refresh(url):
+                    self._refresh_in_background(url, endpoint)
+                return content
+        if self.vaa_store is not None and is_immutable(endpoint):
+            return self.vaa_store.get(url)
+        return None
+
+    def _remember(self, url: str, endpoint: str, content: bytes) -> None:
+        """Stores a freshly fetched body in whichever caches apply to `endpoint`."""
+        if self.vaa_store is not None and is_immutable(endpoint):
+            self.vaa_store.set(url, content)
+        if self.cache is not None:
+            self.cache.set(
+                url,
+                content,
+                self.cache.ttl_for(endpoint),
+                self.cache.stale_ttl_for(endpoint),
+            )
+
+    def _refresh_in_background(self, url: str, endpoint: str) -> None:
+        """Refetches a stale cached body without blocking the caller, then releases its refresh claim."""
+        raise NotImplementedError
+
+    def _conditional_headers(self, url: str) -> Optional[dict]:
+        """Returns the `If-None-Match`/`If-Modified-Since` headers to revalidate `url` with, if any."""
+        if self.conditional is None:
+            return None
+        return self.conditional.headers(url) or None
+
+    def _revalidated(
+        self, url: str, status: int, headers, content: bytes, conditional: bool
+    ) -> Optional[bytes]:
+        """
+        Returns the body a GET resolved to: the stored one on `304 Not Modified`, else `content`,
+        whose validators are kept for next time. None means a 304 arrived for a body that has
+        since been evicted, and the request must be repeated unconditionally.
+        """
+        if self.conditional is None:
+            return content
+        if status == 304:
+            return self.conditional.not_modified(url)
+        self.conditional.update(url, headers, content, revalidated=conditional)
+        return content
+
+    def _start_attempt(self, attempt: int) -> None:
+        self.stats.record_attempt(first=attempt == 1)
+        if attempt == 1 and self.retry is not None:
+            self.retry.budget.deposit()
+
+    def _retry_delay(
+        self, attempt: int, reason, retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Decides whether a failed GET should be retried.
+
+        Args:
+            attempt (int): Number of attempts made so far, starting at 1.
+            reason: HTTP status of the failed response, or the name of the transport error.
+                None means the failure is not retryable.
+            retry_after (str): Value of the `Retry-After` response header, if any.
+
+        Returns:
+            Seconds to wait before the next attempt, or None to give up.
+        """
+        if self.retry is None or reason is None:
+            return None
+        if isinstance(reason, int) and reason not in self.retry.statuses:
+            return None
+        if attempt >= self.retry.max_attempts:
+            self.stats.record_retries_exhausted()
+            return None
+        delay = self.retry.backoff(attempt, retry_after)
+        if delay is None:
+            return None
+        if not self.retry.budget.withdraw():
+            self.stats.record_budget_exhausted()
+            return None
+        self.stats.record_retry(reason)
+        return delay
+
+    def _routed_base_urls(self) -> List[str]:
+        return self.base_urls or [self.base_url]
+
+    def _record_circuit(self, endpoint: str, started: float, reason=None) -> None:
+        """Reports an attempt to the circuit breaker; transport errors and 5xx answers count as failures."""
+        if self.breaker is None:
+            return
+        failed = isinstance(reason, str) or (isinstance(reason, int) and reason >= 500)
+        self.breaker.record(endpoint, failed, time.perf_counter() - started)
+
+    def _timeout_for(self, endpoint: str) -> Union[float, Tuple[float, float]]:
+        for prefix in self._timeout_prefixes:
+            if endpoint.startswith(prefix):
+                return self.timeouts[prefix]
+        return self.timeout
+
+    def _decoded(self, template: str, content: bytes):
+        """Decodes a body, recording the time it took under `template`."""
+        started = time.perf_counter()
+        value = self._decode(content)
+        self.stats.record_decode(template, time.perf_counter() - started)
+        return value
+
+    @staticmethod
+    def _set_template(args: Sequence) -> Token:
+        """Labels the metrics of the request built from `build_url(*args)` with its endpoint template."""
+        return current_template.set(endpoint_template(args[0], len(args) - 1).pattern)
+
+    @staticmethod
+    def _reset_template(token: Token) -> None:
+        current_template.reset(token)
+
+    def _decode(self, content: bytes):
+        if self.lazy:
+            return lazy_view(content, self.decoder)
+        return self.decoder(content)
@@ -0,0 +1,153 @@
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+import requests
+
+from .routing import endpoint_group
+
+__all__ = ["CircuitBreaker", "CircuitOpenError"]
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(requests.RequestException):
+    """Raised instead of sending a request to an endpoint group whose circuit is open."""
+
+    def __init__(self, group: str, retry_in: float) -> None:
+        super().__init__(
+            f"Circuit open for {group}, next probe in {max(retry_in, 0):.1f}s"
+        )
+        self.group = group
+        self.retry_in = retry_in
+
+
+class _Circuit:
+    __slots__ = ("state", "failures", "opened_at", "reset_timeout", "probe_at", "trips")
+
+    def __init__(self, reset_timeout: float) -> None:
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self.reset_timeout = reset_timeout
+        self.probe_at = None
+        self.trips = 0
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        *,
+        failure_threshold: int = 5,
+        latency_threshold: Optional[float] = None,
+        reset_timeout: float = 30,
+        max_reset_timeout: float = 300,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Circuit breaker for GET requests, keeping one circuit per endpoint group (e.g. "/v1/governor").
+
+        A circuit trips open after `failure_threshold` consecutive failures: connection errors,
+        timeouts, 5xx answers, or answers slower than `latency_threshold`. While it is open,
+        requests to the group raise CircuitOpenError at once instead of waiting on the API.
+        After `reset_timeout` seconds one probe request is let through (half-open): its success
+        closes the circuit, its failure opens it again for twice as long, up to `max_reset_timeout`.
+
+        Args:
+            failure_threshold (int): Consecutive failures that trip a circuit.
+            latency_threshold (float): Seconds after which a successful answer still counts as a failure.
+                Disabled by default.
+            reset_timeout (float): Seconds a circuit stays open before it is probed.
+            max_reset_timeout (float): Upper bound on the open time after repeated failed probes.
+            clock (Callable): Monotonic time source, overridable for tests.
+        """
+        self.failure_threshold = failure_threshold
+        self.latency_threshold = latency_threshold
+        self.reset_timeout = reset_timeout
+        self.max_reset_timeout = max_reset_timeout
+        self.rejected = 0
+        self._clock = clock
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = threading.Lock()
+
+    def before(self, endpoint: str) -> None:
+        """Raises CircuitOpenError unless a request to `endpoint` may be sent now."""
+        group = endpoint_group(endpoint)
+        with self._lock:
+            circuit = self._circuits.get(group)
+            if circuit is None or circuit.state == CLOSED:
+                return
+            now = self._clock()
+            probe_due = circuit.opened_at + circuit.reset_timeout
+            # A probe that never reported back does not keep the circuit half-open forever.
+            if now >= probe_due and (
+                circuit.probe_at is None
+                or now - circuit.probe_at >= circuit.reset_timeout
+            ):
+                circuit.state = HALF_OPEN
+                circuit.probe_at = now
+                return
+            if circuit.probe_at is not None:
+                probe_due = circuit.probe_at + circuit.reset_timeout
+            self.rejected += 1
+            raise CircuitOpenError(group, probe_due - now)
+
+    def record(self, endpoint: str, failed: bool, elapsed: float) -> None:
+        """Reports the outcome of a request let through by `before`."""
+        if self.latency_threshold is not None and elapsed > self.latency_threshold:
+            failed = True
+        group = endpoint_group(endpoint)
+        with self._lock:
+            circuit = self._circuits.get(group)
+            if circuit is None:
+                if not failed:
+                    return
+                circuit = self._circuits[group] = _Circuit(self.reset_timeout)
+            if not failed:
+                if circuit.state == OPEN:
+                    return  # A request sent before the circuit tripped proves little.
+                circuit.state = CLOSED
+                circuit.failures = 0
+                circuit.probe_at = None
+                circuit.reset_timeout = self.reset_timeout
+                return
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN:
+                circuit.reset_timeout = min(
+                    circuit.reset_timeout * 2, self.max_reset_timeout
+                )
+                self._open(circuit)
+            elif circuit.state == CLOSED and circuit.failures >= self.failure_threshold:
+                self._open(circuit)
+
+    def state(self, endpoint: str) -> str:
+        """Returns "closed", "open" or "half_open" for the group of `endpoint`."""
+        circuit = self._circuits.get(endpoint_group(endpoint))
+        return CLOSED if circuit is None else circuit.state
+
+    def reset(self) -> None:
+        with self._lock:
+            self._circuits.clear()
+
+    def stats(self) -> dict:
+        """Returns the requests rejected so far and the state of every circuit that has failed."""
+        with self._lock:
+            return {
+                "rejected": self.rejected,
+                "circuits": {
+                    group: {
+                        "state": circuit.state,
+                        "failures": circuit.failures,
+                        "trips": circuit.trips,
+                    }
+                    for group, circuit in self._circuits.items()
+                },
+            }
+
+    def _open(self, circuit: _Circuit) -> None:
+        circuit.state = OPEN
+        circuit.opened_at = self._clock()
+        circuit.probe_at = None
+        circuit.trips += 1
@@ -0,0 +1,185 @@
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from itertools import chain, islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+__all__ = ["BulkResult", "get_many", "aget_many"]
+
+VAAId = Union[str, Tuple[int, str, int]]
+
+
+class BulkResult:
+    """Outcome of one lookup in a bulk call: either `value` or `error` is set."""
+
+    __slots__ = ("id", "value", "error")
+
+    def __init__(
+        self, id: tuple, value: Any = None, error: Optional[Exception] = None
+    ) -> None:
+        self.id = id
+        self.value = value
+        self.error = error
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+    def __repr__(self) -> str:
+        outcome = f"error={self.error!r}" if self.error else "ok"
+        return f"BulkResult({'/'.join(map(str, self.id))}, {outcome})"
+
+
+def _parse(vaa_id: VAAId) -> tuple:
+    """Accepts "chain/emitter/seq" strings as well as (chain, emitter, seq) tuples."""
+    parts = vaa_id.split("/") if isinstance(vaa_id, str) else vaa_id
+    chain, emitter, seq = parts
+    return int(chain), str(emitter), int(seq)
+
+
+def _unique(
+    ids: Iterable[VAAId],
+) -> Tuple[List[Union[tuple, BulkResult]], Dict[tuple, tuple], List[BulkResult]]:
+    """
+    Returns the parsed IDs in input order, the first spelling of each distinct ID and
+    the failed results of malformed IDs, which also stand in for them in the order.
+    """
+    order, first, invalid = [], {}, []
+    for vaa_id in ids:
+        try:
+            parsed = _parse(vaa_id)
+        except (ValueError, TypeError) as e:
+            result = BulkResult(
+                vaa_id if isinstance(vaa_id, tuple) else (vaa_id,), error=e
+            )
+            order.append(result)
+            invalid.append(result)
+            continue
+        key = (parsed[0], parsed[1].lower(), parsed[2])
+        order.append(key)
+        first.setdefault(key, parsed)
+    return order, first, invalid
+
+
+def _in_order(order: list, first: dict, results: dict) -> List[BulkResult]:
+    return [
+        key if key.__class__ is BulkResult else results[first[key]] for key in order
+    ]
+
+
+def get_many(
+    fetch: Callable[..., Any],
+    ids: Iterable[VAAId],
+    *,
+    concurrency: int = 10,
+    stream: bool = False,
+) -> Union[List[BulkResult], Iterator[BulkResult]]:
+    """
+    Runs `fetch(chain, emitter, seq)` for many VAA IDs on a bounded thread pool.
+
+    Args:
+        fetch (Callable): Facade method taking a chain, emitter and sequence.
+        ids (Iterable): "chain/emitter/seq" strings or (chain, emitter, seq) tuples.
+            Repeated IDs are fetched once; emitters compare case-insensitively.
+        concurrency (int): Lookups in flight at once. Keep it at or below the client's
+            `pool_maxsize` so every request reuses a pooled connection.
+        stream (bool): Yield each distinct ID's result as soon as it completes,
+            instead of returning the full list in input order.
+
+    Returns:
+        One BulkResult per input ID, in input order; failures, including malformed
+        IDs, are captured per item. With `stream=True`, an iterator of one BulkResult
+        per distinct ID, starting with the malformed ones.
+    """
+    order, first, invalid = _unique(ids)
+    if stream:
+        return chain(invalid, _stream(fetch, first, concurrency))
+    results = {result.id: result for result in _stream(fetch, first, concurrency)}
+    return _in_order(order, first, results)
+
+
+def _outcome(vaa_id: tuple, future) -> BulkResult:
+    error = future.exception()
+    if error is not None:
+        return BulkResult(vaa_id, error=error)
+    return BulkResult(vaa_id, value=future.result())
+
+
+def _stream(fetch, first: dict, concurrency: int) -> Iterator[BulkResult]:
+    # Lookups are submitted as slots free up, rather than all at once, so tens of
+    # thousands of IDs never sit in the executor queue together.
+    pending = iter(first.values())
+    running = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        try:
+            while True:
+                for vaa_id in islice(pending, concurrency - len(running)):
+                    running[executor.submit(fetch, *vaa_id)] = vaa_id
+                if not running:
+                    return
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield _outcome(running.pop(future), future)
+        finally:
+            for future in running:
+                future.cancel()
+
+
+def aget_many(
+    fetch: Callable[..., Any],
+    ids: Iterable[VAAId],
+    *,
+    concurrency: int = 10,
+    stream: bool = False,
+) -> Union[Awaitable[List[BulkResult]], AsyncIterator[BulkResult]]:
+    """
+    Asyncio counterpart of `get_many`, for facades whose methods return coroutines.
+
+    Returns a coroutine resolving to the list of results, or with `stream=True`, an
+    async iterator to consume with `async for`.
+    """
+    order, first, invalid = _unique(ids)
+    if stream:
+        return _astream(fetch, first, concurrency, invalid)
+    return _agather(fetch, order, first, concurrency)
+
+
+async def _agather(
+    fetch, order: list, first: dict, concurrency: int
+) -> List[BulkResult]:
+    results = {}
+    async for result in _astream(fetch, first, concurrency):
+        results[result.id] = result
+    return _in_order(order, first, results)
+
+
+async def _astream(
+    fetch, first: dict, concurrency: int, invalid: Iterable[BulkResult] = ()
+) -> AsyncIterator[BulkResult]:
+    for result in invalid:
+        yield result
+    pending = iter(first.values())
+    running = {}
+    try:
+        while True:
+            for vaa_id in islice(pending, concurrency - len(running)):
+                running[asyncio.ensure_future(fetch(*vaa_id))] = vaa_id
+            if not running:
+                return
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                yield _outcome(running.pop(task), task)
+    finally:
+        for task in running:
+            task.cancel()
@@ -0,0 +1,158 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+__all__ = ["ResponseCache"]
+
+
+class ResponseCache:
+    def __init__(
+        self,
+        *,
+        ttl: float = 60,
+        ttls: Optional[Dict[str, float]] = None,
+        max_entries: int = 1024,
+        max_bytes: int = 32 * 1024 * 1024,
+        stale_ttl: float = 0,
+        stale_ttls: Optional[Dict[str, float]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        In-memory TTL + LRU cache of raw response bodies, keyed on the full request URL.
+
+        Args:
+            ttl (float): Default time to live in seconds. 0 disables caching for unmatched endpoints.
+            ttls (Dict[str, float]): Per-endpoint TTLs, keyed by path prefix (e.g. "/api/v1/scorecards").
+                The longest matching prefix wins; a TTL of 0 disables caching for that endpoint.
+            max_entries (int): Maximum number of cached responses.
+            max_bytes (int): Maximum total size of cached bodies, in bytes.
+            stale_ttl (float): Default number of seconds past its TTL that a body may still be served
+                while a single background request refreshes it (stale-while-revalidate). The TTL is
+                the soft limit; past TTL + stale_ttl callers block on a fresh request. 0 disables it.
+            stale_ttls (Dict[str, float]): Per-endpoint stale windows, keyed by path prefix like `ttls`.
+            clock (Callable): Monotonic time source, overridable for tests.
+        """
+        self.ttl = ttl
+        self.ttls = dict(ttls or {})
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.stale_ttl = stale_ttl
+        self.stale_ttls = dict(stale_ttls or {})
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._clock = clock
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self._refreshing = set()
+        self._prefixes = sorted(self.ttls, key=len, reverse=True)
+        self._stale_prefixes = sorted(self.stale_ttls, key=len, reverse=True)
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Returns the TTL that applies to an endpoint path."""
+        return _match(endpoint, self._prefixes, self.ttls, self.ttl)
+
+    def stale_ttl_for(self, endpoint: str) -> float:
+        """Returns the stale-while-revalidate window that applies to an endpoint path."""
+        return _match(endpoint, self._stale_prefixes, self.stale_ttls, self.stale_ttl)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Returns the cached body for `key`, or None if it is missing or past its TTL."""
+        return self._lookup(key, serve_stale=False)[0]
+
+    def lookup(self, key: str) -> Tuple[Optional[bytes], bool]:
+        """
+        Returns the cached body for `key` and whether it is stale, i.e. past its TTL but within
+        its stale window. The body is None if it is missing or past both.
+        """
+        return self._lookup(key, serve_stale=True)
+
+    def _lookup(self, key: str, serve_stale: bool) -> Tuple[Optional[bytes], bool]:
+        with self._lock:
+            entry = self._entries.get(key)
+            now = self._clock()
+            if (
+                entry is None
+                or entry[1] <= now
+                or (not serve_stale and entry[0] <= now)
+            ):
+                if entry is not None and entry[1] <= now:
+                    self._remove(key)
+                self.misses += 1
+                return None, False
+            self._entries.move_to_end(key)
+            stale = entry[0] <= now
+            if stale:
+                self.stale_hits += 1
+            self.hits += 1
+            return entry[2], stale
+
+    def claim_refresh(self, key: str) -> bool:
+        """
+        Marks `key` as being refreshed in the background. Returns False if a refresh is already
+        in flight, so that a stale entry is only ever refreshed by one request at a time.
+        """
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def release_refresh(self, key: str) -> None:
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def set(self, key: str, content: bytes, ttl: float, stale_ttl: float = 0) -> None:
+        """
+        Stores a body for `ttl` seconds, plus `stale_ttl` seconds during which it is served stale,
+        evicting least recently used entries to stay within bounds.
+        """
+        if ttl <= 0 or len(content) > self.max_bytes:
+            return
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            now = self._clock()
+            self._entries[key] = (now + ttl, now + ttl + max(stale_ttl, 0), content)
+            self._size += len(content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self._refreshing.clear()
+
+    def stats(self) -> dict:
+        """Returns a snapshot of the cache counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "stale_hits": self.stale_hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, _, content = self._entries.pop(key)
+        self._size -= len(content)
+
+
+def _match(endpoint: str, prefixes, values: Dict[str, float], default: float) -> float:
+    """Returns the value of the longest prefix of `endpoint` in `values`, or `default`."""
+    for prefix in prefixes:
+        if endpoint.startswith(prefix):
+            return values[prefix]
+    return default
@@ -0,0 +1,122 @@
+import threading
+from collections import OrderedDict
+from typing import Dict, Mapping, Optional
+
+__all__ = ["ConditionalCache"]
+
+
+class ConditionalCache:
+    def __init__(
+        self, *, max_entries: int = 1024, max_bytes: int = 32 * 1024 * 1024
+    ) -> None:
+        """
+        LRU store of response bodies and their `ETag`/`Last-Modified` validators, keyed on
+        the full request URL, for conditional revalidation.
+
+        Once a URL has returned validators, the next GET for it carries `If-None-Match` and
+        `If-Modified-Since`, and a `304 Not Modified` answer is served from the stored body.
+        Unlike ResponseCache, every call still reaches the server, so results are never
+        stale; what is saved is the transfer of unchanged bodies.
+
+        Args:
+            max_entries (int): Maximum number of stored responses.
+            max_bytes (int): Maximum total size of stored bodies, in bytes.
+        """
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def headers(self, key: str) -> Dict[str, str]:
+        """Returns the conditional request headers for `key`, empty if it has no validators."""
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return {}
+        etag, last_modified, _ = entry
+        headers = {}
+        if etag is not None:
+            headers["If-None-Match"] = etag
+        if last_modified is not None:
+            headers["If-Modified-Since"] = last_modified
+        return headers
+
+    def not_modified(self, key: str) -> Optional[bytes]:
+        """Returns the stored body after a 304 answer, or None if it was evicted meanwhile."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            self.bytes_saved += len(entry[2])
+            return entry[2]
+
+    def update(
+        self,
+        key: str,
+        headers: Mapping[str, str],
+        content: bytes,
+        revalidated: bool = False,
+    ) -> None:
+        """
+        Stores the validators and body of a full response.
+
+        Args:
+            key (str): Request URL.
+            headers (Mapping): Response headers, looked up case-insensitively.
+            content (bytes): Response body.
+            revalidated (bool): Whether the request was conditional, i.e. the body had changed.
+        """
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        with self._lock:
+            if revalidated:
+                self.misses += 1
+            if key in self._entries:
+                self._remove(key)
+            if etag is None and last_modified is None:
+                return
+            if len(content) > self.max_bytes:
+                return
+            self._entries[key] = (etag, last_modified, content)
+            self._size += len(content)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        """
+        Returns a snapshot of the revalidation counters.
+
+        `hits` counts 304 answers and `misses` conditional requests whose body had changed;
+        `bytes_saved` is the size of the bodies that 304 answers did not transfer.
+        """
+        with self._lock:
+            revalidations = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / revalidations if revalidations else 0.0,
+                "bytes_saved": self.bytes_saved,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: str) -> None:
+        _, _, content = self._entries.pop(key)
+        self._size -= len(content)
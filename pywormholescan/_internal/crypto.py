@@ -0,0 +1,236 @@
+"""
+Keccak-256 and secp256k1 public key recovery, as used by Wormhole guardian signatures.
+
+Uses pycryptodome and coincurve when they are installed and falls back to pure
+Python implementations otherwise, so verification never needs a native build.
+"""
+
+from typing import Optional
+
+__all__ = ["keccak256", "recover_public_key", "public_key_to_address"]
+
+_MASK = (1 << 64) - 1
+_ROUND_CONSTANTS = (
+    0x0000000000000001,
+    0x0000000000008082,
+    0x800000000000808A,
+    0x8000000080008000,
+    0x000000000000808B,
+    0x0000000080000001,
+    0x8000000080008081,
+    0x8000000000008009,
+    0x000000000000008A,
+    0x0000000000000088,
+    0x0000000080008009,
+    0x000000008000000A,
+    0x000000008000808B,
+    0x800000000000008B,
+    0x8000000000008089,
+    0x8000000000008003,
+    0x8000000000008002,
+    0x8000000000000080,
+    0x000000000000800A,
+    0x800000008000000A,
+    0x8000000080008081,
+    0x8000000000008080,
+    0x0000000080000001,
+    0x8000000080008008,
+)
+# Rotation offsets indexed by lane position x + 5 * y.
+_ROTATIONS = (
+    0, 1, 62, 28, 27,
+    36, 44, 6, 55, 20,
+    3, 10, 43, 25, 39,
+    41, 45, 15, 21, 8,
+    18, 2, 61, 56, 14,
+)  # fmt: skip
+# Destination lane of each source lane after the pi step.
+_PI = tuple(y + 5 * ((2 * x + 3 * y) % 5) for y in range(5) for x in range(5))
+_RATE = 136
+
+
+def _keccak_f(lanes: list) -> None:
+    for rc in _ROUND_CONSTANTS:
+        c = [
+            lanes[x] ^ lanes[x + 5] ^ lanes[x + 10] ^ lanes[x + 15] ^ lanes[x + 20]
+            for x in range(5)
+        ]
+        d = [
+            c[(x - 1) % 5] ^ (((c[(x + 1) % 5] << 1) | (c[(x + 1) % 5] >> 63)) & _MASK)
+            for x in range(5)
+        ]
+        b = [0] * 25
+        for i in range(25):
+            lane = lanes[i] ^ d[i % 5]
+            n = _ROTATIONS[i]
+            b[_PI[i]] = ((lane << n) | (lane >> (64 - n))) & _MASK if n else lane
+        for y in range(0, 25, 5):
+            row = b[y : y + 5]
+            for x in range(5):
+                lanes[y + x] = row[x] ^ (~row[(x + 1) % 5] & row[(x + 2) % 5])
+        lanes[0] ^= rc
+
+
+def _keccak256_python(data: bytes) -> bytes:
+    padded = bytearray(data)
+    padded.append(0x01)
+    padded.extend(b"\x00" * (-len(padded) % _RATE))
+    padded[-1] |= 0x80
+    lanes = [0] * 25
+    for block in range(0, len(padded), _RATE):
+        for i in range(_RATE // 8):
+            start = block + i * 8
+            lanes[i] ^= int.from_bytes(padded[start : start + 8], "little")
+        _keccak_f(lanes)
+    return b"".join(lane.to_bytes(8, "little") for lane in lanes[:4])
+
+
+try:
+    from Crypto.Hash import keccak as _pycryptodome_keccak
+
+    def keccak256(data: bytes) -> bytes:
+        """Returns the Keccak-256 digest (the pre-standard SHA-3 variant used by Ethereum)."""
+        return _pycryptodome_keccak.new(data=bytes(data), digest_bits=256).digest()
+
+except ImportError:
+
+    def keccak256(data: bytes) -> bytes:
+        """Returns the Keccak-256 digest (the pre-standard SHA-3 variant used by Ethereum)."""
+        return _keccak256_python(bytes(data))
+
+
+# secp256k1 domain parameters.
+_P = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEFFFFFC2F
+_N = 0xFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFFEBAAEDCE6AF48A03BBFD25E8CD0364141
+_G = (
+    0x79BE667EF9DCBBAC55A06295CE870B07029BFCDB2DCE28D959F2815B16F81798,
+    0x483ADA7726A3C4655DA4FBFC0E1108A8FD17B448A68554199C47D08FFB10D4B8,
+    1,
+)
+_INFINITY = (0, 0, 0)
+
+
+def _jacobian_double(point: tuple) -> tuple:
+    x, y, z = point
+    if not y:
+        return _INFINITY
+    ysq = y * y % _P
+    s = 4 * x * ysq % _P
+    m = 3 * x * x % _P
+    nx = (m * m - 2 * s) % _P
+    ny = (m * (s - nx) - 8 * ysq * ysq) % _P
+    return nx, ny, 2 * y * z % _P
+
+
+def _jacobian_add(p: tuple, q: tuple) -> tuple:
+    if not p[2]:
+        return q
+    if not q[2]:
+        return p
+    z1z1 = p[2] * p[2] % _P
+    z2z2 = q[2] * q[2] % _P
+    u1 = p[0] * z2z2 % _P
+    u2 = q[0] * z1z1 % _P
+    s1 = p[1] * q[2] * z2z2 % _P
+    s2 = q[1] * p[2] * z1z1 % _P
+    if u1 == u2:
+        return _jacobian_double(p) if s1 == s2 else _INFINITY
+    h = u2 - u1
+    r = s2 - s1
+    h2 = h * h % _P
+    h3 = h * h2 % _P
+    u1h2 = u1 * h2 % _P
+    nx = (r * r - h3 - 2 * u1h2) % _P
+    ny = (r * (u1h2 - nx) - s1 * h3) % _P
+    return nx, ny, h * p[2] * q[2] % _P
+
+
+def _jacobian_multiply(point: tuple, scalar: int) -> tuple:
+    result = _INFINITY
+    for bit in bin(scalar % _N)[2:]:
+        result = _jacobian_double(result)
+        if bit == "1":
+            result = _jacobian_add(result, point)
+    return result
+
+
+def _to_affine(point: tuple) -> Optional[tuple]:
+    if not point[2]:
+        return None
+    z_inv = pow(point[2], -1, _P)
+    z_inv2 = z_inv * z_inv % _P
+    return point[0] * z_inv2 % _P, point[1] * z_inv2 * z_inv % _P
+
+
+def _recover_python(digest: bytes, signature: bytes) -> Optional[bytes]:
+    r = int.from_bytes(signature[:32], "big")
+    s = int.from_bytes(signature[32:64], "big")
+    v = signature[64]
+    if v >= 27:
+        v -= 27
+    if not (0 < r < _N and 0 < s < _N and v in (0, 1)):
+        return None
+
+    y_squared = (pow(r, 3, _P) + 7) % _P
+    y = pow(y_squared, (_P + 1) // 4, _P)
+    if y * y % _P != y_squared:
+        return None
+    if y % 2 != v:
+        y = _P - y
+
+    e = int.from_bytes(digest, "big")
+    r_inv = pow(r, -1, _N)
+    point = _jacobian_add(
+        _jacobian_multiply(_G, -e * r_inv % _N),
+        _jacobian_multiply((r, y, 1), s * r_inv % _N),
+    )
+    affine = _to_affine(point)
+    if affine is None:
+        return None
+    return affine[0].to_bytes(32, "big") + affine[1].to_bytes(32, "big")
+
+
+try:
+    import coincurve as _coincurve
+
+    def recover_public_key(digest: bytes, signature: bytes) -> Optional[bytes]:
+        """
+        Recovers the uncompressed public key (64 bytes, without prefix) that produced a signature.
+
+        Args:
+            digest (bytes): 32-byte message digest that was signed.
+            signature (bytes): 65-byte `r || s || v` signature, with v in {0, 1} or {27, 28}.
+
+        Returns:
+            The public key, or None if the signature is malformed.
+        """
+        signature = bytearray(signature)
+        if signature[64] >= 27:
+            signature[64] -= 27
+        try:
+            key = _coincurve.PublicKey.from_signature_and_message(
+                bytes(signature), bytes(digest), hasher=None
+            )
+        except Exception:
+            return None
+        return key.format(compressed=False)[1:]
+
+except ImportError:
+
+    def recover_public_key(digest: bytes, signature: bytes) -> Optional[bytes]:
+        """
+        Recovers the uncompressed public key (64 bytes, without prefix) that produced a signature.
+
+        Args:
+            digest (bytes): 32-byte message digest that was signed.
+            signature (bytes): 65-byte `r || s || v` signature, with v in {0, 1} or {27, 28}.
+
+        Returns:
+            The public key, or None if the signature is malformed.
+        """
+        return _recover_python(bytes(digest), bytes(signature))
+
+
+def public_key_to_address(public_key: bytes) -> bytes:
+    """Returns the 20-byte Ethereum-style address of an uncompressed public key."""
+    return keccak256(public_key)[-20:]
@@ -0,0 +1,95 @@
+import json
+from typing import Any, Callable, Optional
+
+__all__ = ["Decoder", "get_decoder"]
+
+Decoder = Callable[[bytes], Any]
+
+
+# A number token of 19 or more digits may be an integer beyond 64 bits, which the fast backends
+# turn into a float. Such a token follows ":", ",", "[", "-" or whitespace, whereas the long digit
+# runs inside strings, such as the zero padding of emitter addresses, follow a quote, a "/" or a
+# letter. Mapping every digit to "0" and every character a token may follow to ":" reduces the
+# search to one substring test, which is several times cheaper than a regular expression.
+def _separator_table() -> bytes:
+    table = bytearray(range(256))
+    for byte in b"0123456789":
+        table[byte] = ord("0")
+    for byte in b":,[-\t\n\r ":
+        table[byte] = ord(":")
+    return bytes(table)
+
+
+_SEPARATORS = _separator_table()
+_WIDE_RUN = b"0" * 19
+
+
+def _may_hold_wide_number(content: bytes) -> bool:
+    mapped = content.translate(_SEPARATORS)
+    return b":" + _WIDE_RUN in mapped or mapped.startswith(_WIDE_RUN)
+
+
+def _exact(fast: Decoder) -> Decoder:
+    """Wraps a fast decoder so that bodies which may hold wide integers go to the standard library."""
+
+    def decode(content: bytes) -> Any:
+        if _may_hold_wide_number(content):
+            return json.loads(content)
+        return fast(content)
+
+    return decode
+
+
+def _orjson_decoder() -> Optional[Decoder]:
+    try:
+        import orjson
+    except ImportError:
+        return None
+
+    return _exact(orjson.loads)
+
+
+def _msgspec_decoder() -> Optional[Decoder]:
+    try:
+        import msgspec
+    except ImportError:
+        return None
+
+    return _exact(msgspec.json.Decoder().decode)
+
+
+_BACKENDS = {
+    "orjson": _orjson_decoder,
+    "msgspec": _msgspec_decoder,
+    "json": lambda: json.loads,
+}
+
+
+def get_decoder(name: Optional[str] = None) -> Decoder:
+    """
+    Returns a function decoding JSON response bodies.
+
+    Args:
+        name (str): Backend to use: "orjson", "msgspec" or "json". When omitted, the fastest
+            installed backend is picked, falling back to the standard library.
+            The fast backends turn integers wider than 64 bits into floats, so bodies with a
+            number of 19 or more digits are decoded by the standard library instead, keeping
+            every integer exact as `response.json()` did.
+
+    Raises:
+        ValueError: If the backend is unknown.
+        ImportError: If the requested backend is not installed.
+    """
+    if name is None:
+        for backend in _BACKENDS.values():
+            decoder = backend()
+            if decoder is not None:
+                return decoder
+    if name not in _BACKENDS:
+        raise ValueError(
+            f"Unknown JSON decoder {name!r}. Use one of: {', '.join(_BACKENDS)}."
+        )
+    decoder = _BACKENDS[name]()
+    if decoder is None:
+        raise ImportError(f"The {name!r} JSON decoder is not installed.")
+    return decoder
@@ -0,0 +1,286 @@
+import re
+from collections.abc import Mapping, Sequence
+from typing import Any, Iterator, List, Optional, Tuple
+
+from .decoder import Decoder
+
+__all__ = ["LazyArray", "LazyObject", "lazy_view"]
+
+_WS = re.compile(rb"[ \t\r\n]*")
+_SCALAR = re.compile(rb"[^,:\]}\s]+")
+_TOKEN = re.compile(rb'[\[\]{}"]')
+_OPEN = frozenset(b"[{")
+_CLOSE = {0x7B: b"}", 0x5B: b"]"}
+# translate() table dropping every byte except quotes and brackets.
+_NOT_STRUCTURAL = bytes(b for b in range(256) if b not in b'"[]{}')
+
+# Objects smaller than this are decoded in one go on first access: one call into the
+# decoder costs less than walking their members in Python.
+EAGER_BYTES = 4096
+
+
+def _skip_ws(buf: bytes, pos: int) -> int:
+    return _WS.match(buf, pos).end()
+
+
+def _string_end(buf: bytes, pos: int) -> int:
+    """Returns the offset just past the string starting at `pos`."""
+    end = buf.find(b'"', pos + 1)
+    while end > 0 and buf[end - 1] == 0x5C:  # backslash
+        start = end - 1
+        while buf[start - 1] == 0x5C:
+            start -= 1
+        if (end - start) % 2 == 0:
+            break
+        end = buf.find(b'"', end + 1)
+    if end < 0:
+        raise ValueError("Truncated JSON document.")
+    return end + 1
+
+
+def _container_end(buf: bytes, pos: int) -> int:
+    """
+    Returns the offset just past the array or object starting at `pos`.
+
+    Python-level scanning costs far more per byte than bytes.find and translate, which
+    run in C. So the buffer is consumed one closing bracket at a time, and only the
+    quotes and brackets of each piece are inspected to track the nesting depth. Pieces
+    with escaped characters fall back to walking tokens one at a time.
+    """
+    close = _CLOSE[buf[pos]]
+    depth = 0
+    in_string = False
+    start = end = pos
+    while True:
+        end = buf.find(close, end + 1)
+        if end < 0:
+            raise ValueError("Truncated JSON document.")
+        piece = buf[start : end + 1]
+        if b"\\" in piece:
+            return _walk_container(buf, pos)
+        # With no escapes every quote toggles a string, so the parts between quotes
+        # alternate between structure and string contents.
+        parts = piece.translate(None, _NOT_STRUCTURAL).split(b'"')
+        structure = b"".join(parts[1::2] if in_string else parts[::2])
+        if len(parts) % 2 == 0:
+            in_string = not in_string
+        depth += structure.count(b"{") + structure.count(b"[")
+        depth -= structure.count(b"}") + structure.count(b"]")
+        if depth == 0 and not in_string:
+            return end + 1
+        start = end + 1
+
+
+def _walk_container(buf: bytes, pos: int) -> int:
+    depth = 0
+    search = _TOKEN.search
+    while True:
+        token = search(buf, pos)
+        if token is None:
+            raise ValueError("Truncated JSON document.")
+        pos = token.start()
+        char = buf[pos]
+        if char == 0x22:  # '"'
+            pos = _string_end(buf, pos)
+            continue
+        pos += 1
+        depth += 1 if char in _OPEN else -1
+        if depth == 0:
+            return pos
+
+
+def _value_end(buf: bytes, pos: int) -> int:
+    """Returns the offset just past the JSON value starting at `pos`."""
+    first = buf[pos]
+    if first == 0x22:
+        return _string_end(buf, pos)
+    if first in _OPEN:
+        return _container_end(buf, pos)
+    return _SCALAR.match(buf, pos).end()
+
+
+def lazy_view(content: bytes, decoder: Decoder, start: int = 0, end: int = -1):
+    """
+    Returns a lazy view over the JSON value starting at `content[start]`.
+
+    Arrays become a LazyArray and objects a LazyObject; scalars are decoded right away.
+    `end` is the offset just past the value, None when not yet known, and defaults to
+    the end of `content`.
+    """
+    if end == -1:
+        end = len(content)
+    start = _skip_ws(content, start)
+    first = content[start]
+    if first == 0x5B:  # '['
+        return LazyArray(content, decoder, start, end)
+    if first == 0x7B:  # '{'
+        return LazyObject(content, decoder, start, end)
+    if end is None:
+        end = _value_end(content, start)
+    return decoder(content[start:end])
+
+
+class _LazyValue:
+    __slots__ = ("_content", "_decoder", "_start", "_stop")
+
+    def __init__(
+        self, content: bytes, decoder: Decoder, start: int, end: Optional[int] = None
+    ) -> None:
+        self._content = content
+        self._decoder = decoder
+        self._start = start
+        self._stop = end
+
+    @property
+    def _end(self) -> int:
+        # Members of a large object are handed out before their end is known.
+        if self._stop is None:
+            self._stop = _value_end(self._content, self._start)
+        return self._stop
+
+    @property
+    def raw(self) -> bytes:
+        """The undecoded JSON of this value."""
+        return self._content[self._start : self._end]
+
+    def decode(self) -> Any:
+        """Decodes the whole value into plain Python objects."""
+        return self._decoder(self.raw)
+
+
+class LazyArray(_LazyValue, Sequence):
+    """
+    Read-only list view over an undecoded JSON array.
+
+    Elements are located on demand, so iterating stops scanning as soon as the caller
+    stops, and nested arrays and objects are returned as lazy views themselves.
+    """
+
+    __slots__ = ("_spans", "_pos", "_done")
+
+    def __init__(
+        self, content: bytes, decoder: Decoder, start: int, end: Optional[int] = None
+    ) -> None:
+        super().__init__(content, decoder, start, end)
+        self._spans: List[Tuple[int, int]] = []
+        self._pos = start + 1
+        self._done = False
+
+    def _scan_next(self) -> bool:
+        if self._done:
+            return False
+        buf = self._content
+        pos = _skip_ws(buf, self._pos)
+        if buf[pos] == 0x5D:  # ']'
+            self._done = True
+            self._stop = pos + 1
+            return False
+        end = _value_end(buf, pos)
+        self._spans.append((pos, end))
+        pos = _skip_ws(buf, end)
+        if buf[pos] == 0x2C:  # ','
+            pos += 1
+        self._pos = pos
+        return True
+
+    def _element(self, index: int) -> Any:
+        start, end = self._spans[index]
+        return lazy_view(self._content, self._decoder, start, end)
+
+    def __iter__(self) -> Iterator[Any]:
+        index = 0
+        while index < len(self._spans) or self._scan_next():
+            yield self._element(index)
+            index += 1
+
+    def __len__(self) -> int:
+        while self._scan_next():
+            pass
+        return len(self._spans)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        while index >= len(self._spans) and self._scan_next():
+            pass
+        if not 0 <= index < len(self._spans):
+            raise IndexError("LazyArray index out of range")
+        return self._element(index)
+
+    def __repr__(self) -> str:
+        return f"<LazyArray {self._end - self._start} bytes>"
+
+
+class LazyObject(_LazyValue, Mapping):
+    """
+    Read-only mapping view over an undecoded JSON object.
+
+    Small objects are decoded as a whole on first access. Larger ones, such as a page
+    envelope, are walked member by member, only as far as the requested key, and only
+    the accessed values are decoded.
+    """
+
+    __slots__ = ("_members", "_pos", "_decoded")
+
+    def __init__(
+        self, content: bytes, decoder: Decoder, start: int, end: Optional[int] = None
+    ) -> None:
+        super().__init__(content, decoder, start, end)
+        self._members = {}
+        self._pos = None
+        self._decoded = None
+
+    def _scan_next(self) -> bool:
+        buf = self._content
+        if self._pos is None:
+            pos = _skip_ws(buf, self._start + 1)
+        elif self._pos < 0:
+            return False
+        else:
+            # Skip the value of the previous member, found on the last call.
+            pos = _skip_ws(buf, _value_end(buf, self._pos))
+            if buf[pos] == 0x2C:  # ','
+                pos = _skip_ws(buf, pos + 1)
+        if buf[pos] == 0x7D:  # '}'
+            self._stop = pos + 1
+            self._pos = -1
+            return False
+        key_end = _string_end(buf, pos)
+        key = self._decoder(buf[pos:key_end])
+        pos = _skip_ws(buf, _skip_ws(buf, key_end) + 1)  # past ':'
+        self._members[key] = pos
+        self._pos = pos
+        return True
+
+    def _small(self) -> Optional[dict]:
+        if self._decoded is None and self._end - self._start <= EAGER_BYTES:
+            self._decoded = self.decode()
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        decoded = self._small()
+        if decoded is not None:
+            return decoded[key]
+        while key not in self._members:
+            if not self._scan_next():
+                raise KeyError(key)
+        return lazy_view(self._content, self._decoder, self._members[key], None)
+
+    def _keys(self) -> dict:
+        decoded = self._small()
+        if decoded is not None:
+            return decoded
+        while self._scan_next():
+            pass
+        return self._members
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._keys())
+
+    def __len__(self) -> int:
+        return len(self._keys())
+
+    def __repr__(self) -> str:
+        return f"<LazyObject {self._end - self._start} bytes>"
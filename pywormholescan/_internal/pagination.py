@@ -0,0 +1,134 @@
+import asyncio
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from collections.abc import Mapping
+from typing import AsyncIterator, Callable, Iterator, Optional, Sequence
+
+from .lazy import LazyArray
+
+__all__ = ["paginate", "apaginate", "extract_records"]
+
+
+def extract_records(response, path: Sequence[str] = ("data",)) -> list:
+    """
+    Extracts the list of records from a page response.
+
+    Args:
+        response: Decoded page, either a bare list or a dict wrapping it. Lazy views are accepted too.
+        path (Sequence[str]): Keys leading to the records list inside a dict response.
+
+    Returns:
+        The records of the page, or an empty list if there are none.
+    """
+    if isinstance(response, (list, LazyArray)):
+        return response
+    for key in path:
+        if not isinstance(response, Mapping):
+            return []
+        response = response.get(key)
+    return response or []
+
+
+def paginate(
+    fetch: Callable[..., dict],
+    *,
+    records_path: Sequence[str] = ("data",),
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    prefetch: int = 1,
+    **kwargs: dict,
+) -> Iterator[dict]:
+    """
+    Walks a paginated endpoint lazily, one page in memory at a time.
+
+    Args:
+        fetch (Callable): Facade method returning one page. Receives `page`, `page_size` and `kwargs`.
+        records_path (Sequence[str]): Keys leading to the records list in each page.
+        page_size (int): Number of records requested per page.
+        max_items (int): Stop after yielding this many records.
+        prefetch (int): Number of pages kept in flight on a thread pool. With more than one
+            page in flight, a page shorter than `page_size` also marks the end.
+        **kwargs: Query parameters forwarded to `fetch`. `page` sets the first page (default 0).
+
+    Yields:
+        Individual records in page order, until an empty page or `max_items` is reached.
+    """
+    page = kwargs.pop("page", 0)
+    if prefetch > 1:
+        yield from _prefetch(
+            fetch, records_path, page, page_size, max_items, prefetch, kwargs
+        )
+        return
+
+    remaining = max_items
+    while remaining is None or remaining > 0:
+        records = extract_records(
+            fetch(page=page, page_size=page_size, **kwargs), records_path
+        )
+        if not records:
+            return
+        if remaining is not None:
+            records = records[:remaining]
+            remaining -= len(records)
+        yield from records
+        page += 1
+
+
+def _prefetch(fetch, records_path, page, page_size, max_items, depth, kwargs):
+    executor = ThreadPoolExecutor(max_workers=depth)
+    in_flight = deque()
+    remaining = max_items
+    try:
+        while True:
+            while len(in_flight) < depth:
+                in_flight.append(
+                    executor.submit(fetch, page=page, page_size=page_size, **kwargs)
+                )
+                page += 1
+            records = extract_records(in_flight.popleft().result(), records_path)
+            if remaining is not None:
+                records = records[:remaining]
+                remaining -= len(records)
+            yield from records
+            if len(records) < page_size or remaining == 0:
+                return
+    finally:
+        # Pages already on the wire finish in the background; queued ones never start.
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def apaginate(
+    fetch: Callable[..., dict],
+    *,
+    records_path: Sequence[str] = ("data",),
+    page_size: int = 100,
+    max_items: Optional[int] = None,
+    prefetch: int = 1,
+    **kwargs: dict,
+) -> AsyncIterator[dict]:
+    """Asyncio counterpart of `paginate`, for facades whose methods return coroutines."""
+    page = kwargs.pop("page", 0)
+    in_flight = deque()
+    remaining = max_items
+    try:
+        while True:
+            while len(in_flight) < prefetch:
+                in_flight.append(
+                    asyncio.ensure_future(
+                        fetch(page=page, page_size=page_size, **kwargs)
+                    )
+                )
+                page += 1
+            records = extract_records(await in_flight.popleft(), records_path)
+            if remaining is not None:
+                records = records[:remaining]
+                remaining -= len(records)
+            for record in records:
+                yield record
+            if not records or remaining == 0:
+                return
+            if prefetch > 1 and len(records) < page_size:
+                return
+    finally:
+        for task in in_flight:
+            task.cancel()
@@ -0,0 +1,112 @@
+import asyncio
+import threading
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+from .network import Network
+
+__all__ = ["TokenBucket", "RateLimiter"]
+
+
+class TokenBucket:
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Thread-safe token bucket that paces callers instead of rejecting them.
+
+        Args:
+            rate (float): Tokens added per second.
+            burst (float): Bucket capacity. Defaults to `rate`, i.e. one second worth of requests.
+            clock (Callable): Monotonic time source, overridable for tests.
+        """
+        self.rate = rate
+        self.burst = burst if burst is not None else max(rate, 1)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """
+        Takes a token, borrowing against future refills if none is left.
+
+        Returns:
+            Seconds the caller must wait before using the token.
+        """
+        with self._lock:
+            now = self._clock()
+            self._tokens = min(
+                self.burst, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return 0.0 if self._tokens >= 0 else -self._tokens / self.rate
+
+
+class RateLimiter:
+    def __init__(
+        self,
+        rate: float,
+        burst: Optional[float] = None,
+        *,
+        networks: Optional[Dict[Network, Tuple[float, Optional[float]]]] = None,
+        groups: Optional[Dict[str, Tuple[float, Optional[float]]]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Client-side rate limiter, shared by every APIClient and AsyncAPIClient it is given to.
+
+        Each network gets its own bucket, and endpoint groups get an additional bucket of their
+        own, so a request to a grouped endpoint is paced by both its group and its network.
+
+        Args:
+            rate (float): Requests per second allowed per network.
+            burst (float): Requests allowed in a burst per network. Defaults to `rate`.
+            networks (Dict[Network, Tuple[float, float]]): Per-network (rate, burst) overrides.
+            groups (Dict[str, Tuple[float, float]]): (rate, burst) per endpoint group, keyed by path
+                prefix such as "/api/v1/vaas" or "/v1/governor". The longest matching prefix wins.
+            clock (Callable): Monotonic time source, overridable for tests.
+        """
+        self.rate = rate
+        self.burst = burst
+        self.networks = dict(networks or {})
+        self.groups = dict(groups or {})
+        self._clock = clock
+        self._prefixes = sorted(self.groups, key=len, reverse=True)
+        self._buckets: Dict[tuple, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, key: tuple, limits: Tuple[float, Optional[float]]) -> TokenBucket:
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(*limits, clock=self._clock)
+            return bucket
+
+    def reserve(self, network: Network, endpoint: str) -> float:
+        """Takes a token for a request and returns how long to wait before sending it."""
+        limits = self.networks.get(network, (self.rate, self.burst))
+        wait = self._bucket((network,), limits).reserve()
+        for prefix in self._prefixes:
+            if endpoint.startswith(prefix):
+                group = self._bucket((network, prefix), self.groups[prefix])
+                wait = max(wait, group.reserve())
+                break
+        return wait
+
+    def acquire(self, network: Network, endpoint: str) -> None:
+        """Blocks the calling thread until the request may be sent."""
+        wait = self.reserve(network, endpoint)
+        if wait > 0:
+            time.sleep(wait)
+
+    async def acquire_async(self, network: Network, endpoint: str) -> None:
+        """Suspends the calling task until the request may be sent."""
+        wait = self.reserve(network, endpoint)
+        if wait > 0:
+            await asyncio.sleep(wait)
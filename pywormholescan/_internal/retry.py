@@ -0,0 +1,103 @@
+import random
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+__all__ = ["RetryPolicy", "RetryBudget"]
+
+
+class RetryBudget:
+    def __init__(self, *, ratio: float = 0.2, min_retries: int = 10) -> None:
+        """
+        Caps retries to a fraction of traffic, so an outage does not multiply the load sent upstream.
+
+        Every request deposits `ratio` tokens and every retry withdraws one. The balance starts
+        at `min_retries` and never exceeds twice that.
+
+        Args:
+            ratio (float): Retries allowed per request, on average.
+            min_retries (int): Retries allowed before any traffic has been seen.
+        """
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self._cap = max(min_retries * 2, 1)
+        self._balance = float(min_retries)
+        self._lock = threading.Lock()
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._balance = min(self._cap, self._balance + self.ratio)
+
+    def withdraw(self) -> bool:
+        """Takes one retry token, returning False if the budget is spent."""
+        with self._lock:
+            if self._balance < 1:
+                return False
+            self._balance -= 1
+            return True
+
+
+class RetryPolicy:
+    def __init__(
+        self,
+        *,
+        max_attempts: int = 4,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30,
+        jitter: bool = True,
+        statuses: Iterable[int] = (429, 500, 502, 503, 504),
+        respect_retry_after: bool = True,
+        max_retry_after: float = 120,
+        budget: Optional[RetryBudget] = None,
+    ) -> None:
+        """
+        Retry policy for idempotent GET requests.
+
+        Args:
+            max_attempts (int): Total attempts per request, including the first one.
+            backoff_factor (float): Base delay in seconds, doubled after every attempt.
+            max_backoff (float): Upper bound on the computed delay.
+            jitter (bool): Draw the delay uniformly between 0 and the computed backoff ("full jitter").
+            statuses (Iterable[int]): HTTP statuses worth retrying.
+            respect_retry_after (bool): Wait for the server's `Retry-After` when it sends one.
+            max_retry_after (float): Longest `Retry-After` honoured; longer ones are not retried.
+            budget (RetryBudget): Shared retry budget. Defaults to a fresh one per policy.
+        """
+        self.max_attempts = max_attempts
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.statuses = frozenset(statuses)
+        self.respect_retry_after = respect_retry_after
+        self.max_retry_after = max_retry_after
+        self.budget = budget or RetryBudget()
+
+    def backoff(
+        self, attempt: int, retry_after: Optional[str] = None
+    ) -> Optional[float]:
+        """
+        Returns the delay before the next attempt, or None if the server asked for a longer wait than allowed.
+
+        Args:
+            attempt (int): Number of attempts made so far, starting at 1.
+            retry_after (str): Value of the `Retry-After` response header, if any.
+        """
+        if self.respect_retry_after and retry_after:
+            delay = _parse_retry_after(retry_after)
+            if delay is not None:
+                return delay if delay <= self.max_retry_after else None
+
+        delay = min(self.max_backoff, self.backoff_factor * 2 ** (attempt - 1))
+        return random.uniform(0, delay) if self.jitter else delay
+
+
+def _parse_retry_after(value: str) -> Optional[float]:
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
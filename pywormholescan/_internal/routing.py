@@ -0,0 +1,338 @@
+import asyncio
+import random
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Awaitable, Callable, Dict, List, Optional, Sequence
+
+import requests
+
+__all__ = ["HedgePolicy", "Router", "endpoint_group"]
+
+# Errors after which the same request is sent to the next base URL straight away.
+_FAILOVER_ERRORS = (requests.ConnectionError, requests.Timeout)
+
+
+def endpoint_group(endpoint: str) -> str:
+    """
+    Returns the path prefix naming the group of an endpoint: the path up to the segment
+    following the API version, e.g. "/api/v1/vaas" for "/api/v1/vaas/2/<emitter>/1?parsedPayload=true"
+    or "/v1/governor" for "/v1/governor/limit".
+    """
+    segments = []
+    versioned = False
+    for segment in endpoint.split("?", 1)[0].split("/")[1:]:
+        if not segment or segment.isdigit() or len(segment) >= 32:
+            break
+        segments.append(segment)
+        if versioned:
+            break
+        versioned = segment[:1] == "v" and segment[1:].isdigit()
+    return "/" + "/".join(segments)
+
+
+class HedgePolicy:
+    def __init__(
+        self,
+        *,
+        quantile: float = 0.95,
+        min_delay: float = 0.005,
+        min_samples: int = 20,
+        window: int = 200,
+        prefixes: Optional[Sequence[str]] = None,
+        max_workers: int = 32,
+    ) -> None:
+        """
+        Hedging policy for GET requests.
+
+        A request still unanswered after the `quantile` latency of its endpoint group is sent
+        again, to the next fastest base URL if there are several. Whichever response comes
+        first is used and the other one is abandoned.
+
+        Args:
+            quantile (float): Latency quantile of the endpoint group after which to hedge.
+            min_delay (float): Lower bound on the hedging delay, in seconds.
+            min_samples (int): Latencies observed for an endpoint group before it is hedged.
+            window (int): Number of recent latencies the quantile is computed over.
+            prefixes (Sequence[str]): Endpoint path prefixes to hedge, e.g. "/api/v1/vaas/".
+                Every GET is hedged by default.
+            max_workers (int): Threads sending hedged requests and their duplicates.
+        """
+        self.quantile = quantile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.window = window
+        self.prefixes = tuple(prefixes) if prefixes is not None else None
+        self.max_workers = max_workers
+
+    def applies(self, endpoint: str) -> bool:
+        return self.prefixes is None or endpoint.startswith(self.prefixes)
+
+
+class Router:
+    def __init__(
+        self,
+        *,
+        hedge: Optional[HedgePolicy] = None,
+        alpha: float = 0.2,
+        explore: float = 0.05,
+        failure_penalty: float = 1.0,
+    ) -> None:
+        """
+        Sends each GET to the fastest of several base URLs, failing over to the others and
+        optionally hedging slow requests.
+
+        Latency is tracked per endpoint group and base URL as an exponentially weighted moving
+        average. Base URLs not yet measured are tried first, and a small share of requests is
+        sent to a random one so that a recovered base URL is noticed.
+
+        Args:
+            hedge (HedgePolicy): Hedging policy. Requests are not hedged by default.
+            alpha (float): Weight of the latest latency in the moving average.
+            explore (float): Share of requests sent to a random base URL.
+            failure_penalty (float): Seconds added to the latency recorded for a failed request.
+        """
+        self.hedge = hedge
+        self.alpha = alpha
+        self.explore = explore
+        self.failure_penalty = failure_penalty
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.failovers = 0
+        self._latency: Dict[tuple, float] = {}
+        self._recent: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+        self._executor = None
+
+    def send(
+        self,
+        endpoint: str,
+        base_urls: Sequence[str],
+        request: Callable[[str], requests.Response],
+    ) -> requests.Response:
+        """
+        Sends a GET for `endpoint` through `request(base_url)` and returns its response.
+
+        A connection error, timeout or 5xx answer is retried at once on the next fastest
+        base URL; the last failure is returned or raised once every base URL was tried.
+        """
+        group = endpoint_group(endpoint)
+        order = self._rank(group, base_urls)
+        delay = self._hedge_delay(group, endpoint)
+        if delay is None:
+            return self._failover(group, order, request)
+        return self._hedged(group, order, request, delay)
+
+    async def send_async(
+        self,
+        endpoint: str,
+        base_urls: Sequence[str],
+        request: Callable[[str], Awaitable],
+        failover: Callable[[BaseException], bool],
+    ):
+        """
+        Asyncio counterpart of `send`. `request(base_url)` is a coroutine function raising on
+        failure, and `failover(error)` tells whether an error is retried on the next base URL.
+        Hedged duplicates run as tasks on the running loop; the loser is cancelled.
+        """
+        group = endpoint_group(endpoint)
+        order = self._rank(group, base_urls)
+        delay = self._hedge_delay(group, endpoint)
+        if delay is None:
+            return await self._failover_async(group, order, request, failover)
+        return await self._hedged_async(group, order, request, failover, delay)
+
+    def latency(self, endpoint: str, base_url: str) -> Optional[float]:
+        """Returns the moving average latency of an endpoint's group on a base URL, if measured."""
+        return self._latency.get((endpoint_group(endpoint), base_url))
+
+    def stats(self) -> dict:
+        with self._lock:
+            latency = {}
+            for (group, base_url), value in self._latency.items():
+                latency.setdefault(group, {})[base_url] = value
+            return {
+                "hedges": self.hedges,
+                "hedge_wins": self.hedge_wins,
+                "failovers": self.failovers,
+                "latency": latency,
+            }
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    def _rank(self, group: str, base_urls: Sequence[str]) -> List[str]:
+        order = sorted(base_urls, key=lambda url: self._latency.get((group, url), -1.0))
+        if len(order) > 1 and random.random() < self.explore:
+            order.insert(0, order.pop(random.randrange(1, len(order))))
+        return order
+
+    def _hedge_delay(self, group: str, endpoint: str) -> Optional[float]:
+        if self.hedge is None or not self.hedge.applies(endpoint):
+            return None
+        with self._lock:
+            recent = sorted(self._recent.get(group, ()))
+        if len(recent) < self.hedge.min_samples:
+            return None
+        index = min(len(recent) - 1, int(len(recent) * self.hedge.quantile))
+        return max(self.hedge.min_delay, recent[index])
+
+    def _record(self, group: str, base_url: str, elapsed: float, ok: bool) -> None:
+        with self._lock:
+            if ok and self.hedge is not None:
+                recent = self._recent.get(group)
+                if recent is None:
+                    recent = self._recent[group] = deque(maxlen=self.hedge.window)
+                recent.append(elapsed)
+            elif not ok:
+                elapsed += self.failure_penalty
+            key = (group, base_url)
+            previous = self._latency.get(key)
+            if previous is None:
+                self._latency[key] = elapsed
+            else:
+                self._latency[key] = previous + self.alpha * (elapsed - previous)
+
+    def _timed(self, group: str, base_url: str, request) -> requests.Response:
+        start = time.perf_counter()
+        try:
+            response = request(base_url)
+        except _FAILOVER_ERRORS:
+            self._record(group, base_url, time.perf_counter() - start, ok=False)
+            raise
+        ok = response.status_code < 500
+        self._record(group, base_url, time.perf_counter() - start, ok)
+        return response
+
+    def _failover(self, group: str, order: List[str], request) -> requests.Response:
+        for index, base_url in enumerate(order):
+            last = index == len(order) - 1
+            try:
+                response = self._timed(group, base_url, request)
+            except _FAILOVER_ERRORS:
+                if last:
+                    raise
+            else:
+                if response.status_code < 500 or last:
+                    return response
+                response.close()
+            with self._lock:
+                self.failovers += 1
+
+    def _hedged(
+        self, group: str, order: List[str], request, delay: float
+    ) -> requests.Response:
+        executor = self._pool()
+        primary = executor.submit(self._failover, group, order, request)
+        if wait([primary], timeout=delay).done:
+            return primary.result()
+
+        with self._lock:
+            self.hedges += 1
+        hedge = executor.submit(self._failover, group, order[1:] + order[:1], request)
+        pending = {primary, hedge}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                if _succeeded(future):
+                    for other in pending:
+                        if not other.cancel():
+                            other.add_done_callback(_discard)
+                    if future is hedge:
+                        with self._lock:
+                            self.hedge_wins += 1
+                    return future.result()
+        # Both failed: report the original request's outcome, closing the duplicate.
+        _discard(hedge)
+        return primary.result()
+
+    async def _failover_async(self, group: str, order: List[str], request, failover):
+        for index, base_url in enumerate(order):
+            start = time.perf_counter()
+            try:
+                result = await request(base_url)
+            except Exception as e:
+                if not failover(e):
+                    self._record(group, base_url, time.perf_counter() - start, ok=True)
+                    raise
+                self._record(group, base_url, time.perf_counter() - start, ok=False)
+                if index == len(order) - 1:
+                    raise
+            else:
+                self._record(group, base_url, time.perf_counter() - start, ok=True)
+                return result
+            with self._lock:
+                self.failovers += 1
+
+    async def _hedged_async(
+        self, group: str, order: List[str], request, failover, delay: float
+    ):
+        primary = asyncio.ensure_future(
+            self._failover_async(group, order, request, failover)
+        )
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                tasks.discard(primary)
+                return primary.result()
+
+            with self._lock:
+                self.hedges += 1
+            hedge = asyncio.ensure_future(
+                self._failover_async(group, order[1:] + order[:1], request, failover)
+            )
+            tasks.add(hedge)
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            with self._lock:
+                                self.hedge_wins += 1
+                        tasks.discard(task)
+                        return task.result()
+            # Both failed: report the original request's outcome.
+            hedge.exception()
+            tasks.discard(primary)
+            return primary.result()
+        finally:
+            for task in tasks:
+                if not task.cancel():
+                    _release(task)
+                else:
+                    task.add_done_callback(_release)
+
+    def _pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.hedge.max_workers,
+                    thread_name_prefix="pywormholescan-hedge",
+                )
+            return self._executor
+
+
+def _succeeded(future: Future) -> bool:
+    return future.exception() is None and future.result().status_code < 500
+
+
+def _release(task: "asyncio.Future") -> None:
+    """Releases the response of an abandoned asyncio request, if it got one."""
+    if task.cancelled() or task.exception() is not None:
+        return
+    release = getattr(task.result(), "release", None)
+    if release is not None:
+        release()
+
+
+def _discard(future: Future) -> None:
+    """Closes the response of an abandoned request, releasing its connection."""
+    if not future.cancelled() and future.exception() is None:
+        future.result().close()
@@ -0,0 +1,92 @@
+import asyncio
+import threading
+from typing import Awaitable, Callable, Dict, Hashable, TypeVar
+
+__all__ = ["SingleFlight", "AsyncSingleFlight"]
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """
+    Merges concurrent calls for the same key into one execution whose result every caller shares.
+
+    Thread-safe. A key is only coalesced while its call is in flight; later calls run again.
+    """
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Runs `fn` unless a call for `key` is already in flight, in which case its outcome is shared."""
+        with self._lock:
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = self._in_flight[key] = _Call()
+                self.calls += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            call.done.set()
+
+    def stats(self) -> dict:
+        """Returns how many calls ran and how many were served by another caller's call."""
+        return {"calls": self.calls, "coalesced": self.coalesced}
+
+
+class AsyncSingleFlight:
+    """Asyncio counterpart of `SingleFlight`, merging concurrent coroutines within one event loop."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.coalesced = 0
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Awaits `fn()` unless a call for `key` is already in flight, in which case its outcome is shared."""
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            return await asyncio.shield(future)
+
+        self.calls += 1
+        future = self._in_flight[key] = asyncio.ensure_future(fn())
+        try:
+            return await asyncio.shield(future)
+        finally:
+            if future.done():
+                self._in_flight.pop(key, None)
+            else:
+                future.add_done_callback(lambda _: self._in_flight.pop(key, None))
+
+    def stats(self) -> dict:
+        """Returns how many calls ran and how many were served by another caller's call."""
+        return {"calls": self.calls, "coalesced": self.coalesced}
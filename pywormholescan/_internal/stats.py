@@ -0,0 +1,295 @@
+import threading
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+__all__ = ["ClientStats", "prometheus_text"]
+
+# Upper bounds, in seconds, of the latency histogram buckets.
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Phases of a request timed per endpoint template: opening the connection (and TLS handshake),
+# waiting for the response headers, reading the body, and decoding it.
+PHASES = ("connect", "ttfb", "download", "decode")
+
+# Template of the endpoint being requested, set by `get_with_url_builder` so that metrics are
+# labelled "/api/v1/vaas/{}/{}/{}" rather than with every distinct VAA ID.
+current_template: ContextVar[Optional[str]] = ContextVar(
+    "pywormholescan_template", default=None
+)
+
+
+def template_name(endpoint: str) -> str:
+    """Returns the metrics label of an endpoint: its template if known, else its path."""
+    return current_template.get() or endpoint.partition("?")[0]
+
+
+class Histogram:
+    __slots__ = ("counts", "sum", "count")
+
+    def __init__(self) -> None:
+        self.counts = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(LATENCY_BUCKETS, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        """Returns the count, sum, mean and cumulative bucket counts keyed by upper bound."""
+        buckets = {}
+        total = 0
+        for bound, count in zip(LATENCY_BUCKETS + (float("inf"),), self.counts):
+            total += count
+            buckets[bound] = total
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "buckets": buckets,
+        }
+
+
+class EndpointStats:
+    """Counters and latency histograms of one endpoint template."""
+
+    __slots__ = (
+        "calls",
+        "cache_hits",
+        "responses",
+        "not_modified",
+        "bytes_received",
+        "errors",
+        "phases",
+    )
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.cache_hits = 0
+        self.responses = 0
+        self.not_modified = 0
+        self.bytes_received = 0
+        self.errors = Counter()
+        self.phases = {phase: Histogram() for phase in PHASES}
+
+    def snapshot(self) -> dict:
+        latency = {
+            phase: histogram.snapshot() for phase, histogram in self.phases.items()
+        }
+        return {
+            "calls": self.calls,
+            "cache_hits": self.cache_hits,
+            "cache_hit_ratio": self.cache_hits / self.calls if self.calls else 0.0,
+            "responses": self.responses,
+            "not_modified": self.not_modified,
+            "bytes_received": self.bytes_received,
+            "errors": dict(self.errors),
+            "seconds": sum(phase["sum"] for phase in latency.values()),
+            "latency": latency,
+        }
+
+
+class ClientStats:
+    """Thread-safe counters describing the traffic an API client has sent."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+        self.attempts = 0
+        self.retries = 0
+        self.retries_exhausted = 0
+        self.budget_exhausted = 0
+        self.retry_reasons = Counter()
+        self.endpoints: Dict[str, EndpointStats] = {}
+        self._lock = threading.Lock()
+
+    def record_attempt(self, first: bool) -> None:
+        with self._lock:
+            self.attempts += 1
+            if first:
+                self.requests += 1
+
+    def record_retry(self, reason) -> None:
+        with self._lock:
+            self.retries += 1
+            self.retry_reasons[reason] += 1
+
+    def record_retries_exhausted(self) -> None:
+        with self._lock:
+            self.retries_exhausted += 1
+
+    def record_budget_exhausted(self) -> None:
+        with self._lock:
+            self.budget_exhausted += 1
+
+    def record_call(self, template: str, cached: bool) -> None:
+        """Counts a GET call, and whether a cache answered it without a request."""
+        with self._lock:
+            endpoint = self._endpoint(template)
+            endpoint.calls += 1
+            if cached:
+                endpoint.cache_hits += 1
+
+    def record_response(
+        self,
+        template: str,
+        status: int,
+        *,
+        connect: float = 0.0,
+        ttfb: float = 0.0,
+        download: Optional[float] = None,
+        size: int = 0,
+    ) -> None:
+        """
+        Records a response received from the API.
+
+        Args:
+            template (str): Endpoint template the request was built from.
+            status (int): HTTP status. 4xx and 5xx statuses are counted as errors.
+            connect (float): Seconds spent opening a connection, 0 if one was reused.
+            ttfb (float): Seconds between sending the request and receiving the headers.
+            download (float): Seconds spent reading the body. None if it is read later, by a stream.
+            size (int): Body size in bytes.
+        """
+        with self._lock:
+            endpoint = self._endpoint(template)
+            endpoint.responses += 1
+            endpoint.bytes_received += size
+            if status == 304:
+                endpoint.not_modified += 1
+            elif status >= 400:
+                endpoint.errors[str(status)] += 1
+            endpoint.phases["connect"].observe(connect)
+            endpoint.phases["ttfb"].observe(ttfb)
+            if download is not None:
+                endpoint.phases["download"].observe(download)
+
+    def record_download(self, template: str, seconds: float, size: int) -> None:
+        """Records the body of a streamed response once it has been read."""
+        with self._lock:
+            endpoint = self._endpoint(template)
+            endpoint.bytes_received += size
+            endpoint.phases["download"].observe(seconds)
+
+    def record_error(self, template: str, error: str) -> None:
+        """Counts a request that failed without a response, by error class."""
+        with self._lock:
+            self._endpoint(template).errors[error] += 1
+
+    def record_decode(self, template: str, seconds: float) -> None:
+        with self._lock:
+            self._endpoint(template).phases["decode"].observe(seconds)
+
+    def snapshot(self) -> dict:
+        """Returns a copy of the counters, with per-endpoint-template metrics under "endpoints"."""
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "attempts": self.attempts,
+                "retries": self.retries,
+                "retries_exhausted": self.retries_exhausted,
+                "budget_exhausted": self.budget_exhausted,
+                "retry_reasons": dict(self.retry_reasons),
+                "endpoints": {
+                    template: endpoint.snapshot()
+                    for template, endpoint in self.endpoints.items()
+                },
+            }
+
+    def _endpoint(self, template: str) -> EndpointStats:
+        endpoint = self.endpoints.get(template)
+        if endpoint is None:
+            endpoint = self.endpoints[template] = EndpointStats()
+        return endpoint
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _bound(value: float) -> str:
+    return "+Inf" if value == float("inf") else repr(float(value))
+
+
+def prometheus_text(stats: ClientStats, namespace: str = "pywormholescan") -> str:
+    """
+    Renders client stats in the Prometheus text exposition format, e.g. to serve from a
+    `/metrics` handler.
+
+    Args:
+        stats (ClientStats): Stats of a client, i.e. `client.stats`.
+        namespace (str): Prefix of every metric name.
+
+    Returns:
+        The exposition text, ending with a newline.
+    """
+    snapshot = stats.snapshot()
+    lines = []
+
+    def metric(name: str, kind: str, help_text: str, samples) -> None:
+        lines.append(f"# HELP {namespace}_{name} {help_text}")
+        lines.append(f"# TYPE {namespace}_{name} {kind}")
+        for suffix, labels, value in samples:
+            label_text = ",".join(f'{key}="{_escape(val)}"' for key, val in labels)
+            label_text = f"{{{label_text}}}" if label_text else ""
+            lines.append(f"{namespace}_{name}{suffix}{label_text} {value}")
+
+    for name, help_text in (
+        ("requests", "GET requests sent, not counting retries."),
+        ("attempts", "GET attempts sent, retries included."),
+        ("retries", "GET attempts that were retries."),
+        ("retries_exhausted", "GET requests that failed after their last attempt."),
+        ("budget_exhausted", "Retries skipped because the retry budget was spent."),
+    ):
+        metric(f"{name}_total", "counter", help_text, [("", (), snapshot[name])])
+
+    endpoints = snapshot["endpoints"]
+    for name, key, help_text in (
+        ("calls", "calls", "GET calls by endpoint template."),
+        (
+            "cache_hits",
+            "cache_hits",
+            "GET calls answered by a cache without a request.",
+        ),
+        ("responses", "responses", "Responses received by endpoint template."),
+        (
+            "not_modified",
+            "not_modified",
+            "304 Not Modified responses by endpoint template.",
+        ),
+        ("received_bytes", "bytes_received", "Response body bytes received."),
+    ):
+        samples = [
+            ("", (("endpoint", template),), endpoint[key])
+            for template, endpoint in endpoints.items()
+        ]
+        metric(f"{name}_total", "counter", help_text, samples)
+
+    metric(
+        "errors_total",
+        "counter",
+        "Failed requests by endpoint template and HTTP status or error class.",
+        [
+            ("", (("endpoint", template), ("error", error)), count)
+            for template, endpoint in endpoints.items()
+            for error, count in endpoint["errors"].items()
+        ],
+    )
+
+    samples = []
+    for template, endpoint in endpoints.items():
+        for phase, histogram in endpoint["latency"].items():
+            labels = (("endpoint", template), ("phase", phase))
+            for bound, count in histogram["buckets"].items():
+                samples.append(("_bucket", labels + (("le", _bound(bound)),), count))
+            samples.append(("_sum", labels, histogram["sum"]))
+            samples.append(("_count", labels, histogram["count"]))
+    metric(
+        "phase_seconds",
+        "histogram",
+        "Request latency by endpoint template and phase (connect, ttfb, download, decode).",
+        samples,
+    )
+    return "\n".join(lines) + "\n"
@@ -0,0 +1,277 @@
+import json
+import sqlite3
+import threading
+import time
+from typing import Iterable, List, Optional
+
+__all__ = ["RecordStore"]
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS vaas ("
+    " id TEXT PRIMARY KEY,"
+    " emitter_chain INTEGER NOT NULL,"
+    " emitter_addr TEXT NOT NULL,"
+    " sequence INTEGER NOT NULL,"
+    " tx_hash TEXT,"
+    " timestamp TEXT,"
+    " record BLOB NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS vaas_emitter ON vaas (emitter_chain, emitter_addr, sequence)",
+    "CREATE INDEX IF NOT EXISTS vaas_chain ON vaas (emitter_chain, sequence)",
+    "CREATE INDEX IF NOT EXISTS vaas_tx_hash ON vaas (tx_hash)",
+    "CREATE INDEX IF NOT EXISTS vaas_timestamp ON vaas (timestamp)",
+    "CREATE TABLE IF NOT EXISTS transactions ("
+    " id TEXT PRIMARY KEY,"
+    " emitter_chain INTEGER NOT NULL,"
+    " emitter_addr TEXT NOT NULL,"
+    " sequence INTEGER NOT NULL,"
+    " tx_hash TEXT,"
+    " timestamp TEXT,"
+    " record BLOB NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS transactions_emitter"
+    " ON transactions (emitter_chain, emitter_addr, sequence)",
+    "CREATE INDEX IF NOT EXISTS transactions_tx_hash ON transactions (tx_hash)",
+    "CREATE INDEX IF NOT EXISTS transactions_timestamp ON transactions (timestamp)",
+    "CREATE TABLE IF NOT EXISTS observations ("
+    " id TEXT PRIMARY KEY,"
+    " emitter_chain INTEGER NOT NULL,"
+    " emitter_addr TEXT NOT NULL,"
+    " sequence INTEGER NOT NULL,"
+    " tx_hash TEXT,"
+    " timestamp TEXT,"
+    " record BLOB NOT NULL)",
+    "CREATE INDEX IF NOT EXISTS observations_emitter"
+    " ON observations (emitter_chain, emitter_addr, sequence)",
+    "CREATE INDEX IF NOT EXISTS observations_tx_hash ON observations (tx_hash)",
+    "CREATE TABLE IF NOT EXISTS checkpoints ("
+    " shard TEXT PRIMARY KEY,"
+    " next_page INTEGER NOT NULL,"
+    " rows INTEGER NOT NULL,"
+    " done INTEGER NOT NULL,"
+    " updated_at REAL NOT NULL)",
+)
+
+
+def _encode(record) -> bytes:
+    """Returns the JSON of a record, whether it is a dict, a typed model or a lazy view."""
+    raw = getattr(record, "raw", None)
+    if raw is not None:
+        return raw
+    if hasattr(record, "to_dict"):
+        record = record.to_dict()
+    return json.dumps(record, separators=(",", ":")).encode()
+
+
+def _vaa_row(record) -> tuple:
+    return (
+        record["id"],
+        int(record["emitterChain"]),
+        record["emitterAddr"].lower(),
+        int(record["sequence"]),
+        record.get("txHash"),
+        record.get("timestamp"),
+        _encode(record),
+    )
+
+
+def _transaction_row(record) -> tuple:
+    # Transactions carry their VAA ID, chain/emitter/sequence, but no sequence field.
+    chain, emitter, sequence = record["id"].split("/")
+    return (
+        record["id"],
+        int(chain),
+        emitter.lower(),
+        int(sequence),
+        record.get("txHash"),
+        record.get("timestamp"),
+        _encode(record),
+    )
+
+
+def _observation_row(record) -> tuple:
+    return (
+        record["id"],
+        int(record["emitterChain"]),
+        record["emitterAddr"].lower(),
+        int(record["sequence"]),
+        record.get("txHash"),
+        record.get("indexedAt"),
+        _encode(record),
+    )
+
+
+_ROWS = {
+    "vaas": _vaa_row,
+    "transactions": _transaction_row,
+    "observations": _observation_row,
+}
+
+
+class RecordStore:
+    def __init__(self, path: str) -> None:
+        """
+        Local SQLite mirror of Wormholescan records, filled by `Backfill` and read by
+        `LocalWormholescanAPI`.
+
+        VAAs, transactions and observations are indexed on (chain, emitter, sequence),
+        transaction hash and timestamp. The store also keeps the per-shard page
+        checkpoints a backfill resumes from.
+
+        Args:
+            path (str): SQLite database file. Created if missing; ":memory:" keeps it in memory.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def save(
+        self,
+        table: str,
+        records: Iterable,
+        *,
+        shard: Optional[str] = None,
+        next_page: int = 0,
+        done: bool = False,
+    ) -> int:
+        """
+        Upserts records in one transaction, together with the shard checkpoint if given.
+
+        Writing both at once means a crash never leaves a checkpoint ahead of its records.
+
+        Args:
+            table (str): "vaas", "transactions" or "observations".
+            records (Iterable): Records as returned by the API, as dicts, models or lazy views.
+            shard (str): Backfill shard whose checkpoint advances with this batch.
+            next_page (int): Page the shard resumes from.
+            done (bool): Whether the shard has reached its last page.
+
+        Returns:
+            The number of records written.
+        """
+        rows = [_ROWS[self._table(table)](record) for record in records]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                f"INSERT OR REPLACE INTO {table}"
+                " (id, emitter_chain, emitter_addr, sequence, tx_hash, timestamp, record)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            if shard is not None:
+                self._conn.execute(
+                    "INSERT INTO checkpoints (shard, next_page, rows, done, updated_at)"
+                    " VALUES (?, ?, ?, ?, ?)"
+                    " ON CONFLICT (shard) DO UPDATE SET next_page = excluded.next_page,"
+                    " rows = rows + excluded.rows, done = excluded.done,"
+                    " updated_at = excluded.updated_at",
+                    (shard, next_page, len(rows), int(done), time.time()),
+                )
+        return len(rows)
+
+    def save_vaas(self, records: Iterable, **kwargs) -> int:
+        """Upserts VAA records. Takes the same keyword arguments as `save`."""
+        return self.save("vaas", records, **kwargs)
+
+    def get(
+        self, table: str, chain: int, emitter: str, sequence: int
+    ) -> Optional[bytes]:
+        """Returns the JSON of the record with this chain, emitter and sequence, or None."""
+        rows = self.find(
+            table, chain=chain, emitter=emitter, sequence=sequence, limit=1
+        )
+        return rows[0] if rows else None
+
+    def find(
+        self,
+        table: str,
+        *,
+        chain: Optional[int] = None,
+        emitter: Optional[str] = None,
+        sequence: Optional[int] = None,
+        tx_hash: Optional[str] = None,
+        sort_order: str = "DESC",
+        order_by: str = "sequence",
+        limit: int = 50,
+        offset: int = 0,
+    ) -> List[bytes]:
+        """
+        Returns the JSON of matching records, ordered by sequence or by timestamp.
+
+        Every filter maps onto an index, so lookups stay well under a millisecond.
+        Records with equal timestamps are ordered by sequence.
+        """
+        if order_by not in ("sequence", "timestamp"):
+            raise ValueError(
+                f"Unknown order {order_by!r}. Use 'sequence' or 'timestamp'."
+            )
+        clauses, params = [], []
+        for column, value in (
+            ("emitter_chain", int(chain) if chain is not None else None),
+            ("emitter_addr", emitter.lower() if emitter is not None else None),
+            ("sequence", int(sequence) if sequence is not None else None),
+            ("tx_hash", tx_hash),
+        ):
+            if value is not None:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        order = "ASC" if str(sort_order).upper() == "ASC" else "DESC"
+        columns = (
+            ("timestamp", "sequence") if order_by == "timestamp" else ("sequence",)
+        )
+        query = (
+            f"SELECT record FROM {self._table(table)}{where}"
+            f" ORDER BY {', '.join(f'{column} {order}' for column in columns)}"
+            " LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            rows = self._conn.execute(query, (*params, limit, offset)).fetchall()
+        return [row[0] for row in rows]
+
+    def checkpoint(self, shard: str) -> Optional[dict]:
+        """Returns the saved progress of a shard, or None if it never ran."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT next_page, rows, done FROM checkpoints WHERE shard = ?",
+                (shard,),
+            ).fetchone()
+        if row is None:
+            return None
+        return {"next_page": row[0], "rows": row[1], "done": bool(row[2])}
+
+    def complete(self, shard: str) -> bool:
+        """Whether a shard was crawled, or saved, up to its last page."""
+        checkpoint = self.checkpoint(shard)
+        return checkpoint is not None and checkpoint["done"]
+
+    def reset(self, shard: str) -> None:
+        """Forgets a shard checkpoint, so the next backfill crawls it from the start."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM checkpoints WHERE shard = ?", (shard,))
+
+    @staticmethod
+    def _table(table: str) -> str:
+        if table not in _ROWS:
+            raise ValueError(
+                f"Unknown table {table!r}. Use one of: {', '.join(_ROWS)}."
+            )
+        return table
+
+    def count(self, table: str = "vaas") -> int:
+        if table != "checkpoints":
+            self._table(table)
+        with self._lock:
+            return self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __enter__(self) -> "RecordStore":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1,118 @@
+from typing import Any, List, Sequence
+
+from .decoder import Decoder
+from .lazy import _skip_ws, _string_end, _value_end
+
+__all__ = ["RecordParser"]
+
+_ENVELOPE, _MEMBERS, _ITEMS, _DONE = range(4)
+
+
+class RecordParser:
+    """
+    Incremental parser yielding the records of a page response as its body arrives.
+
+    Chunks are fed in as they are read off the socket. Each complete record of the
+    records array is decoded and returned right away, and consumed bytes are dropped,
+    so the parser holds about one chunk plus one record at a time. Like
+    `extract_records`, a bare top-level array is taken as the records list, and a
+    missing or null records key yields nothing.
+
+    Locating values reuses the byte scanner of the lazy views.
+    """
+
+    def __init__(self, decoder: Decoder, records_path: Sequence[str] = ("data",)):
+        self.decoder = decoder
+        self._path = list(records_path)
+        self._top = True
+        self._state = _ENVELOPE
+        self._buf = b""
+        self._pos = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Adds the next chunk of the body and returns the records it completed."""
+        if self._state == _DONE:
+            return []
+        self._buf = self._buf[self._pos :] + chunk
+        self._pos = 0
+        records = []
+        while self._step(records):
+            pass
+        return records
+
+    def close(self) -> None:
+        """
+        Checks that the body ended after its records array.
+
+        Raises:
+            ValueError: If the body was cut off before the end of the records.
+        """
+        if self._state != _DONE:
+            raise ValueError("Truncated JSON document.")
+
+    def _step(self, records: list) -> bool:
+        """Consumes one token group. Returns False when more input is needed."""
+        buf = self._buf
+        pos = _skip_ws(buf, self._pos)
+        if pos >= len(buf):
+            return False
+        char = buf[pos]
+        if self._state == _ENVELOPE:
+            if char == 0x5B and (self._top or not self._path):  # '['
+                self._state = _ITEMS
+            elif char == 0x7B and self._path:  # '{'
+                self._state = _MEMBERS
+            else:
+                return self._finish()
+            self._top = False
+            self._pos = pos + 1
+            return True
+        if char == 0x2C:  # ','
+            self._pos = pos + 1
+            return True
+        if self._state == _ITEMS:
+            if char == 0x5D:  # ']'
+                return self._finish()
+            end = self._complete_value_end(buf, pos)
+            if end is None:
+                return False
+            records.append(self.decoder(buf[pos:end]))
+            self._pos = end
+            return True
+        # _MEMBERS: a key, its colon and either the start or the whole of its value.
+        if char == 0x7D:  # '}'
+            return self._finish()
+        try:
+            key_end = _string_end(buf, pos)
+        except ValueError:
+            return False
+        value = _skip_ws(buf, _skip_ws(buf, key_end) + 1)
+        if value >= len(buf):
+            return False
+        if self.decoder(buf[pos:key_end]) == self._path[0]:
+            self._path.pop(0)
+            self._state = _ENVELOPE
+            self._pos = value
+            return True
+        end = self._complete_value_end(buf, value)
+        if end is None:
+            return False
+        self._pos = end
+        return True
+
+    @staticmethod
+    def _complete_value_end(buf: bytes, pos: int):
+        """Returns the end of the value at `pos`, or None while it is still arriving."""
+        try:
+            end = _value_end(buf, pos)
+        except (ValueError, IndexError):
+            return None
+        # A value inside an array or object is always followed by ',', ']' or '}'.
+        # Requiring that byte also keeps a number split across chunks from being cut short.
+        return end if end < len(buf) else None
+
+    def _finish(self) -> bool:
+        self._state = _DONE
+        self._buf = b""
+        self._pos = 0
+        return False
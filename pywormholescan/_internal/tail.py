@@ -0,0 +1,201 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Sequence
+
+from .pagination import extract_records
+
+__all__ = ["tail", "atail"]
+
+
+class _Follower:
+    """
+    Polling state shared by `tail` and `atail`.
+
+    Keeps a bounded set of recently seen IDs and the newest timestamp seen (the
+    high-water mark), and adapts the poll interval to traffic.
+    """
+
+    def __init__(
+        self,
+        *,
+        page_size: int,
+        max_pages: int,
+        interval: float,
+        min_interval: float,
+        max_interval: float,
+        seen_size: int,
+        id_field: str,
+        timestamp_field: Optional[str],
+    ) -> None:
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.interval = interval
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.seen_size = seen_size
+        self.id_field = id_field
+        self.timestamp_field = timestamp_field
+        self.seen = OrderedDict()
+        self.high_water = None
+        self.pending: List[dict] = []
+
+    def _is_old(self, record) -> bool:
+        if record[self.id_field] in self.seen:
+            return True
+        if self.timestamp_field is None or self.high_water is None:
+            return False
+        timestamp = record.get(self.timestamp_field)
+        return timestamp is not None and timestamp < self.high_water
+
+    def add_page(self, page: int, records: Sequence) -> bool:
+        """Collects the unseen records of a newest-first page. Returns True to fetch the next page."""
+        for record in records:
+            if self._is_old(record):
+                return False
+            self.pending.append(record)
+        if len(records) < self.page_size:
+            return False
+        return page + 1 < self.max_pages
+
+    def flush(self, adapt: bool = True) -> List[dict]:
+        """Returns the records collected this poll, oldest first, and marks them seen."""
+        new = []
+        for record in reversed(self.pending):
+            key = record[self.id_field]
+            if key in self.seen:
+                continue
+            self.seen[key] = None
+            new.append(record)
+            if self.timestamp_field is not None:
+                timestamp = record.get(self.timestamp_field)
+                if timestamp is not None and (
+                    self.high_water is None or timestamp > self.high_water
+                ):
+                    self.high_water = timestamp
+        while len(self.seen) > self.seen_size:
+            self.seen.popitem(last=False)
+        burst = len(self.pending) >= self.page_size
+        self.pending = []
+        if adapt:
+            self._adapt(len(new), burst)
+        return new
+
+    def _adapt(self, found: int, burst: bool) -> None:
+        if burst:
+            self.interval = self.min_interval
+        elif found:
+            self.interval = max(self.min_interval, self.interval / 2)
+        else:
+            self.interval = min(self.max_interval, self.interval * 1.5)
+
+
+def tail(
+    fetch: Callable[..., dict],
+    *,
+    records_path: Sequence[str] = ("data",),
+    page_size: int = 100,
+    max_pages: int = 10,
+    interval: float = 5,
+    min_interval: float = 1,
+    max_interval: float = 30,
+    seen_size: int = 10_000,
+    id_field: str = "id",
+    timestamp_field: Optional[str] = None,
+    include_existing: bool = False,
+    **kwargs: dict,
+) -> Iterator[dict]:
+    """
+    Follows a newest-first endpoint, yielding each new record once, oldest first.
+
+    Every poll requests page 0 and pages back only until it reaches a record it has
+    already seen (or one older than the high-water mark), so bursts larger than a page
+    are not missed and quiet polls cost a single request.
+
+    Args:
+        fetch (Callable): Facade method returning one page. Receives `page`, `page_size` and `kwargs`.
+        records_path (Sequence[str]): Keys leading to the records list in each page.
+        page_size (int): Number of records requested per page.
+        max_pages (int): Most pages fetched in one poll, bounding how far a burst is followed back.
+        interval (float): Initial seconds between polls.
+        min_interval (float): Shortest interval, used while traffic fills whole pages.
+        max_interval (float): Longest interval, reached after successive empty polls.
+        seen_size (int): Number of recent IDs kept for deduplication.
+        id_field (str): Record field identifying a record.
+        timestamp_field (str): Record field ordering records. Records older than the newest
+            one seen end the walk back even after their ID left the dedup set.
+        include_existing (bool): Also yield the records present at the first poll.
+        **kwargs: Query parameters forwarded to `fetch`.
+
+    Yields:
+        New records, indefinitely. Stop by breaking out of the loop.
+    """
+    follower = _Follower(
+        page_size=page_size,
+        max_pages=max_pages,
+        interval=interval,
+        min_interval=min_interval,
+        max_interval=max_interval,
+        seen_size=seen_size,
+        id_field=id_field,
+        timestamp_field=timestamp_field,
+    )
+    first = True
+    while True:
+        page = 0
+        while True:
+            response = fetch(page=page, page_size=page_size, **kwargs)
+            records = extract_records(response, records_path)
+            if not follower.add_page(page, records) or first:
+                break
+            page += 1
+        # The first poll only sets the baseline, so it does not count as traffic.
+        new = follower.flush(adapt=not first)
+        if not first or include_existing:
+            yield from new
+        first = False
+        time.sleep(follower.interval)
+
+
+async def atail(
+    fetch: Callable[..., dict],
+    *,
+    records_path: Sequence[str] = ("data",),
+    page_size: int = 100,
+    max_pages: int = 10,
+    interval: float = 5,
+    min_interval: float = 1,
+    max_interval: float = 30,
+    seen_size: int = 10_000,
+    id_field: str = "id",
+    timestamp_field: Optional[str] = None,
+    include_existing: bool = False,
+    **kwargs: dict,
+) -> AsyncIterator[dict]:
+    """Asyncio counterpart of `tail`, for facades whose methods return coroutines."""
+    follower = _Follower(
+        page_size=page_size,
+        max_pages=max_pages,
+        interval=interval,
+        min_interval=min_interval,
+        max_interval=max_interval,
+        seen_size=seen_size,
+        id_field=id_field,
+        timestamp_field=timestamp_field,
+    )
+    first = True
+    while True:
+        page = 0
+        while True:
+            response = await fetch(page=page, page_size=page_size, **kwargs)
+            records = extract_records(response, records_path)
+            if not follower.add_page(page, records) or first:
+                break
+            page += 1
+        # The first poll only sets the baseline, so it does not count as traffic.
+        new = follower.flush(adapt=not first)
+        if not first or include_existing:
+            for record in new:
+                yield record
+        first = False
+        await asyncio.sleep(follower.interval)
@@ -0,0 +1,249 @@
+import gzip
+import io
+import json
+import threading
+import time
+from http import HTTPStatus
+from typing import Dict, List, Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+__all__ = ["Transport", "HTTPTransport", "RecordingTransport", "ReplayTransport"]
+
+
+class Transport:
+    """
+    Sends the HTTP requests of an APIClient.
+
+    Implementations return `requests.Response` objects, so everything above the
+    transport (caching, retries, decoding, streaming) behaves the same whichever one
+    is plugged in.
+    """
+
+    def send(
+        self,
+        method: str,
+        url: str,
+        *,
+        timeout: Optional[float] = None,
+        json: Optional[dict] = None,
+        stream: bool = False,
+        headers: Optional[dict] = None,
+    ) -> requests.Response:
+        """
+        Sends one request and returns its response, without raising on HTTP errors.
+
+        With `stream=True`, the body is read only as the caller iterates over it.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        pass
+
+
+_connect = threading.local()
+
+
+def reset_connect_time() -> None:
+    """Starts timing the connections the current thread opens."""
+    _connect.seconds = 0.0
+
+
+def connect_time() -> float:
+    """Returns the seconds the current thread spent opening connections since `reset_connect_time`."""
+    return getattr(_connect, "seconds", 0.0)
+
+
+class _ConnectTimer:
+    def connect(self) -> None:
+        start = time.perf_counter()
+        try:
+            super().connect()
+        finally:
+            _connect.seconds = connect_time() + time.perf_counter() - start
+
+
+class _TimedHTTPConnection(_ConnectTimer, HTTPConnection):
+    pass
+
+
+class _TimedHTTPSConnection(_ConnectTimer, HTTPSConnection):
+    pass
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = _TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = _TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose connections record how long they take to open (TCP and TLS), per thread."""
+
+    def init_poolmanager(self, *args, **kwargs) -> None:
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
+
+
+class HTTPTransport(Transport):
+    def __init__(self, session: Optional[requests.Session] = None) -> None:
+        """
+        Default transport, sending requests over a pooled `requests` session.
+
+        Args:
+            session (requests.Session): Session to send requests with. A plain session by default.
+        """
+        self.session = session or requests.Session()
+
+    def send(self, method, url, *, timeout=None, json=None, stream=False, headers=None):
+        if method == "GET":
+            return self.session.get(
+                url, timeout=timeout, stream=stream, headers=headers
+            )
+        return self.session.post(
+            url, json=json, timeout=timeout, stream=stream, headers=headers
+        )
+
+    def close(self) -> None:
+        self.session.close()
+
+
+# The recorded body is stored decoded, so headers describing its wire encoding are dropped.
+_BODY_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+
+
+def _key(method: str, url: str, body: Optional[dict]) -> Tuple[str, str, str]:
+    return method, url, json.dumps(body, sort_keys=True) if body is not None else ""
+
+
+def _response(url: str, status: int, headers: dict, body: bytes) -> requests.Response:
+    """Builds a response that reads `body` from memory, streamed or not."""
+    response = requests.Response()
+    response.status_code = status
+    try:
+        response.reason = HTTPStatus(status).phrase
+    except ValueError:
+        pass
+    response.headers = CaseInsensitiveDict(headers)
+    response.url = url
+    response.raw = io.BytesIO(body)
+    return response
+
+
+class RecordingTransport(Transport):
+    def __init__(self, path: str, transport: Optional[Transport] = None) -> None:
+        """
+        Records every response of the wrapped transport, for `ReplayTransport` to serve later.
+
+        Responses are kept in memory and written to `path`, as gzip-compressed JSON lines,
+        by `save()` or `close()`.
+
+        Args:
+            path (str): Fixture file to write.
+            transport (Transport): Transport sending the real requests. By default, the owning
+                APIClient's HTTPTransport, over a session with its pool and keep-alive settings,
+                or an HTTPTransport over a plain session when used on its own.
+        """
+        self.path = path
+        self.transport = transport
+        self.entries: List[dict] = []
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> Optional[requests.Session]:
+        return getattr(self.transport, "session", None)
+
+    def send(self, method, url, *, timeout=None, json=None, stream=False, headers=None):
+        if self.transport is None:
+            with self._lock:
+                if self.transport is None:
+                    self.transport = HTTPTransport()
+        response = self.transport.send(
+            method, url, timeout=timeout, json=json, stream=stream, headers=headers
+        )
+        # Reading the body here means a streamed response is buffered while recording.
+        body = response.content
+        entry = {
+            "method": method,
+            "url": url,
+            "status": response.status_code,
+            "headers": {
+                name: value
+                for name, value in response.headers.items()
+                if name.lower() not in _BODY_HEADERS
+            },
+        }
+        if json is not None:
+            entry["json"] = json
+        try:
+            entry["body"] = body.decode()
+        except UnicodeDecodeError:
+            entry["body_latin1"] = body.decode("latin-1")
+        with self._lock:
+            self.entries.append(entry)
+        return _response(url, response.status_code, entry["headers"], body)
+
+    def save(self) -> None:
+        """Writes the responses recorded so far to the fixture file."""
+        with self._lock:
+            entries = list(self.entries)
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            for entry in entries:
+                file.write(json.dumps(entry, separators=(",", ":")) + "\n")
+
+    def close(self) -> None:
+        self.save()
+        if self.transport is not None:
+            self.transport.close()
+
+
+class ReplayTransport(Transport):
+    def __init__(self, path: str) -> None:
+        """
+        Serves responses recorded by `RecordingTransport`, from memory and without network access.
+
+        Requests match on method, full URL and JSON body. A request recorded several times
+        replays its responses in order, then keeps repeating the last one, so polling
+        loops see the same sequence of pages as during recording.
+
+        Args:
+            path (str): Fixture file written by `RecordingTransport`.
+
+        Raises:
+            KeyError: From `send`, for a request that was never recorded.
+        """
+        self.path = path
+        self._responses: Dict[tuple, List[tuple]] = {}
+        self._served: Dict[tuple, int] = {}
+        self._lock = threading.Lock()
+        with gzip.open(path, "rt", encoding="utf-8") as file:
+            for line in file:
+                entry = json.loads(line)
+                if "body" in entry:
+                    body = entry["body"].encode()
+                else:
+                    body = entry["body_latin1"].encode("latin-1")
+                key = _key(entry["method"], entry["url"], entry.get("json"))
+                self._responses.setdefault(key, []).append(
+                    (entry["status"], entry["headers"], body)
+                )
+
+    def send(self, method, url, *, timeout=None, json=None, stream=False, headers=None):
+        key = _key(method, url, json)
+        with self._lock:
+            responses = self._responses.get(key)
+            if responses is None:
+                raise KeyError(f"No recorded response for {method} {url}")
+            served = self._served.get(key, 0)
+            self._served[key] = served + 1
+        status, headers, body = responses[min(served, len(responses) - 1)]
+        return _response(url, status, headers, body)
@@ -1,28 +1,33 @@
-__all__ = ["build_url"]
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple
+from urllib.parse import quote
 
+__all__ = ["EndpointTemplate", "build_url", "endpoint_template"]
 
-def build_url(*args, **kwargs) -> str:
-    """
-    Builds the complete URL for an API endpoint with path and/or query interpolation.
 
-    Args:
-        *args: Positional arguments to be interpolated into the path.
-        **kwargs: Keyword arguments to be used as query parameters.
+class _Encodings(dict):
+    """
+    Memo of percent-encoded values, looked up with a plain (C-level) dict subscript.
 
-    Returns:
-        The complete URL string.
+    Only strings are kept, so True, 1 and 1.0, which compare equal, never share an
+    entry; other values are encoded on every miss, which is cheap for numbers. The memo
+    is cleared when full, keeping it bounded across long-running processes.
     """
-    path_params = "/".join(str(param) for param in args)
 
-    query_params = ""
-    if kwargs:
-        queries = "&".join(
-            f"{_convert_to_camel_case(k)}={v}" for k, v in kwargs["kwargs"].items()
-        )
-        query_params = f"?{queries}"
+    def __init__(self, safe: str, convert=str, max_size: int = 4096) -> None:
+        super().__init__()
+        self.safe = safe
+        self.convert = convert
+        self.max_size = max_size
 
-    url = f"{path_params}{query_params}" if query_params else path_params
-    return url
+    def __missing__(self, value: Any) -> str:
+        if type(value) is int:
+            return str(value)
+        encoded = quote(self.convert(value), safe=self.safe)
+        if type(value) is str:
+            if len(self) >= self.max_size:
+                self.clear()
+            self[value] = encoded
+        return encoded
 
 
 def _convert_to_camel_case(query: str) -> str:
@@ -36,3 +41,97 @@ def _convert_to_camel_case(query: str) -> str:
     return f"{splitted_query[0]}" + "".join(
         [splitted_query[i].title() for i in range(len(splitted_query)) if i != 0]
     )
+
+
+# Path segments are fully encoded, so a "/" in a value cannot add a segment. Query values
+# keep "," and ":", which RFC 3986 allows there, so comma-separated lists and ISO
+# timestamps stay readable. Keys are converted to camelCase once per distinct key.
+_SEGMENTS = _Encodings(safe="")
+_VALUES = _Encodings(safe=",:")
+_KEYS = _Encodings(safe="", convert=_convert_to_camel_case)
+
+
+def _encode(encodings: _Encodings, value: Any) -> str:
+    # Ints, the usual chain IDs and sequences, need no encoding and format fastest as-is.
+    if value.__class__ is int:
+        return str(value)
+    try:
+        return encodings[value]
+    except TypeError:
+        # Unhashable values, such as lists, cannot be memoized and are encoded each time.
+        return quote(encodings.convert(value), safe=encodings.safe)
+
+
+def _query_string(query: Mapping[str, Any]) -> str:
+    keys, values = _KEYS, _VALUES
+    return "&".join(
+        [f"{keys[key]}={_encode(values, value)}" for key, value in query.items()]
+    )
+
+
+class EndpointTemplate:
+    """
+    An endpoint prefix and its number of path parameters, resolved once so that each
+    call only encodes and joins the values.
+
+    `pattern` names the endpoint independently of its parameter values, e.g.
+    "/api/v1/vaas/{}/{}/{}".
+    """
+
+    __slots__ = ("prefix", "arity", "pattern")
+
+    def __init__(self, prefix: str, arity: int) -> None:
+        self.prefix = prefix
+        self.arity = arity
+        self.pattern = prefix + "/{}" * arity
+
+    def render(
+        self, values: Sequence[Any] = (), query: Optional[Mapping[str, Any]] = None
+    ) -> str:
+        """
+        Returns the endpoint path with `values` as percent-encoded path segments and
+        `query` as percent-encoded, camelCase query parameters.
+        """
+        if len(values) != self.arity:
+            raise TypeError(
+                f"{self.pattern} takes {self.arity} path values, got {len(values)}"
+            )
+        path = self.prefix
+        if values:
+            segments = _SEGMENTS
+            path += "/" + "/".join([_encode(segments, value) for value in values])
+        if not query:
+            return path
+        return f"{path}?{_query_string(query)}"
+
+    def __repr__(self) -> str:
+        return f"EndpointTemplate({self.pattern!r})"
+
+
+_TEMPLATES: Dict[Tuple[str, int], EndpointTemplate] = {}
+
+
+def endpoint_template(prefix: str, arity: int) -> EndpointTemplate:
+    """Returns the template of `prefix` with `arity` path parameters, creating it on first use."""
+    template = _TEMPLATES.get((prefix, arity))
+    if template is None:
+        template = _TEMPLATES[prefix, arity] = EndpointTemplate(prefix, arity)
+    return template
+
+
+def build_url(prefix: str, *args, kwargs: Optional[Mapping[str, Any]] = None) -> str:
+    """
+    Builds the complete URL for an API endpoint with path and/or query interpolation.
+
+    Args:
+        prefix (str): Endpoint path the arguments are appended to.
+        *args: Positional arguments to be interpolated into the path.
+        kwargs (Mapping): Query parameters, with snake_case keys.
+
+    Returns:
+        The complete URL string.
+    """
+    template = _TEMPLATES.get((prefix, len(args)))
+    if template is None:
+        template = endpoint_template(prefix, len(args))
+    return template.render(args, kwargs)
@@ -0,0 +1,113 @@
+import re
+import sqlite3
+import threading
+import time
+from typing import Optional
+
+__all__ = ["VAAStore", "is_immutable"]
+
+# Signed VAAs never change once they exist, so these responses can be kept forever.
+_IMMUTABLE_ENDPOINT = re.compile(
+    r"^/(v1/signed_vaa|v1/signed_batch_vaa|api/v1/vaas)/\d+/[^/?]+/\d+(\?|$)"
+)
+
+
+def is_immutable(endpoint: str) -> bool:
+    """Returns True if the endpoint identifies a single signed VAA by chain, emitter and sequence."""
+    return _IMMUTABLE_ENDPOINT.match(endpoint) is not None
+
+
+class VAAStore:
+    def __init__(self, path: str, *, max_bytes: Optional[int] = None) -> None:
+        """
+        Persistent SQLite cache of immutable VAA responses, shared across process restarts.
+
+        Args:
+            path (str): SQLite database file. Created if missing; ":memory:" keeps it in memory.
+            max_bytes (int): Upper bound on stored bodies. Least recently read entries are evicted first.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS vaas ("
+            " url TEXT PRIMARY KEY,"
+            " body BLOB NOT NULL,"
+            " size INTEGER NOT NULL,"
+            " last_access REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS vaas_last_access ON vaas (last_access)"
+        )
+        self._conn.commit()
+        self._size = self._conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM vaas"
+        ).fetchone()[0]
+
+    def get(self, url: str) -> Optional[bytes]:
+        """Returns the stored body for `url`, or None if it has not been stored."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM vaas WHERE url = ?", (url,)
+            ).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            if self.max_bytes is not None:
+                self._conn.execute(
+                    "UPDATE vaas SET last_access = ? WHERE url = ?", (time.time(), url)
+                )
+                self._conn.commit()
+            return row[0]
+
+    def set(self, url: str, content: bytes) -> None:
+        """Stores a body, evicting the least recently read entries if `max_bytes` is exceeded."""
+        if self.max_bytes is not None and len(content) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._conn.execute(
+                "SELECT size FROM vaas WHERE url = ?", (url,)
+            ).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO vaas (url, body, size, last_access) VALUES (?, ?, ?, ?)",
+                (url, content, len(content), time.time()),
+            )
+            self._size += len(content) - (previous[0] if previous else 0)
+            if self.max_bytes is not None and self._size > self.max_bytes:
+                self._evict()
+            self._conn.commit()
+
+    def _evict(self) -> None:
+        rows = self._conn.execute(
+            "SELECT url, size FROM vaas ORDER BY last_access"
+        ).fetchall()
+        for url, size in rows:
+            if self._size <= self.max_bytes:
+                break
+            self._conn.execute("DELETE FROM vaas WHERE url = ?", (url,))
+            self._size -= size
+
+    def stats(self) -> dict:
+        """Returns a snapshot of the store counters."""
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM vaas").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "entries": entries,
+                "bytes": self._size,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM vaas").fetchone()[0]
@@ -0,0 +1,38 @@
+from pywormholescan._internal import AsyncAPIClient
+from pywormholescan.guardian import GuardianAPI
+from pywormholescan.models import to_models
+
+
+class AsyncGuardianAPI(GuardianAPI):
+    """
+    Asyncio twin of GuardianAPI.
+
+    Exposes every GuardianAPI endpoint under the same name and arguments, but each
+    method returns a coroutine that must be awaited. Requests share one pooled aiohttp
+    session and at most `max_concurrency` of them are in flight at once.
+    """
+
+    _api_client_class = AsyncAPIClient
+
+    async def close(self) -> None:
+        """Closes the underlying client, unless it was shared in by the caller."""
+        if self._owns_api_client:
+            await self._api_client.close()
+
+    def __enter__(self):
+        raise TypeError("Use `async with` for AsyncGuardianAPI.")
+
+    async def __aenter__(self) -> "AsyncGuardianAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _as_model(self, response, model, key=None):
+        if not self.models:
+            return response
+        return _awaited_models(response, model, key)
+
+
+async def _awaited_models(response, model, key):
+    return to_models(await response, model, key)
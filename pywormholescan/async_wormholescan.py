@@ -0,0 +1,46 @@
+from pywormholescan._internal import AsyncAPIClient
+from pywormholescan._internal.bulk import aget_many
+from pywormholescan._internal.pagination import apaginate
+from pywormholescan._internal.tail import atail
+from pywormholescan.models import to_models
+from pywormholescan.wormholescan import WormholescanAPI
+
+
+class AsyncWormholescanAPI(WormholescanAPI):
+    """
+    Asyncio twin of WormholescanAPI.
+
+    Exposes every WormholescanAPI endpoint under the same name and arguments, but each
+    method returns a coroutine that must be awaited. Requests share one pooled aiohttp
+    session and at most `max_concurrency` of them are in flight at once. The `iter_*`,
+    `tail_*` and `stream_*` helpers return async iterators, to be consumed with
+    `async for`, as do the `get_many_*` helpers when called with `stream=True`.
+    """
+
+    _api_client_class = AsyncAPIClient
+    _paginate = staticmethod(apaginate)
+    _tail = staticmethod(atail)
+    _get_many = staticmethod(aget_many)
+
+    async def close(self) -> None:
+        """Closes the underlying client, unless it was shared in by the caller."""
+        if self._owns_api_client:
+            await self._api_client.close()
+
+    def __enter__(self):
+        raise TypeError("Use `async with` for AsyncWormholescanAPI.")
+
+    async def __aenter__(self) -> "AsyncWormholescanAPI":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    def _as_model(self, response, model, key=None):
+        if not self.models:
+            return response
+        return _awaited_models(response, model, key)
+
+
+async def _awaited_models(response, model, key):
+    return to_models(await response, model, key)
@@ -0,0 +1,174 @@
+"""
+Checkpointed, resumable full-history crawls into a local RecordStore.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from pywormholescan._internal.pagination import extract_records
+from pywormholescan._internal.store import RecordStore
+
+__all__ = ["Backfill", "Shard", "shard_name"]
+
+
+def shard_name(chain: int, emitter: Optional[str] = None) -> str:
+    """Returns the checkpoint name of the shard crawling a chain, or one emitter on it."""
+    if emitter is None:
+        return f"vaas/{chain}"
+    return f"vaas/{chain}/{emitter.lower()}"
+
+
+class Shard:
+    """One independently checkpointed slice of a crawl: a chain, or a chain and emitter."""
+
+    __slots__ = ("name", "fetch")
+
+    def __init__(self, name: str, fetch: Callable[..., dict]) -> None:
+        self.name = name
+        self.fetch = fetch
+
+    def __repr__(self) -> str:
+        return f"Shard({self.name!r})"
+
+
+class Backfill:
+    def __init__(
+        self,
+        api,
+        store: RecordStore,
+        *,
+        chains: Iterable[int] = (),
+        emitters: Iterable[Tuple[int, str]] = (),
+        page_size: int = 100,
+        batch_pages: int = 5,
+        workers: int = 4,
+    ) -> None:
+        """
+        Crawls VAAs page by page into `store`, one shard per chain and per (chain, emitter).
+
+        Pages are requested oldest first, so page numbers stay stable while new VAAs
+        arrive. A shard is finished once it returns an empty page. Every `batch_pages`
+        pages, the records and the shard's next page are committed in one transaction;
+        a crashed or interrupted run resumes from there.
+
+        Shards marked done are never crawled again, so VAAs emitted after a shard
+        finished are only picked up after `RecordStore.reset(shard)` or by following
+        the chain with `tail_vaas`.
+
+        Args:
+            api (WormholescanAPI): Synchronous facade the pages are fetched through.
+            store (RecordStore): Store receiving records and checkpoints.
+            chains (Iterable[int]): Chains crawled through `get_vaas_by_chain`.
+            emitters (Iterable[Tuple[int, str]]): (chain, emitter) pairs crawled through `get_vaas_by_emitter`.
+            page_size (int): Number of records requested per page.
+            batch_pages (int): Pages written per transaction.
+            workers (int): Number of shards crawled in parallel.
+        """
+        self.store = store
+        self.page_size = page_size
+        self.batch_pages = batch_pages
+        self.workers = workers
+        self.shards: List[Shard] = [
+            Shard(shard_name(chain), partial(api.get_vaas_by_chain, chain))
+            for chain in chains
+        ] + [
+            Shard(
+                shard_name(chain, emitter),
+                partial(api.get_vaas_by_emitter, chain, emitter),
+            )
+            for chain, emitter in emitters
+        ]
+        self._lock = threading.Lock()
+        self._progress: Dict[str, dict] = {}
+        self._rows = 0
+        self._started: Optional[float] = None
+
+    def run(self) -> dict:
+        """
+        Crawls every unfinished shard to its end.
+
+        Raises:
+            The first error raised by a shard, once the other shards have finished.
+            Completed pages of the failed shard stay checkpointed.
+
+        Returns:
+            The final `progress()` snapshot.
+        """
+        self._started = time.monotonic()
+        self._rows = 0
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = [executor.submit(self._crawl, shard) for shard in self.shards]
+        for future in futures:
+            future.result()
+        return self.progress()
+
+    def _crawl(self, shard: Shard) -> None:
+        checkpoint = self.store.checkpoint(shard.name) or {
+            "next_page": 0,
+            "rows": 0,
+            "done": False,
+        }
+        state = dict(checkpoint, error=None)
+        self._update(shard, state)
+        if checkpoint["done"]:
+            return
+        page = checkpoint["next_page"]
+        batch = []
+        pages = 0
+        try:
+            while True:
+                records = extract_records(
+                    shard.fetch(page=page, page_size=self.page_size, sort_order="ASC")
+                )
+                batch.extend(records)
+                pages += 1
+                page += 1
+                # The server may cap page sizes below `page_size`, so only an empty page
+                # proves the shard has been read to its end.
+                done = not records
+                if done or pages == self.batch_pages:
+                    self._commit(shard, state, batch, page, done)
+                    batch = []
+                    pages = 0
+                if done:
+                    return
+        except Exception as e:
+            state["error"] = repr(e)
+            self._update(shard, state)
+            raise
+
+    def _commit(self, shard, state, batch, page, done) -> None:
+        written = self.store.save_vaas(
+            batch, shard=shard.name, next_page=page, done=done
+        )
+        state.update(next_page=page, rows=state["rows"] + written, done=done)
+        with self._lock:
+            self._rows += written
+        self._update(shard, state)
+
+    def _update(self, shard: Shard, state: dict) -> None:
+        with self._lock:
+            self._progress[shard.name] = dict(state)
+
+    def progress(self) -> dict:
+        """
+        Returns a snapshot of the crawl.
+
+        `shards` maps each shard to its next page, stored rows, completion and last
+        error. `rows` counts the records written during the current run, and
+        `rows_per_second` their rate, to help size `workers`.
+        """
+        with self._lock:
+            elapsed = time.monotonic() - self._started if self._started else 0
+            shards = {name: dict(state) for name, state in self._progress.items()}
+            return {
+                "shards": shards,
+                "done": sum(state["done"] for state in shards.values()),
+                "total": len(self.shards),
+                "rows": self._rows,
+                "elapsed": elapsed,
+                "rows_per_second": self._rows / elapsed if elapsed else 0.0,
+            }
@@ -1,11 +1,51 @@
 from pywormholescan._internal import APIClient, Network
+from pywormholescan.models import Heartbeat, to_models
 
 
 class GuardianAPI:
-    def __init__(self, network: Network) -> None:
-        """Initializes the object with the appropriate Base URL, based on the selected network: (Network.MAINNET | Network.TESTNET)."""
-        self._api_client = APIClient(network=network)
+    _api_client_class = APIClient
+
+    def __init__(
+        self,
+        network: Network = None,
+        *,
+        api_client: APIClient = None,
+        models: bool = False,
+    ) -> None:
+        """
+        Initializes the object with the appropriate Base URL, based on the selected network: (Network.MAINNET | Network.TESTNET).
+
+        Args:
+            network (Network): Network to query. Ignored when `api_client` is given.
+            api_client (APIClient): Existing client to share, so its connection pool is reused across facades.
+            models (bool): Return records as compact typed models (see `pywormholescan.models`) instead of dicts.
+
+        Raises:
+            ValueError: If `models` is combined with a client returning lazy views.
+        """
+        if models and api_client is not None and api_client.lazy:
+            raise ValueError("models=True cannot be combined with a lazy api_client.")
+        self._owns_api_client = api_client is None
+        self._api_client = api_client or self._api_client_class(network=network)
         self.base_url = self._api_client.base_url
+        self.models = models
+
+    def close(self) -> None:
+        """Closes the underlying client, unless it was shared in by the caller."""
+        if self._owns_api_client:
+            self._api_client.close()
+
+    def __enter__(self) -> "GuardianAPI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _as_model(self, response, model, key=None):
+        """Converts the records of `response` to `model` when models are enabled."""
+        if not self.models:
+            return response
+        return to_models(response, model, key)
 
     def get_governor_available_notional_by_chain(self) -> dict:
         """
@@ -76,7 +116,7 @@ class GuardianAPI:
         Endpoint - /v1/heartbeats
         """
         response = self._api_client.get("/v1/heartbeats")
-        return response
+        return self._as_model(response, Heartbeat, "entries")
 
     def get_guardians_signed_batch_vaa(
         self, chain_id: int, emitter: str, sequence: int
@@ -0,0 +1,191 @@
+"""
+WormholescanAPI answering lookups from a local RecordStore.
+"""
+
+from typing import List, Optional
+
+from pywormholescan._internal import APIClient, Network
+from pywormholescan._internal.store import RecordStore
+from pywormholescan.backfill import shard_name
+from pywormholescan.models import VAA, Observation, Transaction
+from pywormholescan.wormholescan import WormholescanAPI
+
+__all__ = ["LocalWormholescanAPI"]
+
+# Query parameters the store can answer; anything else goes to the remote API.
+_PAGE_ARGS = frozenset(("page", "page_size", "sort_order"))
+
+
+class LocalWormholescanAPI(WormholescanAPI):
+    """
+    WormholescanAPI serving VAA, transaction and observation lookups from a local mirror.
+
+    `get_vaa_by_id`, `get_vaas_by_chain`, `get_vaas_by_emitter`, `get_transaction_by_id`,
+    `get_observations_by_sequence` and `get_all_vaas(tx_hash=...)` read the indexed
+    SQLite store and return the same shapes as the API. Pages are only answered locally
+    when the store provably holds all of them:
+
+    - chain and emitter pages in ascending order, once `Backfill` has finished the shard,
+      and only while the page is full (a partial last page may be missing newer VAAs);
+    - transaction hash lookups whose chain shard has been finished;
+    - observations of a sequence the API has already listed in full.
+
+    Chain pages are ordered by timestamp and emitter pages by sequence, as the API does.
+    Any other lookup, including query parameters the store does not index, goes to the
+    remote API, and single records fetched that way are written back to the store.
+    Every other method is the regular remote call.
+    """
+
+    def __init__(
+        self,
+        store: RecordStore,
+        network: Network = None,
+        *,
+        api_client: APIClient = None,
+        models: bool = False,
+        fallback: bool = True,
+    ) -> None:
+        """
+        Args:
+            store (RecordStore): Local mirror, e.g. filled by `Backfill`.
+            network (Network): Network used for remote calls. Ignored when `api_client` is given.
+            api_client (APIClient): Existing client to share for remote calls.
+            models (bool): Return records as typed models instead of dicts.
+            fallback (bool): Query the remote API on a local miss. When False, a miss raises KeyError.
+        """
+        super().__init__(network, api_client=api_client, models=models)
+        self.store = store
+        self.fallback = fallback
+        self.local_hits = 0
+        self.local_misses = 0
+
+    def _decode_all(self, rows: List[bytes]) -> list:
+        decode = self._api_client.decoder
+        return [decode(row) for row in rows]
+
+    def _miss(self, remote, *args, **kwargs):
+        self.local_misses += 1
+        if not self.fallback:
+            raise KeyError(f"{remote.__name__}{args} is not in the local store.")
+        return remote(*args, **kwargs)
+
+    def _page(self, kwargs: dict) -> Optional[dict]:
+        """Returns store paging arguments, or None if `kwargs` holds filters the store lacks."""
+        if not _PAGE_ARGS.issuperset(kwargs):
+            return None
+        page_size = int(kwargs.get("page_size", 50))
+        return {
+            "limit": page_size,
+            "offset": int(kwargs.get("page", 0)) * page_size,
+            "sort_order": kwargs.get("sort_order", "DESC"),
+        }
+
+    def _ascending(self, page: Optional[dict], *shards: str) -> bool:
+        """Whether `page` is an oldest-first page of a shard the store holds in full."""
+        return (
+            page is not None
+            and str(page["sort_order"]).upper() == "ASC"
+            and any(self.store.complete(shard) for shard in shards)
+        )
+
+    def _vaa_page(self, rows: List[bytes]) -> dict:
+        self.local_hits += 1
+        return self._as_model({"data": self._decode_all(rows)}, VAA, "data")
+
+    def _write_back(
+        self, table: str, response, key: Optional[str] = None, **checkpoint
+    ) -> None:
+        try:
+            records = response if key is None else response[key]
+            self.store.save(
+                table, records if isinstance(records, list) else [records], **checkpoint
+            )
+        except (KeyError, TypeError, ValueError, AttributeError):
+            pass  # an unexpected shape is still returned, just not mirrored
+
+    def get_vaa_by_id(
+        self,
+        chain: int,
+        emitter: str,
+        seq: str,
+        payload: bool = None,
+        **kwargs: dict,
+    ) -> dict:
+        if not payload and not kwargs:
+            row = self.store.get("vaas", chain, emitter, seq)
+            if row is not None:
+                self.local_hits += 1
+                record = self._api_client.decoder(row)
+                return self._as_model({"data": record}, VAA, "data")
+        response = self._miss(
+            super().get_vaa_by_id, chain, emitter, seq, payload, **kwargs
+        )
+        if not payload and not kwargs:
+            self._write_back("vaas", response, "data")
+        return response
+
+    def get_vaas_by_chain(self, chain_id: str, **kwargs: dict) -> dict:
+        page = self._page(kwargs)
+        if self._ascending(page, shard_name(chain_id)):
+            rows = self.store.find("vaas", chain=chain_id, order_by="timestamp", **page)
+            if len(rows) == page["limit"]:
+                return self._vaa_page(rows)
+        return self._miss(super().get_vaas_by_chain, chain_id, **kwargs)
+
+    def get_vaas_by_emitter(self, chain: int, emitter: str, **kwargs: dict) -> dict:
+        page = self._page(kwargs)
+        if self._ascending(page, shard_name(chain, emitter), shard_name(chain)):
+            rows = self.store.find("vaas", chain=chain, emitter=emitter, **page)
+            if len(rows) == page["limit"]:
+                return self._vaa_page(rows)
+        return self._miss(super().get_vaas_by_emitter, chain, emitter, **kwargs)
+
+    def get_all_vaas(self, **kwargs: dict) -> dict:
+        tx_hash = kwargs.get("tx_hash")
+        filters = {key: value for key, value in kwargs.items() if key != "tx_hash"}
+        page = self._page(filters)
+        if tx_hash is not None and page is not None:
+            rows = self.store.find("vaas", tx_hash=tx_hash, **page)
+            records = self._decode_all(rows)
+            # A transaction belongs to one chain, so a finished chain shard holds all its VAAs.
+            if records and all(
+                self.store.complete(shard_name(record["emitterChain"]))
+                for record in records
+            ):
+                self.local_hits += 1
+                return self._as_model({"data": records}, VAA, "data")
+            return self._miss(super().get_all_vaas, **kwargs)
+        return super().get_all_vaas(**kwargs)
+
+    def get_transaction_by_id(self, chain_id: int, emitter: str, seq: int) -> dict:
+        row = self.store.get("transactions", chain_id, emitter, seq)
+        if row is not None:
+            self.local_hits += 1
+            return self._as_model(self._api_client.decoder(row), Transaction)
+        response = self._miss(super().get_transaction_by_id, chain_id, emitter, seq)
+        self._write_back("transactions", response)
+        return response
+
+    def get_observations_by_sequence(
+        self, chain: int, emitter: str, sequence: int, **kwargs: dict
+    ) -> dict:
+        page = self._page(kwargs)
+        shard = f"observations/{chain}/{emitter.lower()}/{sequence}"
+        if page is not None and self.store.complete(shard):
+            rows = self.store.find(
+                "observations", chain=chain, emitter=emitter, sequence=sequence, **page
+            )
+            self.local_hits += 1
+            return self._as_model(self._decode_all(rows), Observation)
+        response = self._miss(
+            super().get_observations_by_sequence, chain, emitter, sequence, **kwargs
+        )
+        if page is not None:
+            # A first page shorter than requested is every observation of the sequence.
+            complete = page["offset"] == 0 and len(response) < page["limit"]
+            self._write_back(
+                "observations",
+                response,
+                **({"shard": shard, "done": True} if complete else {}),
+            )
+        return response
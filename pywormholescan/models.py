@@ -0,0 +1,304 @@
+"""
+Compact typed records for Wormholescan responses.
+
+Each model stores its fields in `__slots__`, so a million records cost a
+fraction of the memory of the equivalent dicts. Keys the model does not know
+about are kept in `extra`, and records can still be read by their JSON key
+(`vaa["emitterChain"]`), so code written against dicts keeps working.
+"""
+
+import re
+from sys import intern
+from typing import Any, Dict, Optional, Tuple, Type, TypeVar
+
+__all__ = [
+    "Record",
+    "VAA",
+    "Observation",
+    "Transaction",
+    "Operation",
+    "GovernorStatus",
+    "Heartbeat",
+    "to_models",
+]
+
+R = TypeVar("R", bound="Record")
+
+
+def _snake_case(key: str) -> str:
+    return re.sub(r"(?<!^)(?=[A-Z])", "_", key).lower()
+
+
+class Record:
+    """
+    Base class for typed records. Subclasses list their JSON keys in `_keys`, and in
+    `_interned` the keys whose string values repeat across records, such as emitter and
+    guardian addresses; those are interned, so every record shares one copy.
+
+    Slots of keys missing from the response are left unset: they read as None as
+    attributes, but as missing through `record[key]` and `record.get(key)`, so a key
+    the API sent as null is told apart from one it left out.
+    """
+
+    __slots__ = ("extra",)
+    _keys: Tuple[str, ...] = ()
+    _interned: Tuple[str, ...] = ()
+    _attrs: Tuple[str, ...] = ()
+    _attr_set = frozenset()
+    _by_key: Dict[str, str] = {}
+    _slot_by_key: Dict[str, Any] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._attrs = tuple(_snake_case(key) for key in cls._keys)
+        cls._attr_set = frozenset(cls._attrs)
+        cls._by_key = dict(zip(cls._keys, cls._attrs))
+        # Slot descriptors raise AttributeError for unset slots instead of going through
+        # __getattr__, which reports them as None.
+        cls._slot_by_key = {
+            key: getattr(cls, attr) for key, attr in cls._by_key.items()
+        }
+
+    @classmethod
+    def from_dict(cls: Type[R], data: dict) -> R:
+        """Builds a record from a decoded JSON object."""
+        self = object.__new__(cls)
+        by_key = cls._by_key
+        get = data.get
+        extra = None
+        for key, value in data.items():
+            attr = by_key.get(key)
+            if attr is not None:
+                setattr(self, attr, value)
+            elif extra is None:
+                extra = {key: value}
+            else:
+                extra[key] = value
+        self.extra = extra
+        for key in cls._interned:
+            value = get(key)
+            if value.__class__ is str:
+                setattr(self, by_key[key], intern(value))
+        return self
+
+    def to_dict(self) -> dict:
+        """Returns the record as the dict the API returned."""
+        data = {}
+        for key, slot in self._slot_by_key.items():
+            try:
+                data[key] = slot.__get__(self)
+            except AttributeError:
+                pass
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def __getattr__(self, name: str) -> Any:
+        if name in self._attr_set:
+            return None
+        raise AttributeError(
+            f"{type(self).__name__!r} object has no attribute {name!r}"
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        slot = self._slot_by_key.get(key)
+        if slot is not None:
+            try:
+                return slot.__get__(self)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        fields = ", ".join(
+            f"{attr}={getattr(self, attr)!r}"
+            for attr in self._attrs[:4]
+            if getattr(self, attr) is not None
+        )
+        return f"{type(self).__name__}({fields}, ...)"
+
+
+class VAA(Record):
+    __slots__ = (
+        "id",
+        "sequence",
+        "version",
+        "emitter_chain",
+        "emitter_addr",
+        "emitter_native_addr",
+        "guardian_set_index",
+        "vaa",
+        "timestamp",
+        "updated_at",
+        "indexed_at",
+        "tx_hash",
+        "digest",
+        "is_duplicated",
+        "payload",
+    )
+    _keys = (
+        "id",
+        "sequence",
+        "version",
+        "emitterChain",
+        "emitterAddr",
+        "emitterNativeAddr",
+        "guardianSetIndex",
+        "vaa",
+        "timestamp",
+        "updatedAt",
+        "indexedAt",
+        "txHash",
+        "digest",
+        "isDuplicated",
+        "payload",
+    )
+    _interned = ("emitterAddr", "emitterNativeAddr")
+
+
+class Observation(Record):
+    __slots__ = (
+        "id",
+        "emitter_chain",
+        "emitter_addr",
+        "emitter_native_addr",
+        "sequence",
+        "hash",
+        "tx_hash",
+        "guardian_addr",
+        "signature",
+        "updated_at",
+        "indexed_at",
+    )
+    _keys = (
+        "id",
+        "emitterChain",
+        "emitterAddr",
+        "emitterNativeAddr",
+        "sequence",
+        "hash",
+        "txHash",
+        "guardianAddr",
+        "signature",
+        "updatedAt",
+        "indexedAt",
+    )
+    _interned = ("emitterAddr", "emitterNativeAddr", "guardianAddr")
+
+
+class Transaction(Record):
+    __slots__ = (
+        "id",
+        "tx_hash",
+        "timestamp",
+        "token_amount",
+        "usd_amount",
+        "symbol",
+        "emitter_chain",
+        "emitter_address",
+        "emitter_native_address",
+        "from_address",
+        "to_address",
+        "to_chain",
+        "status",
+        "payload",
+        "standardized_properties",
+        "global_tx",
+    )
+    _keys = (
+        "id",
+        "txHash",
+        "timestamp",
+        "tokenAmount",
+        "usdAmount",
+        "symbol",
+        "emitterChain",
+        "emitterAddress",
+        "emitterNativeAddress",
+        "fromAddress",
+        "toAddress",
+        "toChain",
+        "status",
+        "payload",
+        "standardizedProperties",
+        "globalTx",
+    )
+    _interned = ("emitterAddress", "emitterNativeAddress", "symbol", "status")
+
+
+class Operation(Record):
+    __slots__ = (
+        "id",
+        "emitter_chain",
+        "emitter_address",
+        "sequence",
+        "vaa",
+        "content",
+        "source_chain",
+        "target_chain",
+        "data",
+    )
+    _keys = (
+        "id",
+        "emitterChain",
+        "emitterAddress",
+        "sequence",
+        "vaa",
+        "content",
+        "sourceChain",
+        "targetChain",
+        "data",
+    )
+    _interned = ("emitterAddress",)
+
+
+class GovernorStatus(Record):
+    __slots__ = ("id", "node_name", "chains", "created_at", "updated_at")
+    _keys = ("id", "nodeName", "chains", "createdAt", "updatedAt")
+    _interned = ("nodeName",)
+
+
+class Heartbeat(Record):
+    __slots__ = ("p2p_node_addr", "raw_heartbeat", "verified_guardian_addr")
+    _keys = ("p2pNodeAddr", "rawHeartbeat", "verifiedGuardianAddr")
+    _interned = ("p2pNodeAddr", "verifiedGuardianAddr")
+
+
+def to_models(response: Any, model: Type[Record], key: Optional[str] = None) -> Any:
+    """
+    Converts the records of a decoded response into model instances.
+
+    Args:
+        response: Decoded response body.
+        model (Type[Record]): Model to build.
+        key (str): Envelope key holding the records (e.g. "data"). None when the
+            response itself is the record or the list of records.
+
+    Returns:
+        The response with its records replaced by models. Envelope fields such as
+        `pagination` are kept as they are.
+    """
+    target = response if key is None else response.get(key)
+    if isinstance(target, list):
+        from_dict = model.from_dict
+        converted = [from_dict(record) for record in target]
+    elif isinstance(target, dict):
+        converted = model.from_dict(target)
+    else:
+        return response
+    if key is None:
+        return converted
+    return {**response, key: converted}
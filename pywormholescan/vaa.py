@@ -0,0 +1,199 @@
+"""
+Offline decoder for the Wormhole VAA wire format.
+
+Decoding is zero-copy: signatures, the emitter address, the signed body and the
+payload are exposed as `memoryview` slices of the input buffer.
+"""
+
+import base64
+import binascii
+import struct
+from datetime import datetime, timezone
+from typing import Iterable, Iterator, List, Union
+
+__all__ = ["Signature", "ParsedVAA", "decode_vaa", "decode_vaas", "iter_decode_vaas"]
+
+VAAInput = Union[bytes, bytearray, memoryview, str]
+
+_HEADER = struct.Struct(">BIB")
+_BODY_HEAD = struct.Struct(">IIH")
+_BODY_TAIL = struct.Struct(">QB")
+_SIGNATURE_LENGTH = 66
+_EMITTER_OFFSET = _BODY_HEAD.size
+_PAYLOAD_OFFSET = _EMITTER_OFFSET + 32 + _BODY_TAIL.size
+
+
+class Signature:
+    __slots__ = ("guardian_index", "signature")
+
+    def __init__(self, guardian_index: int, signature: memoryview) -> None:
+        self.guardian_index = guardian_index
+        self.signature = signature
+
+    @property
+    def r(self) -> int:
+        return int.from_bytes(self.signature[:32], "big")
+
+    @property
+    def s(self) -> int:
+        return int.from_bytes(self.signature[32:64], "big")
+
+    @property
+    def recovery_id(self) -> int:
+        return self.signature[64]
+
+    def __repr__(self) -> str:
+        return f"Signature(guardian_index={self.guardian_index}, signature={bytes(self.signature).hex()})"
+
+
+class ParsedVAA:
+    """A VAA decoded from its wire format. Field names follow the Wormhole SDKs."""
+
+    __slots__ = (
+        "version",
+        "guardian_set_index",
+        "_signature_block",
+        "_signatures",
+        "timestamp",
+        "nonce",
+        "emitter_chain",
+        "emitter_address",
+        "sequence",
+        "consistency_level",
+        "body",
+        "payload",
+    )
+
+    def __init__(
+        self,
+        version: int,
+        guardian_set_index: int,
+        signature_block: memoryview,
+        timestamp: int,
+        nonce: int,
+        emitter_chain: int,
+        emitter_address: memoryview,
+        sequence: int,
+        consistency_level: int,
+        body: memoryview,
+        payload: memoryview,
+    ) -> None:
+        self.version = version
+        self.guardian_set_index = guardian_set_index
+        self._signature_block = signature_block
+        self._signatures = None
+        self.timestamp = timestamp
+        self.nonce = nonce
+        self.emitter_chain = emitter_chain
+        self.emitter_address = emitter_address
+        self.sequence = sequence
+        self.consistency_level = consistency_level
+        self.body = body
+        self.payload = payload
+
+    @property
+    def signatures(self) -> List[Signature]:
+        """Guardian signatures, split out of the signature block on first access."""
+        if self._signatures is None:
+            block = self._signature_block
+            self._signatures = [
+                Signature(block[offset], block[offset + 1 : offset + _SIGNATURE_LENGTH])
+                for offset in range(0, len(block), _SIGNATURE_LENGTH)
+            ]
+        return self._signatures
+
+    @property
+    def id(self) -> str:
+        """Wormholescan VAA ID: `chain/emitter/sequence`."""
+        return (
+            f"{self.emitter_chain}/{bytes(self.emitter_address).hex()}/{self.sequence}"
+        )
+
+    def to_dict(self) -> dict:
+        """Returns the decoded fields as JSON-friendly values, using Wormholescan's camelCase names."""
+        return {
+            "version": self.version,
+            "guardianSetIndex": self.guardian_set_index,
+            "signatures": [
+                {
+                    "index": sig.guardian_index,
+                    "signature": base64.b64encode(sig.signature).decode(),
+                }
+                for sig in self.signatures
+            ],
+            "timestamp": datetime.fromtimestamp(self.timestamp, tz=timezone.utc)
+            .isoformat()
+            .replace("+00:00", "Z"),
+            "nonce": self.nonce,
+            "emitterChain": self.emitter_chain,
+            "emitterAddress": bytes(self.emitter_address).hex(),
+            "sequence": self.sequence,
+            "consistencyLevel": self.consistency_level,
+            "payload": base64.b64encode(self.payload).decode(),
+        }
+
+    def __repr__(self) -> str:
+        return f"ParsedVAA(id={self.id!r}, guardian_set_index={self.guardian_set_index}, signatures={len(self.signatures)})"
+
+
+def _as_buffer(vaa: VAAInput) -> memoryview:
+    if isinstance(vaa, str):
+        text = vaa.strip()
+        try:
+            if text.startswith("0x"):
+                return memoryview(bytes.fromhex(text[2:]))
+            return memoryview(base64.b64decode(text, validate=True))
+        except (ValueError, binascii.Error) as e:
+            raise ValueError(f"VAA string is neither base64 nor 0x-prefixed hex: {e}")
+    return memoryview(vaa)
+
+
+def decode_vaa(vaa: VAAInput) -> ParsedVAA:
+    """
+    Decodes a VAA locally, without the `/api/v1/vaas/parse` round-trip.
+
+    Args:
+        vaa: Raw VAA bytes, or a base64 / 0x-prefixed hex string (as returned in `vaaBytes` or `vaa` fields).
+
+    Returns:
+        The decoded VAA. Its byte fields are memoryviews over `vaa` when bytes were given.
+
+    Raises:
+        ValueError: If the input is truncated or not a valid encoding.
+    """
+    buffer = _as_buffer(vaa)
+    try:
+        version, guardian_set_index, count = _HEADER.unpack_from(buffer, 0)
+        offset = _HEADER.size + count * _SIGNATURE_LENGTH
+        timestamp, nonce, emitter_chain = _BODY_HEAD.unpack_from(buffer, offset)
+        sequence, consistency_level = _BODY_TAIL.unpack_from(
+            buffer, offset + _EMITTER_OFFSET + 32
+        )
+    except struct.error:
+        raise ValueError(f"VAA is truncated ({len(buffer)} bytes).")
+
+    emitter_offset = offset + _EMITTER_OFFSET
+    return ParsedVAA(
+        version,
+        guardian_set_index,
+        buffer[_HEADER.size : offset],
+        timestamp,
+        nonce,
+        emitter_chain,
+        buffer[emitter_offset : emitter_offset + 32],
+        sequence,
+        consistency_level,
+        buffer[offset:],
+        buffer[offset + _PAYLOAD_OFFSET :],
+    )
+
+
+def iter_decode_vaas(vaas: Iterable[VAAInput]) -> Iterator[ParsedVAA]:
+    """Lazily decodes many VAAs, one at a time."""
+    for vaa in vaas:
+        yield decode_vaa(vaa)
+
+
+def decode_vaas(vaas: Iterable[VAAInput]) -> List[ParsedVAA]:
+    """Decodes many VAAs at once."""
+    return [decode_vaa(vaa) for vaa in vaas]
@@ -0,0 +1,234 @@
+"""
+Offline verification of guardian signatures on VAAs.
+
+Guardian sets are fetched once from `GuardianAPI.get_guardian_current_set` and
+cached by index; after that, verification needs no network access.
+"""
+
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, Iterable, List, Optional, Sequence
+
+from pywormholescan._internal.crypto import (
+    keccak256,
+    public_key_to_address,
+    recover_public_key,
+)
+from pywormholescan.guardian import GuardianAPI
+from pywormholescan.vaa import ParsedVAA, VAAInput, decode_vaa
+
+__all__ = ["GuardianSetCache", "VAAVerifier", "VerificationResult", "quorum"]
+
+
+def quorum(guardian_count: int) -> int:
+    """Returns the number of signatures required for a guardian set of the given size."""
+    return guardian_count * 2 // 3 + 1
+
+
+class GuardianSetCache:
+    def __init__(self, guardian_api: Optional[GuardianAPI] = None) -> None:
+        """
+        Guardian addresses keyed by guardian set index.
+
+        Args:
+            guardian_api (GuardianAPI): Used to fetch the current set on a cache miss. Without it,
+                only sets added explicitly or loaded from disk are available.
+        """
+        self.guardian_api = guardian_api
+        self._sets: Dict[int, List[bytes]] = {}
+        self._lock = threading.Lock()
+
+    def add(self, index: int, addresses: Iterable[str]) -> None:
+        """Caches a guardian set. Addresses are hex strings, with or without `0x`."""
+        self._sets[index] = [
+            bytes.fromhex(address[2:] if address.startswith("0x") else address)
+            for address in addresses
+        ]
+
+    def get(self, index: int) -> List[bytes]:
+        """
+        Returns the guardian addresses of a set, fetching the current set if it is not cached.
+
+        Raises:
+            KeyError: If the set is not cached and is not the current one.
+        """
+        addresses = self._sets.get(index)
+        if addresses is not None:
+            return addresses
+        with self._lock:
+            if index not in self._sets and self.guardian_api is not None:
+                self.refresh()
+        if index not in self._sets:
+            raise KeyError(f"Guardian set {index} is not cached.")
+        return self._sets[index]
+
+    def refresh(self) -> int:
+        """Fetches the current guardian set and returns its index."""
+        guardian_set = self.guardian_api.get_guardian_current_set()["guardianSet"]
+        self.add(guardian_set["index"], guardian_set["addresses"])
+        return guardian_set["index"]
+
+    def save(self, path: str) -> None:
+        """Writes the cached sets to a JSON file, for warm starts without network access."""
+        with open(path, "w") as f:
+            json.dump(
+                {
+                    str(index): ["0x" + address.hex() for address in addresses]
+                    for index, addresses in self._sets.items()
+                },
+                f,
+            )
+
+    def load(self, path: str) -> None:
+        """Adds the sets stored by `save`."""
+        with open(path) as f:
+            for index, addresses in json.load(f).items():
+                self.add(int(index), addresses)
+
+
+class VerificationResult:
+    __slots__ = ("valid", "guardian_set_index", "signatures", "quorum", "error")
+
+    def __init__(
+        self,
+        valid: bool,
+        guardian_set_index: Optional[int],
+        signatures: int,
+        quorum: int,
+        error: Optional[str] = None,
+    ) -> None:
+        self.valid = valid
+        self.guardian_set_index = guardian_set_index
+        self.signatures = signatures
+        self.quorum = quorum
+        self.error = error
+
+    def __bool__(self) -> bool:
+        return self.valid
+
+    def __repr__(self) -> str:
+        return (
+            f"VerificationResult(valid={self.valid}, guardian_set_index={self.guardian_set_index}, "
+            f"signatures={self.signatures}, quorum={self.quorum}, error={self.error!r})"
+        )
+
+
+def digest(vaa: ParsedVAA) -> bytes:
+    """Returns the digest guardians sign: keccak256(keccak256(body))."""
+    return keccak256(keccak256(vaa.body))
+
+
+def _check(vaa: ParsedVAA, guardians: Sequence[bytes]) -> VerificationResult:
+    required = quorum(len(guardians))
+    signatures = vaa.signatures
+    result = VerificationResult(
+        False, vaa.guardian_set_index, len(signatures), required
+    )
+    if len(signatures) < required:
+        result.error = "no quorum"
+        return result
+
+    message = digest(vaa)
+    last_index = -1
+    for signature in signatures:
+        index = signature.guardian_index
+        if index <= last_index:
+            result.error = "signature indices must be strictly increasing"
+            return result
+        if index >= len(guardians):
+            result.error = f"guardian index {index} out of range"
+            return result
+        public_key = recover_public_key(message, signature.signature)
+        if public_key is None or public_key_to_address(public_key) != guardians[index]:
+            result.error = f"invalid signature from guardian {index}"
+            return result
+        last_index = index
+
+    result.valid = True
+    return result
+
+
+def _check_raw(item: tuple) -> VerificationResult:
+    raw, guardians = item
+    return _check(decode_vaa(raw), guardians)
+
+
+class VAAVerifier:
+    def __init__(
+        self,
+        guardian_sets: Optional[GuardianSetCache] = None,
+        *,
+        guardian_api: Optional[GuardianAPI] = None,
+    ) -> None:
+        """
+        Verifies guardian signatures and quorum locally.
+
+        Args:
+            guardian_sets (GuardianSetCache): Cache of guardian sets to verify against.
+            guardian_api (GuardianAPI): Shortcut to build a cache that fetches the current set on demand.
+        """
+        self.guardian_sets = guardian_sets or GuardianSetCache(guardian_api)
+
+    def verify(self, vaa) -> VerificationResult:
+        """
+        Verifies one VAA.
+
+        Args:
+            vaa: A ParsedVAA, raw bytes, or a base64 / 0x-prefixed hex string.
+
+        Returns:
+            The verification result; it is truthy when the VAA carries a valid quorum.
+        """
+        if not isinstance(vaa, ParsedVAA):
+            vaa = decode_vaa(vaa)
+        try:
+            guardians = self.guardian_sets.get(vaa.guardian_set_index)
+        except KeyError as e:
+            return VerificationResult(
+                False, vaa.guardian_set_index, len(vaa.signatures), 0, str(e.args[0])
+            )
+        return _check(vaa, guardians)
+
+    def verify_many(
+        self,
+        vaas: Iterable[VAAInput],
+        *,
+        processes: Optional[int] = None,
+        chunksize: int = 16,
+    ) -> List[VerificationResult]:
+        """
+        Verifies many VAAs on a process pool, so throughput scales with CPU cores.
+
+        Args:
+            vaas: Raw VAAs, as bytes or base64 / 0x-prefixed hex strings.
+            processes (int): Worker processes. Defaults to the number of CPUs; 1 verifies in-process.
+            chunksize (int): VAAs sent to a worker at a time.
+
+        Returns:
+            One result per VAA, in input order. A VAA that cannot be decoded gets a failed
+            result whose `guardian_set_index` is None and whose `error` says why.
+        """
+        results: List[Optional[VerificationResult]] = []
+        work = []
+        for vaa in vaas:
+            try:
+                parsed = decode_vaa(vaa)
+            except (ValueError, TypeError) as e:
+                results.append(VerificationResult(False, None, 0, 0, str(e)))
+                continue
+            try:
+                guardians = self.guardian_sets.get(parsed.guardian_set_index)
+            except KeyError:
+                results.append(self.verify(parsed))
+                continue
+            results.append(None)
+            work.append((vaa if isinstance(vaa, str) else bytes(vaa), guardians))
+
+        if processes == 1:
+            checked = map(_check_raw, work)
+        else:
+            with ProcessPoolExecutor(max_workers=processes) as executor:
+                checked = list(executor.map(_check_raw, work, chunksize=chunksize))
+        checked = iter(checked)
+        return [next(checked) if result is None else result for result in results]
@@ -1,11 +1,67 @@
+from functools import partial
+from typing import Iterable, Iterator, List
+
 from pywormholescan._internal import APIClient, Network
+from pywormholescan.models import (
+    GovernorStatus,
+    Observation,
+    Operation,
+    Transaction,
+    VAA,
+    to_models,
+)
+from pywormholescan._internal.bulk import get_many
+from pywormholescan._internal.pagination import paginate
+from pywormholescan._internal.tail import tail
 
 
 class WormholescanAPI:
-    def __init__(self, network: Network) -> None:
-        """Initializes the object with the appropriate Base URL, based on the selected network: (Network.MAINNET | Network.TESTNET)."""
-        self._api_client = APIClient(network=network)
+    _api_client_class = APIClient
+    _paginate = staticmethod(paginate)
+    _tail = staticmethod(tail)
+    _get_many = staticmethod(get_many)
+
+    def __init__(
+        self,
+        network: Network = None,
+        *,
+        api_client: APIClient = None,
+        models: bool = False,
+    ) -> None:
+        """
+        Initializes the object with the appropriate Base URL, based on the selected network: (Network.MAINNET | Network.TESTNET).
+
+        Args:
+            network (Network): Network to query. Ignored when `api_client` is given.
+            api_client (APIClient): Existing client to share, so its connection pool is reused across facades.
+            models (bool): Return records as compact typed models (see `pywormholescan.models`) instead of dicts.
+
+        Raises:
+            ValueError: If `models` is combined with a client returning lazy views.
+        """
+        if models and api_client is not None and api_client.lazy:
+            raise ValueError("models=True cannot be combined with a lazy api_client.")
+        self._owns_api_client = api_client is None
+        self._api_client = api_client or self._api_client_class(network=network)
         self.base_url = self._api_client.base_url
+        self.models = models
+
+    def close(self) -> None:
+        """Closes the underlying client, unless it was shared in by the caller."""
+        if self._owns_api_client:
+            self._api_client.close()
+
+    def __enter__(self) -> "WormholescanAPI":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _as_model(self, response, model, key=None):
+        """Converts the records of `response` to `model` when models are enabled."""
+        if not self.models:
+            return response
+        return to_models(response, model, key)
 
     # ---------------  ADDRESS ---------------
     def get_address(self, address: str, **kwargs: dict) -> dict:
@@ -25,6 +81,36 @@ class WormholescanAPI:
         )
         return response
 
+    def iter_address(
+        self,
+        address: str,
+        *,
+        page_size: int = 100,
+        max_items: int = None,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of an address lookup, yielding one VAA at a time.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            *address (str): The address to look up.
+
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/address/:address
+        """
+        return self._paginate(
+            partial(self.get_address, address),
+            records_path=("data", "vaas"),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
+
     # ---------------  GLOBAL TX ID ---------------
     def get_global_txn_by_id(self, chain_id: int, emitter: str, seq: int) -> dict:
         """
@@ -46,6 +132,19 @@ class WormholescanAPI:
         )
         return response
 
+    def get_many_global_txns_by_id(
+        self, ids: Iterable, *, concurrency: int = 10, stream: bool = False
+    ) -> List:
+        """
+        Looks up many global transactions at once, concurrently and in input order.
+        Takes the same arguments and returns the same results as `get_many_vaas_by_id`.
+
+        Endpoint - /api/v1/global-tx/:chain_id/:emitter/:seq
+        """
+        return self._get_many(
+            self.get_global_txn_by_id, ids, concurrency=concurrency, stream=stream
+        )
+
     # ---------------  GOVERNOR ---------------
     def get_governor_config(self, **kwargs: dict) -> dict:
         """
@@ -62,6 +161,28 @@ class WormholescanAPI:
         )
         return response
 
+    def iter_governor_config(
+        self, *, page_size: int = 100, max_items: int = None, **kwargs: dict
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of the governor configuration, yielding one guardian config at a time.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/governor/config
+        """
+        return self._paginate(
+            self.get_governor_config,
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
+
     def get_governor_config_by_guardian_address(self, guardian_address: str) -> dict:
         """
         Returns governor configuration for a given guardian.
@@ -221,7 +342,7 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/governor/status", kwargs=kwargs
         )
-        return response
+        return self._as_model(response, GovernorStatus, "data")
 
     def get_governor_status_by_guardian_address(
         self, guardian_address: str, **kwargs: dict
@@ -240,7 +361,7 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/governor/status", guardian_address, kwargs=kwargs
         )
-        return response
+        return self._as_model(response, GovernorStatus, "data")
 
     # ---------------  HEALTH ---------------
     def get_health_check(self) -> dict:
@@ -287,7 +408,77 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/observations", kwargs=kwargs
         )
-        return response
+        return self._as_model(response, Observation)
+
+    def stream_observations(self, **kwargs: dict) -> Iterator[dict]:
+        """
+        Yields the observations of one page while the response is still downloading,
+        holding about one observation in memory at a time. Suited to very large pages.
+
+        Args:
+            page (int): Page number.
+            page_size (int): Number of elements per page.
+            sort_order (str): Sort results in ascending or descending order. Available values : ASC, DESC
+
+        Endpoint - /api/v1/observations
+        """
+        return self._api_client.stream_with_url_builder(
+            "/api/v1/observations",
+            records_path=(),
+            convert=Observation.from_dict if self.models else None,
+            kwargs=kwargs,
+        )
+
+    def iter_observations(
+        self, *, page_size: int = 100, max_items: int = None, **kwargs: dict
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of observations, yielding one observation at a time.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/observations
+        """
+        return self._paginate(
+            self.get_observations,
+            records_path=(),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
+
+    def tail_observations(
+        self, *, page_size: int = 100, **kwargs: dict
+    ) -> Iterator[dict]:
+        """
+        Follows new observations as they arrive, yielding each new one once, oldest first.
+        Each poll pages back from the newest record only until it reaches one already seen,
+        and polls speed up while traffic is busy and slow down while it is quiet.
+
+        Args:
+            page_size (int): Number of elements requested per page.
+            max_pages (int): Most pages fetched in one poll. Defaults to 10.
+            interval (float): Initial seconds between polls. Defaults to 5.
+            min_interval (float): Shortest interval between polls. Defaults to 1.
+            max_interval (float): Longest interval between polls. Defaults to 30.
+            seen_size (int): Number of recent IDs remembered for deduplication. Defaults to 10000.
+            timestamp_field (str): Record field acting as a high-water mark once an ID leaves the dedup set.
+            include_existing (bool): Also yield the records present at the first poll.
+
+        Endpoint - /api/v1/observations
+        """
+        kwargs.setdefault("sort_order", "DESC")
+        return self._tail(
+            self.get_observations,
+            records_path=(),
+            page_size=page_size,
+            **kwargs,
+        )
 
     def get_observations_by_chain(self, chain: int, **kwargs: dict) -> dict:
         """
@@ -305,7 +496,32 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/observations", chain, kwargs=kwargs
         )
-        return response
+        return self._as_model(response, Observation)
+
+    def iter_observations_by_chain(
+        self, chain: int, *, page_size: int = 100, max_items: int = None, **kwargs: dict
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of observations for a given blockchain.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            *chain (int): ID of the blockchain.
+
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/observations/:chain
+        """
+        return self._paginate(
+            partial(self.get_observations_by_chain, chain),
+            records_path=(),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
 
     def get_observations_by_emitter(
         self, chain: int, emitter: str, **kwargs: dict
@@ -326,7 +542,39 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/observations", chain, emitter, kwargs=kwargs
         )
-        return response
+        return self._as_model(response, Observation)
+
+    def iter_observations_by_emitter(
+        self,
+        chain: int,
+        emitter: str,
+        *,
+        page_size: int = 100,
+        max_items: int = None,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of observations for a specific emitter address.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            *chain (int): ID of the blockchain.
+            *emitter (str): Address of the emitter.
+
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/observations/:chain/:emitter
+        """
+        return self._paginate(
+            partial(self.get_observations_by_emitter, chain, emitter),
+            records_path=(),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
 
     def get_observations_by_sequence(
         self, chain: int, emitter: str, sequence: int, **kwargs: dict
@@ -348,7 +596,41 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/observations", chain, emitter, sequence, kwargs=kwargs
         )
-        return response
+        return self._as_model(response, Observation)
+
+    def iter_observations_by_sequence(
+        self,
+        chain: int,
+        emitter: str,
+        sequence: int,
+        *,
+        page_size: int = 100,
+        max_items: int = None,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of observations identified by emitter chain, emitter address and sequence.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            *chain (int): ID of the blockchain.
+            *emitter (str): Address of the emitter.
+            *sequence (int): Sequence of the VAA.
+
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/observations/:chain/:emitter/:sequence
+        """
+        return self._paginate(
+            partial(self.get_observations_by_sequence, chain, emitter, sequence),
+            records_path=(),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
 
     def get_observations_by_id(
         self,
@@ -378,7 +660,7 @@ class WormholescanAPI:
             hash,
             kwargs=kwargs,
         )
-        return response
+        return self._as_model(response, Observation)
 
     # ---------------  OPERATIONS ---------------
     def get_operations(self, **kwargs: dict) -> dict:
@@ -396,7 +678,30 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/operations", kwargs=kwargs
         )
-        return response
+        return self._as_model(response, Operation, "operations")
+
+    def iter_operations(
+        self, *, page_size: int = 100, max_items: int = None, **kwargs: dict
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of operations, yielding one operation at a time.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/operations/
+        """
+        return self._paginate(
+            self.get_operations,
+            records_path=("operations",),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
 
     def get_operation_by_id(
         self,
@@ -417,7 +722,20 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/operations", chain_id, emitter, seq
         )
-        return response
+        return self._as_model(response, Operation)
+
+    def get_many_operations_by_id(
+        self, ids: Iterable, *, concurrency: int = 10, stream: bool = False
+    ) -> List:
+        """
+        Looks up many operations at once, concurrently and in input order.
+        Takes the same arguments and returns the same results as `get_many_vaas_by_id`.
+
+        Endpoint - /api/v1/operations/{chain_id}/{emitter}/{seq}
+        """
+        return self._get_many(
+            self.get_operation_by_id, ids, concurrency=concurrency, stream=stream
+        )
 
     # ------------- STATS ---------------
     def get_protocol_stats(self) -> dict:
@@ -456,6 +774,19 @@ class WormholescanAPI:
         )
         return response
 
+    def get_many_relays_by_vaa_id(
+        self, ids: Iterable, *, concurrency: int = 10, stream: bool = False
+    ) -> List:
+        """
+        Looks up many relays at once, concurrently and in input order.
+        Takes the same arguments and returns the same results as `get_many_vaas_by_id`.
+
+        Endpoint - /api/v1/relays/:chain/:emitter/:sequence
+        """
+        return self._get_many(
+            self.get_relay_by_vaa_id, ids, concurrency=concurrency, stream=stream
+        )
+
     # ---------------  SCORECARDS ---------------
     def get_scorecards(self) -> dict:
         """
@@ -571,7 +902,58 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/transactions", kwargs=kwargs
         )
-        return response
+        return self._as_model(response, Transaction, "transactions")
+
+    def iter_transactions(
+        self, *, page_size: int = 100, max_items: int = None, **kwargs: dict
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of transactions, yielding one transaction at a time.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/transactions/
+        """
+        return self._paginate(
+            self.get_transactions,
+            records_path=("transactions",),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
+
+    def tail_transactions(
+        self, *, page_size: int = 100, **kwargs: dict
+    ) -> Iterator[dict]:
+        """
+        Follows new transactions as they arrive, yielding each new one once, oldest first.
+        Each poll pages back from the newest record only until it reaches one already seen,
+        and polls speed up while traffic is busy and slow down while it is quiet.
+
+        Args:
+            page_size (int): Number of elements requested per page.
+            max_pages (int): Most pages fetched in one poll. Defaults to 10.
+            interval (float): Initial seconds between polls. Defaults to 5.
+            min_interval (float): Shortest interval between polls. Defaults to 1.
+            max_interval (float): Longest interval between polls. Defaults to 30.
+            seen_size (int): Number of recent IDs remembered for deduplication. Defaults to 10000.
+            timestamp_field (str): Record field acting as a high-water mark once an ID leaves the dedup set.
+            include_existing (bool): Also yield the records present at the first poll.
+
+        Endpoint - /api/v1/transactions/
+        """
+        kwargs.setdefault("sort_order", "DESC")
+        return self._tail(
+            self.get_transactions,
+            records_path=("transactions",),
+            page_size=page_size,
+            **kwargs,
+        )
 
     def get_transaction_by_id(self, chain_id: int, emitter: str, seq: int) -> dict:
         """
@@ -587,7 +969,7 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/transactions", chain_id, emitter, seq
         )
-        return response
+        return self._as_model(response, Transaction)
 
     # ---------------  VAAs ---------------
     def get_all_vaas(self, **kwargs: dict) -> dict:
@@ -605,7 +987,75 @@ class WormholescanAPI:
         Endpoint - /api/v1/vaas/
         """
         response = self._api_client.get_with_url_builder("/api/v1/vaas", kwargs=kwargs)
-        return response
+        return self._as_model(response, VAA, "data")
+
+    def stream_all_vaas(self, **kwargs: dict) -> Iterator[dict]:
+        """
+        Yields the VAAs of one page while the response is still downloading,
+        holding about one VAA in memory at a time. Suited to very large pages.
+
+        Args:
+            page (int): Page number.
+            page_size (int): Number of elements per page.
+            sort_order (str): Sort results in ascending or descending order. Available values: ASC, DESC.
+            tx_hash (str): Transaction hash of the VAA.
+            parsed_payload (bool): Include the parsed contents of the VAA, if available.
+            app_id (str): Filter by application ID.
+
+        Endpoint - /api/v1/vaas/
+        """
+        return self._api_client.stream_with_url_builder(
+            "/api/v1/vaas",
+            convert=VAA.from_dict if self.models else None,
+            kwargs=kwargs,
+        )
+
+    def iter_all_vaas(
+        self, *, page_size: int = 100, max_items: int = None, **kwargs: dict
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of VAAs, yielding one VAA at a time.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/vaas/
+        """
+        return self._paginate(
+            self.get_all_vaas,
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
+
+    def tail_vaas(self, *, page_size: int = 100, **kwargs: dict) -> Iterator[dict]:
+        """
+        Follows new VAAs as they arrive, yielding each new one once, oldest first.
+        Each poll pages back from the newest record only until it reaches one already seen,
+        and polls speed up while traffic is busy and slow down while it is quiet.
+
+        Args:
+            page_size (int): Number of elements requested per page.
+            max_pages (int): Most pages fetched in one poll. Defaults to 10.
+            interval (float): Initial seconds between polls. Defaults to 5.
+            min_interval (float): Shortest interval between polls. Defaults to 1.
+            max_interval (float): Longest interval between polls. Defaults to 30.
+            seen_size (int): Number of recent IDs remembered for deduplication. Defaults to 10000.
+            timestamp_field (str): Record field acting as a high-water mark once an ID leaves the dedup set.
+            include_existing (bool): Also yield the records present at the first poll.
+
+        Endpoint - /api/v1/vaas/
+        """
+        kwargs.setdefault("sort_order", "DESC")
+        return self._tail(
+            self.get_all_vaas,
+            page_size=page_size,
+            **kwargs,
+        )
 
     def get_vaas_by_chain(self, chain_id: str, **kwargs: dict) -> dict:
         """
@@ -623,7 +1073,36 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/vaas", chain_id, kwargs=kwargs
         )
-        return response
+        return self._as_model(response, VAA, "data")
+
+    def iter_vaas_by_chain(
+        self,
+        chain_id: int,
+        *,
+        page_size: int = 100,
+        max_items: int = None,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of VAAs generated in a specific blockchain.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            *chain_id (int): ID of the blockchain.
+
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/vaas/:chain_id
+        """
+        return self._paginate(
+            partial(self.get_vaas_by_chain, chain_id),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
 
     def get_vaas_by_emitter(self, chain: int, emitter: str, **kwargs: dict) -> dict:
         """
@@ -643,7 +1122,38 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/vaas", chain, emitter, kwargs=kwargs
         )
-        return response
+        return self._as_model(response, VAA, "data")
+
+    def iter_vaas_by_emitter(
+        self,
+        chain: int,
+        emitter: str,
+        *,
+        page_size: int = 100,
+        max_items: int = None,
+        **kwargs: dict,
+    ) -> Iterator[dict]:
+        """
+        Lazily walks every page of VAAs for a specific emitter address.
+        By default pages are requested one at a time and the walk stops at the first empty page.
+
+        Args:
+            *chain (int): ID of the blockchain.
+            *emitter (str): Address of the emitter.
+
+            page_size (int): Number of elements requested per page.
+            max_items (int): Stop after yielding this many records.
+            prefetch (int): Number of pages kept in flight at once. A short page then also ends the walk.
+            page (int): First page to fetch. Defaults to 0.
+
+        Endpoint - /api/v1/vaas/:chain_id/:emitter
+        """
+        return self._paginate(
+            partial(self.get_vaas_by_emitter, chain, emitter),
+            page_size=page_size,
+            max_items=max_items,
+            **kwargs,
+        )
 
     def get_vaa_by_id(
         self,
@@ -671,7 +1181,29 @@ class WormholescanAPI:
         response = self._api_client.get_with_url_builder(
             "/api/v1/vaas", chain, emitter, seq, kwargs=kwargs
         )
-        return response
+        return self._as_model(response, VAA, "data")
+
+    def get_many_vaas_by_id(
+        self, ids: Iterable, *, concurrency: int = 10, stream: bool = False
+    ) -> List:
+        """
+        Looks up many VAAs at once, running up to `concurrency` requests in parallel over
+        the pooled connections. Repeated IDs are requested once, and a failed lookup is
+        reported on its own result instead of aborting the others.
+
+        Args:
+            *ids (Iterable): VAA IDs, as "chain/emitter/seq" strings or (chain, emitter, seq) tuples.
+            concurrency (int): Requests in flight at once. Defaults to 10, the client's pool size.
+            stream (bool): Yield results as they complete instead of returning them in input order.
+
+        Returns:
+            One BulkResult per ID, holding the response in `value` or the raised error in `error`.
+
+        Endpoint - /api/v1/vaas/:chain_id/:emitter/:seq
+        """
+        return self._get_many(
+            self.get_vaa_by_id, ids, concurrency=concurrency, stream=stream
+        )
 
     def parse_vaa(self, vaa: dict):
         """
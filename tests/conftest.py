@@ -1,7 +1,8 @@
 import pytest
 import responses
+from http_stub import StubServer
 from pywormholescan import Network, WormholescanAPI, GuardianAPI
-from pywormholescan._internal import APIClient
+from pywormholescan._internal import APIClient, AsyncAPIClient
 
 
 @pytest.fixture
@@ -23,3 +24,59 @@ def guardian(request):
 @pytest.fixture(params=[Network.MAINNET, Network.TESTNET])
 def wormholescan(request):
     return WormholescanAPI(network=request.param)
+
+
+@pytest.fixture
+def stub_server():
+    server = StubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def mirror_server():
+    """A second stub server, standing in for a mirror of the API."""
+    server = StubServer()
+    server.start()
+    yield server
+    server.stop()
+
+
+@pytest.fixture
+def stub_client(stub_server):
+    """Returns a factory of APIClients, taking APIClient's keyword arguments, pointed at `stub_server`."""
+
+    def make(**kwargs) -> APIClient:
+        client = APIClient(Network.MAINNET, **kwargs)
+        client.base_url = stub_server.url
+        return client
+
+    return make
+
+
+@pytest.fixture
+def async_stub_client(stub_server):
+    """Returns a factory of AsyncAPIClients, taking AsyncAPIClient's keyword arguments, pointed at `stub_server`."""
+
+    def make(**kwargs) -> AsyncAPIClient:
+        client = AsyncAPIClient(Network.MAINNET, **kwargs)
+        client.base_url = stub_server.url
+        return client
+
+    return make
+
+
+class FakeClock:
+    """Stands in for `time.monotonic`; tests move time forward by setting `now`."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
@@ -0,0 +1,110 @@
+"""
+Local HTTP/1.1 server serving canned JSON responses, shared by the tests (through the
+`stub_server` fixture) and the benchmarks (through `benchmarks/stub_server.py`).
+"""
+
+import json as _json
+import random
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+NOT_FOUND = (404, b'{"error": "not found"}', {}, 0)
+
+
+class StubServer:
+    """Local HTTP/1.1 server serving canned JSON responses, for transports `responses` cannot patch."""
+
+    def __init__(self, slow: float = 0.0, slow_ratio: float = 0.0) -> None:
+        """
+        Args:
+            slow (float): Extra seconds a share of the responses is held back, to stand in for tail latency.
+            slow_ratio (float): Share of the responses held back for `slow` more seconds.
+        """
+        self.routes = {}
+        self.default = NOT_FOUND
+        self.requests = []
+        self.bytes_sent = 0
+        self.slow = slow
+        self.slow_ratio = slow_ratio
+        handler = type("Handler", (_StubHandler,), {"stub": self})
+        self._server = _StubHTTPServer(("127.0.0.1", 0), handler)
+        self.url = f"http://127.0.0.1:{self._server.server_port}"
+
+    def add(self, path, json=None, status=200, headers=None, body=None, delay=0):
+        """Serves a response for `path`, with or without its query string."""
+        self.routes[path] = _route(json, status, headers, body, delay)
+
+    def add_default(self, json=None, status=200, headers=None, body=None, delay=0):
+        """Serves a response for every path without a route of its own."""
+        self.default = _route(json, status, headers, body, delay)
+
+    def start(self) -> None:
+        threading.Thread(
+            target=self._server.serve_forever, args=(0.05,), daemon=True
+        ).start()
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        self._server.server_close()
+
+
+def _route(json, status, headers, body, delay) -> tuple:
+    if body is None:
+        body = _json.dumps(json).encode()
+    return status, body, headers or {}, delay
+
+
+class _StubHTTPServer(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 128
+
+    def handle_error(self, request, client_address) -> None:
+        pass  # Clients hanging up early, e.g. after a timeout, are expected.
+
+
+def _not_modified(request_headers, route_headers) -> bool:
+    """Whether a request's validators match a route's `ETag` or `Last-Modified`."""
+    etag = route_headers.get("ETag")
+    if etag is not None and request_headers.get("If-None-Match") == etag:
+        return True
+    last_modified = route_headers.get("Last-Modified")
+    return (
+        last_modified is not None
+        and request_headers.get("If-Modified-Since") == last_modified
+    )
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    stub = None
+
+    def _respond(self) -> None:
+        stub = self.stub
+        stub.requests.append((self.command, self.path, dict(self.headers)))
+        length = int(self.headers.get("Content-Length", 0))
+        if length:
+            self.rfile.read(length)
+        route = stub.routes.get(self.path) or stub.routes.get(self.path.split("?")[0])
+        status, body, headers, delay = route or stub.default
+        if stub.slow_ratio and random.random() < stub.slow_ratio:
+            delay += stub.slow
+        if delay:
+            time.sleep(delay)
+        if _not_modified(self.headers, headers):
+            status, body = 304, b""
+        stub.bytes_sent += len(body)
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    do_GET = _respond
+    do_POST = _respond
+
+    def log_message(self, *args) -> None:
+        pass
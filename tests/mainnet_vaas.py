@@ -0,0 +1,64 @@
+"""
+Real mainnet VAAs and the guardian set that signed them, shared by the decoding and
+verification tests so byte offsets are checked against the actual wire format.
+"""
+
+# Pyth accumulator update from Pythnet (chain 26), signed by 13 of the 19 guardians
+# in mainnet guardian set 3. Its payload starts with the accumulator magic "AUWV".
+PYTHNET_VAA = (
+    "AQAAAAMNAFpq7E0Obvl72gKby+ppmEI5Z8mRvVKEspd5WJR8J59qYeYtb1/INY9IwAOKHMFs1c2X+K+4"
+    "PHLl73+VboKgAdcBAQRPIzGyOezZIEyn8HQnPC4WpFHey1mBSgBAJwT/HtbkMk6N5Ffguk7zZ0A5+wTf"
+    "X0TZLmO9ssLbA5lwDhLQ5y4BAqSpGBxCk7j9taLP29magR9tAMH4DWP6YRDMp+rSecIqYbcR3EGhNQrw"
+    "eVmxuigi7edrkGzqpzapjJ9cr0uWyzAAA1UBZ+B7yxvzBK5uPNX7H/6ru9/5ZAQlyji0gHXZhQzSFn+M"
+    "fT003KQh9CPe1lmnwbtq3O+9YppdoaPhOGYMc6EABPyfLBNBRtWjodqDO+YjiN5sTWZEr5P6N2LmbiXs"
+    "nq0hdg/1TObwjlm8y46E3LqMjvcRkDujt5EkDhz6SGBKcC0BC25XVEhmrUE5Y9tUCsUlJr3gFMf53UW1"
+    "BMBevcmaHEd8AbBDlSvsmj3U6crs661/8G5Cd78G1O+q/yTV8T0OP6EADBtAjSGE/ALSb9eCypqC4QZF"
+    "hyophpLX3kHCtApLBT8Wf76M3v9E6Tr9lSvPjn0p5BmNQeuOkvbcT6lYbOtUc8EADZH0nP141ClY9whc"
+    "8W5wiSsR+LxOatxXeMiMrBWOzcJKfdw8oi6MImVNUwGjjSFqWFu/+sgEErcUjMRPLgBbJToBDp1uhbpK"
+    "hxmoXkwz7uPesMHeCBVQ2Xb3Bijdfg9KtLypNAtOKmUhhOo5fGpiesg6EK2x/Sz73GHR3yFNvdifBmAB"
+    "D6Blheynt9vUTVPubXNKtTlsGuRNUE5V/+Y0uNZv3DhWUtZZ1RA9EjIT8VQG1KQEXkwO3BtcnvAiyT5h"
+    "uZNaoisBECqLp6ajYNUmPadPDCWf1XiRfhrEvXspJ7WAgxh9rmqaZ5IN2MzPzH3az0zKyk5reHASDVo/"
+    "yLAvT0et9apsgt8BEdor5LY5cD4WVAXljiZsQA8tmyJij+RH5NkZT9wO5w5aHKjhMDVpqgKteksZDdTZ"
+    "C9IxSlkCQ13eAKN4rNuPv0IBEs6lIQpssitiLPQb6KLnLa9UxyMEJGz4arZwb9EFGVehS3WG6sFqRRPU"
+    "9W4jcvcNGVsBVhuzmkvv3u9MDJuIzUwBZPEpgQAAAAAAGuEB+u2sWFHjK5sjtflBGowrrEquPtTde4Ed"
+    "0acupKpxAAAAAACKOWQBQVVXVgAAAAAABYq9dAAAJxDIoeJ4YgtzgZ2ikt9+LNjv29G4yg=="
+)
+
+# Fields of `PYTHNET_VAA`, in the shape of `VAA.to_dict()`.
+PYTHNET_VAA_FIELDS = {
+    "version": 1,
+    "guardianSetIndex": 3,
+    "timestamp": "2023-09-01T00:00:01Z",
+    "nonce": 0,
+    "emitterChain": 26,
+    "emitterAddress": (
+        "e101faedac5851e32b9b23b5f9411a8c2bac4aae3ed4dd7b811dd1a72ea4aa71"
+    ),
+    "sequence": 9058660,
+    "consistencyLevel": 1,
+    "payload": "QVVXVgAAAAAABYq9dAAAJxDIoeJ4YgtzgZ2ikt9+LNjv29G4yg==",
+}
+
+PYTHNET_VAA_SIGNERS = [0, 1, 2, 3, 4, 11, 12, 13, 14, 15, 16, 17, 18]
+
+MAINNET_GUARDIAN_SET_3 = [
+    "0x58CC3AE5C097b213cE3c81979e1B9f9570746AA5",
+    "0xfF6CB952589BDE862c25Ef4392132fb9D4A42157",
+    "0x114De8460193bdf3A2fCf81f86a09765F4762fD1",
+    "0x107A0086b32d7A0977926A205131d8731D39cbEB",
+    "0x8C82B2fd82FaeD2711d59AF0F2499D16e726f6b2",
+    "0x11b39756C042441BE6D8650b69b54EbE715E2343",
+    "0x54Ce5B4D348fb74B958e8966e2ec3dBd4958a7cd",
+    "0x15e7cAF07C4e3DC8e7C469f92C8Cd88FB8005a20",
+    "0x74a3bf913953D695260D88BC1aA25A4eeE363ef0",
+    "0x000aC0076727b35FBea2dAc28fEE5cCB0fEA768e",
+    "0xAF45Ced136b9D9e24903464AE889F5C8a723FC14",
+    "0xf93124b7c738843CBB89E864c862c38cddCccF95",
+    "0xD2CC37A4dc036a8D232b48f62cDD4731412f4890",
+    "0xDA798F6896A3331F64b48c12D1D57Fd9cbe70811",
+    "0x71AA1BE1D36CaFE3867910F99C09e347899C19C3",
+    "0x8192b6E7387CCd768277c17DAb1b7a5027c0b3Cf",
+    "0x178e21ad2E77AE06711549CFBB1f9c7a9d8096e8",
+    "0x5E1487F35515d02A92753504a8D75471b9f49EdB",
+    "0x6FbEBc898F403E4773E95feB15E80C9A99c8348d",
+]
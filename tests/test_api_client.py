@@ -2,6 +2,9 @@ import pytest
 import responses
 import requests
 
+from pywormholescan import GuardianAPI, Network, WormholescanAPI
+from pywormholescan._internal import APIClient
+
 
 @responses.activate
 def test_get_endpoint(api_client):
@@ -28,3 +31,56 @@ def test_failed_get_endpoint(api_client):
 
     with pytest.raises(requests.exceptions.HTTPError):
         api_client.get("/api/v1/health")
+
+
+def test_session_pool_configuration():
+    client = APIClient(Network.MAINNET, pool_connections=4, pool_maxsize=32)
+    adapter = client.session.get_adapter(client.base_url)
+
+    assert adapter._pool_connections == 4
+    assert adapter._pool_maxsize == 32
+    assert client.session.headers["Connection"] == "keep-alive"
+
+
+def test_session_without_keep_alive():
+    client = APIClient(Network.MAINNET, keep_alive=False)
+    assert client.session.headers["Connection"] == "close"
+
+
+@responses.activate
+def test_get_reuses_session(api_client, mocker):
+    responses.add(
+        responses.GET, f"{api_client.base_url}/api/v1/health", json={"status": "OK"}
+    )
+    spy = mocker.spy(api_client.session, "get")
+
+    api_client.get("/api/v1/health")
+    api_client.get("/api/v1/health")
+
+    assert spy.call_count == 2
+
+
+def test_context_manager_closes_session(mocker):
+    with APIClient(Network.MAINNET) as client:
+        close = mocker.spy(client.session, "close")
+    close.assert_called_once()
+
+
+def test_facades_share_api_client(mocker):
+    client = APIClient(Network.TESTNET)
+    wormholescan = WormholescanAPI(api_client=client)
+    guardian = GuardianAPI(api_client=client)
+    close = mocker.spy(client.session, "close")
+
+    assert wormholescan._api_client is guardian._api_client
+    assert wormholescan.base_url == Network.TESTNET.value
+
+    wormholescan.close()
+    guardian.close()
+    close.assert_not_called()
+
+
+def test_facade_closes_own_api_client(mocker):
+    with WormholescanAPI(Network.MAINNET) as wormholescan:
+        close = mocker.spy(wormholescan._api_client.session, "close")
+    close.assert_called_once()
@@ -0,0 +1,86 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from pywormholescan._internal import AsyncAPIClient
+
+
+def test_invalid_network():
+    with pytest.raises(ValueError):
+        AsyncAPIClient("mainnet")
+
+
+def test_get_endpoint(stub_server, async_stub_client):
+    stub_server.add("/api/v1/health", json={"status": "OK"})
+
+    async def main():
+        async with async_stub_client() as client:
+            return await client.get("/api/v1/health")
+
+    assert asyncio.run(main()) == {"status": "OK"}
+
+
+def test_failed_get_endpoint(stub_server, async_stub_client):
+    async def main():
+        async with async_stub_client() as client:
+            await client.get("/api/v1/health")
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(main())
+
+
+def test_get_with_url_builder(stub_server, async_stub_client):
+    stub_server.add("/api/v1/vaas/2?pageSize=5", json={"data": []})
+
+    async def main():
+        async with async_stub_client() as client:
+            return await client.get_with_url_builder(
+                "/api/v1/vaas", 2, kwargs={"page_size": 5}
+            )
+
+    assert asyncio.run(main()) == {"data": []}
+
+
+def test_post_endpoint(stub_server, async_stub_client):
+    stub_server.add("/api/v1/vaas/parse/", json={"parsed": True})
+
+    async def main():
+        async with async_stub_client() as client:
+            return await client.post("/api/v1/vaas/parse/", json={"vaa": "AQ=="})
+
+    assert asyncio.run(main()) == {"parsed": True}
+
+
+def test_concurrency_is_bounded(stub_server, async_stub_client):
+    stub_server.add("/api/v1/health", json={"status": "OK"}, delay=0.05)
+    in_flight = peak = 0
+
+    async def main():
+        async with async_stub_client(max_concurrency=3) as client:
+            original = client.session.request
+
+            def tracked(*args, **kwargs):
+                return _Tracked(original(*args, **kwargs))
+
+            client.session.request = tracked
+            await asyncio.gather(*(client.get("/api/v1/health") for _ in range(10)))
+
+    class _Tracked:
+        def __init__(self, ctx):
+            self.ctx = ctx
+
+        async def __aenter__(self):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            return await self.ctx.__aenter__()
+
+        async def __aexit__(self, *exc_info):
+            nonlocal in_flight
+            in_flight -= 1
+            return await self.ctx.__aexit__(*exc_info)
+
+    asyncio.run(main())
+    assert peak == 3
+    assert len(stub_server.requests) == 10
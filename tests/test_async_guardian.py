@@ -0,0 +1,42 @@
+import asyncio
+
+import aiohttp
+import pytest
+
+from pywormholescan import AsyncGuardianAPI, Network
+from pywormholescan._internal import AsyncAPIClient
+
+
+def test_get_guardians_signed_vaa(stub_server):
+    sample_json_data = {"vaaBytes": "AQAAAAQNA"}
+    stub_server.add("/v1/signed_vaa/1/emitter/7", json=sample_json_data)
+
+    async def main():
+        async with AsyncGuardianAPI(Network.MAINNET) as guardian:
+            guardian._api_client.base_url = stub_server.url
+            return await guardian.get_guardians_signed_vaa(1, "emitter", 7)
+
+    assert asyncio.run(main()) == sample_json_data
+
+
+def test_failed_get_guardian_current_set(stub_server):
+    async def main():
+        async with AsyncGuardianAPI(Network.MAINNET) as guardian:
+            guardian._api_client.base_url = stub_server.url
+            await guardian.get_guardian_current_set()
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(main())
+
+
+def test_shared_api_client_is_not_closed(stub_server):
+    stub_server.add("/v1/heartbeats", json={"entries": []})
+
+    async def main():
+        async with AsyncAPIClient(Network.MAINNET) as client:
+            client.base_url = stub_server.url
+            async with AsyncGuardianAPI(api_client=client) as guardian:
+                await guardian.get_guardians_hearbeats()
+            return client._session.closed
+
+    assert asyncio.run(main()) is False
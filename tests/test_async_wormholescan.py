@@ -0,0 +1,126 @@
+import asyncio
+import inspect
+
+import aiohttp
+import pytest
+
+from pywormholescan import (
+    AsyncGuardianAPI,
+    AsyncWormholescanAPI,
+    GuardianAPI,
+    Network,
+    WormholescanAPI,
+)
+
+
+def _api(stub_server):
+    api = AsyncWormholescanAPI(Network.MAINNET)
+    api._api_client.base_url = stub_server.url
+    return api
+
+
+def _placeholders(method) -> tuple:
+    """Returns positional and keyword placeholders for the required parameters of `method`."""
+    args, kwargs = [], {}
+    for param in list(inspect.signature(method).parameters.values())[1:]:
+        if param.default is not param.empty or param.kind in (
+            param.VAR_POSITIONAL,
+            param.VAR_KEYWORD,
+        ):
+            continue
+        value = ["2/abc/1"] if param.name.endswith("ids") else 1
+        if param.kind == param.KEYWORD_ONLY:
+            kwargs[param.name] = value
+        else:
+            args.append(value)
+    return args, kwargs
+
+
+@pytest.mark.parametrize(
+    "sync_class, async_class",
+    [(WormholescanAPI, AsyncWormholescanAPI), (GuardianAPI, AsyncGuardianAPI)],
+)
+def test_covers_every_endpoint(sync_class, async_class):
+    names = [
+        name
+        for name in dir(sync_class)
+        if name.startswith(("get_", "iter_", "stream_", "tail_", "parse_"))
+    ]
+
+    async def main():
+        async with async_class(Network.MAINNET) as api:
+            for name in names:
+                args, kwargs = _placeholders(getattr(sync_class, name))
+                result = getattr(api, name)(*args, **kwargs)
+                if inspect.iscoroutine(result):
+                    result.close()  # never awaited, so nothing is sent
+                else:
+                    assert hasattr(result, "__aiter__"), name
+
+    assert names
+    asyncio.run(main())
+
+
+def test_get_vaa_by_id(stub_server):
+    sample_json_data = {"data": {"sequence": 90116}}
+    stub_server.add(
+        "/api/v1/vaas/23/00000000000000000000000027428dd2d3dd32a4d7f7c497eaaa23130d894911/90116",
+        json=sample_json_data,
+    )
+
+    async def main():
+        async with _api(stub_server) as api:
+            return await api.get_vaa_by_id(
+                23,
+                "00000000000000000000000027428dd2d3dd32a4d7f7c497eaaa23130d894911",
+                90116,
+            )
+
+    assert asyncio.run(main()) == sample_json_data
+
+
+def test_get_all_vaas_with_query(stub_server):
+    stub_server.add("/api/v1/vaas?page=1&pageSize=2", json={"data": [{"id": 1}]})
+
+    async def main():
+        async with _api(stub_server) as api:
+            return await api.get_all_vaas(page=1, page_size=2)
+
+    assert asyncio.run(main()) == {"data": [{"id": 1}]}
+
+
+def test_failed_get_health_check(stub_server):
+    async def main():
+        async with _api(stub_server) as api:
+            await api.get_health_check()
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(main())
+
+
+def test_many_concurrent_lookups(stub_server):
+    for seq in range(50):
+        stub_server.add(f"/api/v1/vaas/2/emitter/{seq}", json={"data": {"seq": seq}})
+
+    async def main():
+        async with _api(stub_server) as api:
+            return await asyncio.gather(
+                *(api.get_vaa_by_id(2, "emitter", seq) for seq in range(50))
+            )
+
+    results = asyncio.run(main())
+    assert [r["data"]["seq"] for r in results] == list(range(50))
+
+
+def test_iter_all_vaas(stub_server):
+    stub_server.add(
+        "/api/v1/vaas?page=0&pageSize=2", json={"data": [{"id": 1}, {"id": 2}]}
+    )
+    stub_server.add("/api/v1/vaas?page=1&pageSize=2", json={"data": [{"id": 3}]})
+    stub_server.add("/api/v1/vaas?page=2&pageSize=2", json={"data": []})
+
+    async def main():
+        async with _api(stub_server) as api:
+            return [vaa["id"] async for vaa in api.iter_all_vaas(page_size=2)]
+
+    assert asyncio.run(main()) == [1, 2, 3]
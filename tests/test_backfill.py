@@ -0,0 +1,164 @@
+import threading
+
+import pytest
+import responses
+
+from pywormholescan import Backfill, Network, RecordStore, WormholescanAPI
+from pywormholescan.models import VAA
+
+EMITTER = "0000000000000000000000003ee18b2214aff97000d974cf647e7c347e8fa585"
+
+
+def _vaa(chain, seq, emitter=EMITTER):
+    return {
+        "id": f"{chain}/{emitter}/{seq}",
+        "emitterChain": chain,
+        "emitterAddr": emitter,
+        "sequence": str(seq),
+        "txHash": f"tx{chain}-{seq}",
+        "timestamp": f"2024-03-01T00:00:{seq:02d}Z",
+    }
+
+
+class FakeAPI:
+    """
+    Serves `count` VAAs per chain in ascending pages of at most `max_page_size`,
+    optionally failing once on a page.
+    """
+
+    def __init__(self, counts, fail_on=None, max_page_size=None):
+        self.counts = counts
+        self.fail_on = fail_on
+        self.max_page_size = max_page_size
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def get_vaas_by_chain(self, chain, page, page_size, sort_order):
+        with self._lock:
+            self.calls.append((chain, page))
+        if self.fail_on == (chain, page):
+            self.fail_on = None
+            raise ConnectionError("boom")
+        page_size = min(page_size, self.max_page_size or page_size)
+        start = page * page_size
+        end = min(start + page_size, self.counts[chain])
+        return {"data": [_vaa(chain, seq) for seq in range(start, end)]}
+
+    def get_vaas_by_emitter(self, chain, emitter, **kwargs):
+        return self.get_vaas_by_chain(chain, **kwargs)
+
+
+@pytest.fixture
+def store(tmp_path):
+    with RecordStore(str(tmp_path / "mirror.db")) as store:
+        yield store
+
+
+def test_store_upserts_and_checkpoints(store):
+    store.save_vaas([_vaa(2, 1), _vaa(2, 2)], shard="vaas/2", next_page=1)
+    store.save_vaas([_vaa(2, 2), _vaa(2, 3)], shard="vaas/2", next_page=2, done=True)
+
+    assert store.count() == 3
+    assert store.checkpoint("vaas/2") == {"next_page": 2, "rows": 4, "done": True}
+    assert store.checkpoint("vaas/4") is None
+    store.reset("vaas/2")
+    assert store.checkpoint("vaas/2") is None
+
+
+def test_store_accepts_models(store):
+    store.save_vaas([VAA.from_dict(_vaa(2, 1))])
+
+    assert store.count() == 1
+
+
+def test_store_rejects_unknown_table(store):
+    with pytest.raises(ValueError):
+        store.count("sqlite_master")
+
+
+def test_backfill_crawls_every_shard(store):
+    api = FakeAPI({2: 25, 4: 7})
+    backfill = Backfill(api, store, chains=[2, 4], page_size=10, batch_pages=2)
+
+    progress = backfill.run()
+
+    assert store.count() == 32
+    assert progress["done"] == progress["total"] == 2
+    assert progress["rows"] == 32
+    assert progress["shards"]["vaas/2"] == {
+        "next_page": 4,
+        "rows": 25,
+        "done": True,
+        "error": None,
+    }
+    assert progress["rows_per_second"] > 0
+
+
+def test_backfill_resumes_from_checkpoint(store):
+    api = FakeAPI({2: 55}, fail_on=(2, 3))
+    backfill = Backfill(api, store, chains=[2], page_size=10, batch_pages=2)
+
+    with pytest.raises(ConnectionError):
+        backfill.run()
+    assert store.checkpoint("vaas/2") == {"next_page": 2, "rows": 20, "done": False}
+    assert "boom" in backfill.progress()["shards"]["vaas/2"]["error"]
+
+    api.calls.clear()
+    progress = backfill.run()
+
+    assert [page for _, page in api.calls] == [2, 3, 4, 5, 6]
+    assert progress["rows"] == 35
+    assert store.count() == 55
+
+
+def test_finished_shards_are_skipped(store):
+    api = FakeAPI({2: 5})
+    Backfill(api, store, chains=[2], page_size=10).run()
+    api.calls.clear()
+
+    Backfill(api, store, chains=[2], page_size=10).run()
+
+    assert api.calls == []
+
+
+def test_pages_capped_by_the_server(store):
+    api = FakeAPI({2: 25}, max_page_size=10)
+
+    Backfill(api, store, chains=[2], page_size=100).run()
+
+    assert [page for _, page in api.calls] == [0, 1, 2, 3]
+    assert store.count() == 25
+    assert store.checkpoint("vaas/2")["done"]
+
+
+def test_emitter_shards(store):
+    backfill = Backfill(FakeAPI({2: 3}), store, emitters=[(2, EMITTER)])
+
+    backfill.run()
+
+    assert list(backfill.progress()["shards"]) == [f"vaas/2/{EMITTER}"]
+    assert store.count() == 3
+
+
+@responses.activate
+def test_backfill_through_facade(store):
+    api = WormholescanAPI(Network.MAINNET)
+    responses.add(
+        responses.GET,
+        f"{api.base_url}/api/v1/vaas/2?page=0&pageSize=2&sortOrder=ASC",
+        json={"data": [_vaa(2, 0), _vaa(2, 1)]},
+    )
+    responses.add(
+        responses.GET,
+        f"{api.base_url}/api/v1/vaas/2?page=1&pageSize=2&sortOrder=ASC",
+        json={"data": [_vaa(2, 2)]},
+    )
+    responses.add(
+        responses.GET,
+        f"{api.base_url}/api/v1/vaas/2?page=2&pageSize=2&sortOrder=ASC",
+        json={"data": []},
+    )
+
+    Backfill(api, store, chains=[2], page_size=2).run()
+
+    assert store.count() == 3
@@ -0,0 +1,183 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+from pywormholescan import (
+    CircuitBreaker,
+    CircuitOpenError,
+    GuardianAPI,
+    ResponseCache,
+    RetryPolicy,
+)
+
+GOVERNOR = "/v1/governor/available_notional_by_chain"
+
+
+def _trip(breaker, endpoint=GOVERNOR, failures=3):
+    for _ in range(failures):
+        breaker.before(endpoint)
+        breaker.record(endpoint, failed=True, elapsed=0.01)
+
+
+def test_trips_after_consecutive_failures():
+    breaker = CircuitBreaker(failure_threshold=3)
+    _trip(breaker, failures=2)
+    breaker.record(GOVERNOR, failed=False, elapsed=0.01)
+    _trip(breaker, failures=2)
+    assert breaker.state(GOVERNOR) == "closed"
+
+    _trip(breaker, failures=1)
+    assert breaker.state(GOVERNOR) == "open"
+    with pytest.raises(CircuitOpenError) as error:
+        breaker.before("/v1/governor/limit")
+    assert error.value.group == "/v1/governor"
+    breaker.before("/api/v1/vaas/2/abc/1")
+
+
+def test_half_open_probe(clock):
+    breaker = CircuitBreaker(failure_threshold=3, reset_timeout=10, clock=clock)
+    _trip(breaker)
+
+    clock.now = 10
+    breaker.before(GOVERNOR)
+    assert breaker.state(GOVERNOR) == "half_open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before(GOVERNOR)
+
+    breaker.record(GOVERNOR, failed=False, elapsed=0.01)
+    assert breaker.state(GOVERNOR) == "closed"
+    breaker.before(GOVERNOR)
+
+
+def test_failed_probe_backs_off(clock):
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=10, max_reset_timeout=15, clock=clock
+    )
+    _trip(breaker, failures=1)
+
+    clock.now = 10
+    breaker.before(GOVERNOR)
+    breaker.record(GOVERNOR, failed=True, elapsed=0.01)
+    clock.now = 24
+    with pytest.raises(CircuitOpenError):
+        breaker.before(GOVERNOR)
+    clock.now = 25
+    breaker.before(GOVERNOR)
+    assert breaker.stats()["circuits"]["/v1/governor"]["trips"] == 2
+
+
+def test_lost_probe_is_replaced(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=10, clock=clock)
+    _trip(breaker, failures=1)
+
+    clock.now = 10
+    breaker.before(GOVERNOR)
+    clock.now = 20
+    breaker.before(GOVERNOR)
+
+
+def test_slow_answers_count_as_failures():
+    breaker = CircuitBreaker(failure_threshold=2, latency_threshold=1)
+    breaker.record(GOVERNOR, failed=False, elapsed=2)
+    breaker.record(GOVERNOR, failed=False, elapsed=2)
+
+    assert breaker.state(GOVERNOR) == "open"
+
+
+def test_client_fails_fast_once_open(stub_server, stub_client):
+    stub_server.add(GOVERNOR, json={"error": "down"}, status=503)
+    stub_server.add("/v1/heartbeats", json={"entries": []})
+    breaker = CircuitBreaker(failure_threshold=3)
+    guardian = GuardianAPI(api_client=stub_client(breaker=breaker))
+
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            guardian.get_governor_available_notional_by_chain()
+    with pytest.raises(CircuitOpenError):
+        guardian.get_governor_available_notional_by_chain()
+
+    assert len(stub_server.requests) == 3
+    assert guardian.get_guardians_hearbeats() == {"entries": []}
+    assert breaker.stats()["rejected"] == 1
+
+
+def test_client_errors_do_not_trip(stub_server, stub_client):
+    stub_server.add(GOVERNOR, json={"error": "bad request"}, status=400)
+    client = stub_client(breaker=CircuitBreaker(failure_threshold=1))
+
+    for _ in range(3):
+        with pytest.raises(requests.HTTPError):
+            client.get(GOVERNOR)
+    assert client.breaker.state(GOVERNOR) == "closed"
+
+
+def test_open_circuit_stops_retries(stub_server, stub_client):
+    stub_server.add(GOVERNOR, json={}, status=503)
+    client = stub_client(
+        breaker=CircuitBreaker(failure_threshold=2),
+        retry=RetryPolicy(max_attempts=5, backoff_factor=0),
+    )
+
+    with pytest.raises(CircuitOpenError):
+        client.get(GOVERNOR)
+    assert len(stub_server.requests) == 2
+
+
+def test_per_endpoint_timeouts(stub_server, stub_client):
+    stub_server.add(GOVERNOR, json={}, delay=1)
+    stub_server.add("/v1/heartbeats", json={"entries": []}, delay=0.2)
+    client = stub_client(
+        timeouts={"/v1/governor": (1, 0.1)},
+        breaker=CircuitBreaker(failure_threshold=1),
+    )
+
+    start = time.perf_counter()
+    with pytest.raises(requests.Timeout):
+        client.get(GOVERNOR)
+    assert time.perf_counter() - start < 0.5
+    with pytest.raises(CircuitOpenError):
+        client.get(GOVERNOR)
+    assert client.get("/v1/heartbeats") == {"entries": []}
+
+
+def test_async_client_breaker_and_timeouts(stub_server, async_stub_client):
+    stub_server.add(GOVERNOR, json={}, delay=1)
+    stub_server.add("/v1/heartbeats", json={"entries": []}, delay=0.2)
+
+    async def main():
+        client = async_stub_client(
+            timeouts={"/v1/governor": (1, 0.1)},
+            breaker=CircuitBreaker(failure_threshold=1),
+        )
+        async with client:
+            start = time.perf_counter()
+            with pytest.raises(asyncio.TimeoutError):
+                await client.get(GOVERNOR)
+            assert time.perf_counter() - start < 0.5
+            with pytest.raises(CircuitOpenError):
+                await client.get(GOVERNOR)
+            return await client.get("/v1/heartbeats")
+
+    assert asyncio.run(main()) == {"entries": []}
+
+
+def test_async_stale_refresh_with_open_circuit(stub_server, async_stub_client, clock):
+    endpoint = "/api/v1/top-symbols-by-volume"
+    stub_server.add(endpoint, json={"symbols": 1})
+    cache = ResponseCache(ttl=10, stale_ttl=60, clock=clock)
+    breaker = CircuitBreaker(failure_threshold=1)
+
+    async def main():
+        async with async_stub_client(cache=cache, breaker=breaker) as client:
+            await client.get(endpoint)
+            _trip(breaker, endpoint, failures=1)
+            clock.now = 20
+            stale = await client.get(endpoint)
+            await asyncio.gather(*client._refreshes)
+            return stale
+
+    assert asyncio.run(main()) == {"symbols": 1}
+    assert len(stub_server.requests) == 1
+    assert cache.claim_refresh(stub_server.url + endpoint)
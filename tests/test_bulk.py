@@ -0,0 +1,165 @@
+import asyncio
+import threading
+import time
+
+import responses
+
+from pywormholescan import AsyncWormholescanAPI, BulkResult, Network, WormholescanAPI
+from pywormholescan._internal.bulk import aget_many, get_many
+
+EMITTER = "ec7372995d5cc8732397fb0ad35c0121e0eaa90d26f828a534cab54391b3a4f5"
+
+
+def _fetch(calls, fail=()):
+    lock = threading.Lock()
+
+    def fetch(chain, emitter, seq):
+        with lock:
+            calls.append((chain, emitter, seq))
+        if seq in fail:
+            raise ValueError(f"no VAA {seq}")
+        return {"data": {"id": f"{chain}/{emitter}/{seq}"}}
+
+    return fetch
+
+
+def test_results_in_input_order_with_per_item_errors():
+    calls = []
+    ids = [(1, EMITTER, 3), f"1/{EMITTER}/1", (1, EMITTER, 2)]
+
+    results = get_many(_fetch(calls, fail={1}), ids)
+
+    assert [result.id for result in results] == [
+        (1, EMITTER, 3),
+        (1, EMITTER, 1),
+        (1, EMITTER, 2),
+    ]
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].value == {"data": {"id": f"1/{EMITTER}/3"}}
+    assert isinstance(results[1].error, ValueError)
+    assert sorted(calls) == [(1, EMITTER, 1), (1, EMITTER, 2), (1, EMITTER, 3)]
+
+
+def test_duplicates_are_fetched_once():
+    calls = []
+    ids = [(2, EMITTER, 5), f"2/{EMITTER.upper()}/5", ("2", EMITTER, "5")]
+
+    results = get_many(_fetch(calls), ids)
+
+    assert calls == [(2, EMITTER, 5)]
+    assert len(results) == 3
+    assert results[0] is results[1] is results[2]
+
+
+def test_concurrency_is_bounded():
+    in_flight = []
+    peak = []
+    lock = threading.Lock()
+
+    def fetch(chain, emitter, seq):
+        with lock:
+            in_flight.append(seq)
+            peak.append(len(in_flight))
+        time.sleep(0.01)
+        with lock:
+            in_flight.remove(seq)
+        return seq
+
+    results = get_many(fetch, [(1, EMITTER, seq) for seq in range(20)], concurrency=3)
+
+    assert [result.value for result in results] == list(range(20))
+    assert max(peak) == 3
+
+
+def test_stream_yields_each_id_as_it_completes():
+    def fetch(chain, emitter, seq):
+        time.sleep(seq / 100)
+        return seq
+
+    ids = [(1, EMITTER, 3), (1, EMITTER, 1), (1, EMITTER, 1), (1, EMITTER, 2)]
+    streamed = get_many(fetch, ids, stream=True)
+
+    assert not isinstance(streamed, list)
+    assert [result.value for result in streamed] == [1, 2, 3]
+
+
+def test_malformed_ids_fail_alone():
+    calls = []
+    ids = ["1/only-two", (1, EMITTER, 1), (1, EMITTER, "x"), None]
+
+    results = get_many(_fetch(calls), ids)
+    streamed = list(get_many(_fetch([]), ids, stream=True))
+
+    assert [result.ok for result in results] == [False, True, False, False]
+    assert [result.id for result in results] == [
+        ("1/only-two",),
+        (1, EMITTER, 1),
+        (1, EMITTER, "x"),
+        (None,),
+    ]
+    assert isinstance(results[0].error, ValueError)
+    assert isinstance(results[3].error, TypeError)
+    assert calls == [(1, EMITTER, 1)]
+    assert [result.ok for result in streamed] == [False, False, False, True]
+
+
+def test_aget_many():
+    calls = []
+    fetch = _fetch(calls, fail={2})
+
+    async def afetch(*vaa_id):
+        await asyncio.sleep(0)
+        return fetch(*vaa_id)
+
+    async def main():
+        ids = [(1, EMITTER, 2), (1, EMITTER, 1), (1, EMITTER, 2), "bad"]
+        results = await aget_many(afetch, ids, concurrency=1)
+        streamed = [result async for result in aget_many(afetch, ids, stream=True)]
+        return results, streamed
+
+    results, streamed = asyncio.run(main())
+
+    assert [result.ok for result in results] == [False, True, False, False]
+    assert results[3].id == ("bad",)
+    assert streamed[0].id == ("bad",)
+    assert sorted(result.id for result in streamed[1:]) == [
+        (1, EMITTER, 1),
+        (1, EMITTER, 2),
+    ]
+
+
+@responses.activate
+def test_facade_get_many_vaas_by_id():
+    api = WormholescanAPI(Network.MAINNET)
+    for seq in (1, 2):
+        responses.add(
+            responses.GET,
+            f"{api.base_url}/api/v1/vaas/1/{EMITTER}/{seq}",
+            json={"data": {"sequence": seq}},
+        )
+    responses.add(
+        responses.GET, f"{api.base_url}/api/v1/vaas/1/{EMITTER}/3", status=404
+    )
+
+    results = api.get_many_vaas_by_id([(1, EMITTER, seq) for seq in (2, 3, 1)])
+
+    assert all(isinstance(result, BulkResult) for result in results)
+    assert [result.ok for result in results] == [True, False, True]
+    assert results[0].value["data"]["sequence"] == 2
+    assert results[2].value["data"]["sequence"] == 1
+
+
+def test_async_facade_get_many_operations_by_id(stub_server):
+    for seq in (1, 2):
+        stub_server.add(f"/api/v1/operations/1/{EMITTER}/{seq}", json={"sequence": seq})
+
+    async def main():
+        async with AsyncWormholescanAPI(Network.MAINNET) as api:
+            api._api_client.base_url = stub_server.url
+            return await api.get_many_operations_by_id(
+                [f"1/{EMITTER}/2", f"1/{EMITTER}/1"]
+            )
+
+    results = asyncio.run(main())
+
+    assert [result.value["sequence"] for result in results] == [2, 1]
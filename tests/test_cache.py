@@ -0,0 +1,257 @@
+import asyncio
+import time
+
+import pytest
+import requests
+import responses
+
+from pywormholescan import AsyncAPIClient, Network, ResponseCache
+from pywormholescan._internal import APIClient
+
+
+def test_get_and_expire(clock):
+    cache = ResponseCache(ttl=10, clock=clock)
+    cache.set("a", b"1", cache.ttl_for("/api/v1/health"))
+
+    assert cache.get("a") == b"1"
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_per_endpoint_ttls():
+    cache = ResponseCache(
+        ttl=5, ttls={"/api/v1/vaas": 0, "/api/v1/vaas/vaa-counts": 300}
+    )
+
+    assert cache.ttl_for("/api/v1/scorecards") == 5
+    assert cache.ttl_for("/api/v1/vaas/2") == 0
+    assert cache.ttl_for("/api/v1/vaas/vaa-counts") == 300
+
+
+def test_lru_eviction_by_entries():
+    cache = ResponseCache(max_entries=2)
+    cache.set("a", b"1", 60)
+    cache.set("b", b"2", 60)
+    cache.get("a")
+    cache.set("c", b"3", 60)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.stats()["evictions"] == 1
+
+
+def test_lru_eviction_by_bytes():
+    cache = ResponseCache(max_bytes=10)
+    cache.set("a", b"12345", 60)
+    cache.set("b", b"12345", 60)
+    cache.set("c", b"123", 60)
+    cache.set("huge", b"x" * 11, 60)
+
+    assert cache.get("a") is None
+    assert cache.get("huge") is None
+    assert cache.stats()["bytes"] == 8
+
+
+def test_stats_counts_hits_and_misses():
+    cache = ResponseCache()
+    cache.get("a")
+    cache.set("a", b"1", 60)
+    cache.get("a")
+    cache.get("a")
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (2, 1)
+    assert stats["hit_ratio"] == 2 / 3
+
+
+@responses.activate
+def test_api_client_serves_repeated_calls_from_cache():
+    cache = ResponseCache(ttl=60)
+    client = APIClient(Network.MAINNET, cache=cache)
+    responses.add(
+        responses.GET, f"{client.base_url}/api/v1/scorecards", json={"tvl": "1"}
+    )
+
+    first = client.get("/api/v1/scorecards")
+    first["tvl"] = "mutated"
+    assert client.get("/api/v1/scorecards") == {"tvl": "1"}
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_api_client_keys_on_full_url():
+    client = APIClient(Network.MAINNET, cache=ResponseCache(ttl=60))
+    responses.add(
+        responses.GET,
+        f"{client.base_url}/api/v1/top-100-corridors?timeSpan=2d",
+        json={"corridors": []},
+    )
+    responses.add(
+        responses.GET,
+        f"{client.base_url}/api/v1/top-100-corridors?timeSpan=7d",
+        json={"corridors": [1]},
+    )
+
+    assert client.get_with_url_builder(
+        "/api/v1/top-100-corridors", kwargs={"time_span": "2d"}
+    ) == {"corridors": []}
+    assert client.get_with_url_builder(
+        "/api/v1/top-100-corridors", kwargs={"time_span": "7d"}
+    ) == {"corridors": [1]}
+    assert len(responses.calls) == 2
+
+
+@responses.activate
+def test_api_client_does_not_cache_errors():
+    client = APIClient(Network.MAINNET, cache=ResponseCache(ttl=60))
+    responses.add(responses.GET, f"{client.base_url}/api/v1/health", status=503)
+    responses.add(
+        responses.GET, f"{client.base_url}/api/v1/health", json={"status": "OK"}
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get("/api/v1/health")
+    assert client.get("/api/v1/health") == {"status": "OK"}
+
+
+def test_async_api_client_uses_cache(stub_server):
+    stub_server.add("/api/v1/vaas/vaa-counts", json={"data": []})
+
+    async def main():
+        async with AsyncAPIClient(Network.MAINNET, cache=ResponseCache()) as client:
+            client.base_url = stub_server.url
+            await client.get("/api/v1/vaas/vaa-counts")
+            return await client.get("/api/v1/vaas/vaa-counts")
+
+    assert asyncio.run(main()) == {"data": []}
+    assert len(stub_server.requests) == 1
+
+
+def test_stale_window(clock):
+    cache = ResponseCache(stale_ttls={"/api/v1/top-": 50}, clock=clock)
+    cache.set("a", b"1", 10, cache.stale_ttl_for("/api/v1/top-symbols-by-volume"))
+
+    assert cache.lookup("a") == (b"1", False)
+    clock.now = 30
+    assert cache.lookup("a") == (b"1", True)
+    assert cache.get("a") is None
+    clock.now = 60
+    assert cache.lookup("a") == (None, False)
+    assert cache.stats()["stale_hits"] == 1
+    assert cache.stale_ttl_for("/api/v1/scorecards") == 0
+
+
+def test_one_refresh_claim_per_key():
+    cache = ResponseCache()
+
+    assert cache.claim_refresh("a")
+    assert not cache.claim_refresh("a")
+    cache.release_refresh("a")
+    assert cache.claim_refresh("a")
+
+
+def test_clear_drops_refresh_claims():
+    cache = ResponseCache()
+    cache.claim_refresh("a")
+
+    cache.clear()
+
+    assert cache.claim_refresh("a")
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_api_client_serves_stale_while_refreshing(stub_server, clock):
+    endpoint = "/api/v1/top-symbols-by-volume?timeSpan=7d"
+    stub_server.add(endpoint, json={"symbols": 1})
+    cache = ResponseCache(ttl=10, stale_ttl=60, clock=clock)
+    client = APIClient(Network.MAINNET, cache=cache)
+    client.base_url = stub_server.url
+    client.get(endpoint)
+
+    stub_server.add(endpoint, json={"symbols": 2}, delay=0.5)
+    clock.now = 20
+    start = time.perf_counter()
+    stale = [client.get(endpoint) for _ in range(5)]
+
+    assert time.perf_counter() - start < 0.5
+    assert stale == [{"symbols": 1}] * 5
+    _wait_for(lambda: cache.lookup(stub_server.url + endpoint)[1] is False)
+    assert client.get(endpoint) == {"symbols": 2}
+    assert len(stub_server.requests) == 2
+
+
+def test_api_client_close_waits_for_refreshes(stub_server, clock):
+    endpoint = "/api/v1/top-symbols-by-volume?timeSpan=7d"
+    stub_server.add(endpoint, json={"symbols": 1})
+    cache = ResponseCache(ttl=10, stale_ttl=60, clock=clock)
+    client = APIClient(Network.MAINNET, cache=cache)
+    client.base_url = stub_server.url
+    client.get(endpoint)
+
+    stub_server.add(endpoint, json={"symbols": 2}, delay=0.2)
+    clock.now = 20
+    assert client.get(endpoint) == {"symbols": 1}
+    client.close()
+
+    assert not client._refreshes
+    assert cache.lookup(stub_server.url + endpoint) == (b'{"symbols": 2}', False)
+
+
+def test_api_client_blocks_past_the_stale_window(stub_server, clock):
+    stub_server.add("/api/v1/x-chain-activity", json={"txs": 1})
+    client = APIClient(
+        Network.MAINNET, cache=ResponseCache(ttl=10, stale_ttl=5, clock=clock)
+    )
+    client.base_url = stub_server.url
+    client.get("/api/v1/x-chain-activity")
+
+    stub_server.add("/api/v1/x-chain-activity", json={"txs": 2})
+    clock.now = 15
+
+    assert client.get("/api/v1/x-chain-activity") == {"txs": 2}
+
+
+def test_failed_refresh_keeps_the_stale_body(stub_server, clock):
+    stub_server.add("/api/v1/top-assets-by-volume", json={"assets": 1})
+    cache = ResponseCache(ttl=10, stale_ttl=60, clock=clock)
+    client = APIClient(Network.MAINNET, cache=cache)
+    client.base_url = stub_server.url
+    client.get("/api/v1/top-assets-by-volume")
+
+    stub_server.add("/api/v1/top-assets-by-volume", status=503, json={})
+    clock.now = 20
+    assert client.get("/api/v1/top-assets-by-volume") == {"assets": 1}
+    _wait_for(
+        lambda: cache.claim_refresh(stub_server.url + "/api/v1/top-assets-by-volume")
+    )
+
+    assert client.get("/api/v1/top-assets-by-volume") == {"assets": 1}
+
+
+def test_async_api_client_refreshes_stale_once(stub_server, clock):
+    endpoint = "/api/v1/top-chain-pairs-by-num-transfers?timeSpan=7d"
+    stub_server.add(endpoint, json={"pairs": 1})
+    cache = ResponseCache(ttl=10, stale_ttl=60, clock=clock)
+
+    async def main():
+        async with AsyncAPIClient(Network.MAINNET, cache=cache) as client:
+            client.base_url = stub_server.url
+            await client.get(endpoint)
+            stub_server.add(endpoint, json={"pairs": 2}, delay=0.2)
+            clock.now = 20
+            stale = await asyncio.gather(*(client.get(endpoint) for _ in range(10)))
+            await asyncio.gather(*client._refreshes)
+            return stale, await client.get(endpoint)
+
+    stale, fresh = asyncio.run(main())
+
+    assert stale == [{"pairs": 1}] * 10
+    assert fresh == {"pairs": 2}
+    assert len(stub_server.requests) == 2
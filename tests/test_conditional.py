@@ -0,0 +1,132 @@
+import asyncio
+
+from pywormholescan import (
+    AsyncWormholescanAPI,
+    GuardianAPI,
+    ResponseCache,
+    WormholescanAPI,
+)
+from pywormholescan._internal import ConditionalCache
+
+SCORECARDS = {"24h_messages": "1523434", "tvl": "3112367843.12", "pad": "x" * 2000}
+
+
+def test_headers_follow_stored_validators():
+    cache = ConditionalCache()
+    assert cache.headers("a") == {}
+
+    cache.update("a", {"ETag": '"v1"', "Last-Modified": "Mon"}, b"body")
+    assert cache.headers("a") == {"If-None-Match": '"v1"', "If-Modified-Since": "Mon"}
+
+    cache.update("a", {}, b"body")
+    assert cache.headers("a") == {}
+
+
+def test_bounded_by_size():
+    cache = ConditionalCache(max_entries=2, max_bytes=10)
+    for key in ("a", "b", "c"):
+        cache.update(key, {"ETag": key}, b"1234")
+
+    assert len(cache) == 2
+    assert cache.headers("a") == {}
+    assert cache.stats()["evictions"] == 1
+
+
+def test_unchanged_responses_are_not_transferred_again(stub_server, stub_client):
+    stub_server.add("/api/v1/scorecards", json=SCORECARDS, headers={"ETag": '"v1"'})
+    size = len(stub_server.routes["/api/v1/scorecards"][1])
+    api = WormholescanAPI(api_client=stub_client(conditional=ConditionalCache()))
+
+    assert [api.get_scorecards() for _ in range(5)] == [SCORECARDS] * 5
+
+    assert stub_server.bytes_sent == size
+    assert stub_server.requests[-1][2]["If-None-Match"] == '"v1"'
+    assert api._api_client.conditional.stats() == {
+        "hits": 4,
+        "misses": 0,
+        "hit_ratio": 1.0,
+        "bytes_saved": 4 * size,
+        "evictions": 0,
+        "entries": 1,
+        "bytes": size,
+    }
+
+
+def test_changed_response_replaces_the_stored_body(stub_server, stub_client):
+    route = "/v1/governor/token_list"
+    stub_server.add(route, json={"tokens": [1]}, headers={"ETag": '"v1"'})
+    guardian = GuardianAPI(api_client=stub_client(conditional=ConditionalCache()))
+    guardian.get_guardians_token_list()
+
+    stub_server.add(route, json={"tokens": [1, 2]}, headers={"ETag": '"v2"'})
+
+    assert guardian.get_guardians_token_list() == {"tokens": [1, 2]}
+    assert guardian.get_guardians_token_list() == {"tokens": [1, 2]}
+    stats = guardian._api_client.conditional.stats()
+    assert (stats["hits"], stats["misses"], stats["hit_ratio"]) == (1, 1, 0.5)
+
+
+def test_last_modified(stub_server, stub_client):
+    stamp = "Wed, 21 Oct 2015 07:28:00 GMT"
+    stub_server.add(
+        "/api/v1/vaas/vaa-counts", json={"data": []}, headers={"Last-Modified": stamp}
+    )
+    client = stub_client(conditional=ConditionalCache())
+
+    client.get("/api/v1/vaas/vaa-counts")
+    client.get("/api/v1/vaas/vaa-counts")
+
+    assert stub_server.requests[-1][2]["If-Modified-Since"] == stamp
+    assert client.conditional.hits == 1
+
+
+class _EvictingCache(ConditionalCache):
+    """Loses every entry right after handing out its validators."""
+
+    def headers(self, key):
+        headers = super().headers(key)
+        self.clear()
+        return headers
+
+
+def test_evicted_body_is_fetched_again(stub_server, stub_client):
+    stub_server.add("/api/v1/protocols/stats", json=[1], headers={"ETag": '"v1"'})
+    client = stub_client(conditional=ConditionalCache())
+    client.conditional = _EvictingCache()
+    client.get("/api/v1/protocols/stats")
+
+    assert client.get("/api/v1/protocols/stats") == [1]
+    assert [request[2].get("If-None-Match") for request in stub_server.requests] == [
+        None,
+        '"v1"',
+        None,
+    ]
+
+
+def test_works_behind_the_response_cache(stub_server, stub_client):
+    stub_server.add("/api/v1/scorecards", json=SCORECARDS, headers={"ETag": '"v1"'})
+    client = stub_client(conditional=ConditionalCache(), cache=ResponseCache(ttl=60))
+
+    client.get("/api/v1/scorecards")
+    client.get("/api/v1/scorecards")
+    client.cache.clear()
+    client.get("/api/v1/scorecards")
+
+    assert len(stub_server.requests) == 2
+    assert client.conditional.hits == 1
+
+
+def test_async_client(stub_server, async_stub_client):
+    stub_server.add("/api/v1/scorecards", json=SCORECARDS, headers={"ETag": '"v1"'})
+
+    async def main():
+        client = async_stub_client(conditional=ConditionalCache())
+        async with AsyncWormholescanAPI(api_client=client) as api:
+            results = [await api.get_scorecards() for _ in range(3)]
+        await client.close()
+        return results, client.conditional.stats()
+
+    results, stats = asyncio.run(main())
+
+    assert results == [SCORECARDS] * 3
+    assert stats["hits"] == 2
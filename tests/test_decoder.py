@@ -0,0 +1,96 @@
+import json
+import sys
+
+import pytest
+import responses
+
+from pywormholescan import Network
+from pywormholescan._internal import APIClient, get_decoder
+
+PAYLOAD = b'{"data": [{"id": "2/abc/1", "amount": 123456789012345678901234567890}]}'
+
+
+def test_default_decoder_prefers_fast_backend(mocker):
+    orjson = pytest.importorskip("orjson")
+    loads = mocker.patch.object(orjson, "loads", wraps=orjson.loads)
+
+    assert get_decoder()(b'{"sequence": 90116}') == {"sequence": 90116}
+    assert loads.call_count == 1
+
+
+@pytest.mark.parametrize("name", [None, "orjson", "msgspec"])
+def test_fast_backends_keep_big_integers(name):
+    if name is not None:
+        pytest.importorskip(name)
+    decoded = get_decoder(name)(PAYLOAD)
+
+    assert decoded["data"][0]["amount"] == 123456789012345678901234567890
+    assert get_decoder(name)(b"[18446744073709551616]") == [2**64]
+
+
+@pytest.mark.parametrize("name", ["orjson", "msgspec"])
+def test_fast_backends_decode_vaa_pages(name, mocker):
+    pytest.importorskip(name)
+    loads = mocker.patch("json.loads", wraps=json.loads)
+    emitter = "0000000000000000000000003ee18b2214aff97000d974cf647e7c347e8fa585"
+    page = {
+        "data": [
+            {
+                "id": f"2/{emitter}/90116",
+                "sequence": 90116,
+                "emitterChain": 2,
+                "emitterAddr": emitter,
+                "timestamp": "2024-03-01T12:00:00Z",
+                "payload": {"amount": "1000000000000000000000", "tokenChain": 2},
+            }
+        ],
+        "pagination": {"next": ""},
+    }
+
+    assert get_decoder(name)(json.dumps(page).encode()) == page
+    assert get_decoder(name)(json.dumps(page, indent=2).encode()) == page
+    loads.assert_not_called()
+    assert get_decoder(name)(b'{"data": [\n  -10000000000000000000\n]}') == {
+        "data": [-(10**19)]
+    }
+    assert loads.call_count == 1
+
+
+def test_default_decoder_falls_back_to_stdlib(mocker):
+    mocker.patch.dict(sys.modules, {"orjson": None, "msgspec": None})
+    assert get_decoder() is json.loads
+
+
+def test_stdlib_backend_keeps_big_integers():
+    assert (
+        get_decoder("json")(PAYLOAD)["data"][0]["amount"]
+        == 123456789012345678901234567890
+    )
+
+
+def test_unknown_decoder():
+    with pytest.raises(ValueError):
+        get_decoder("yaml")
+
+
+def test_missing_decoder(mocker):
+    mocker.patch.dict(sys.modules, {"msgspec": None})
+    with pytest.raises(ImportError):
+        get_decoder("msgspec")
+
+
+@responses.activate
+def test_api_client_uses_custom_decoder():
+    calls = []
+
+    def decoder(content):
+        calls.append(content)
+        return json.loads(content)
+
+    client = APIClient(Network.MAINNET, decoder=decoder)
+    responses.add(
+        responses.GET, f"{client.base_url}/api/v1/health", json={"status": "OK"}
+    )
+
+    assert client.get("/api/v1/health") == {"status": "OK"}
+    assert calls == [b'{"status": "OK"}']
@@ -0,0 +1,101 @@
+import json
+
+import pytest
+import responses
+
+from pywormholescan import APIClient, Network, WormholescanAPI
+from pywormholescan._internal import LazyArray, LazyObject
+from pywormholescan._internal.decoder import get_decoder
+from pywormholescan._internal.lazy import lazy_view
+
+RECORDS = [
+    {"id": "a", "sequence": 1, "payload": {"text": 'brackets ] } and "quotes"'}},
+    {"id": "b", "sequence": 2, "tags": [1, [2, 3], {"x": None}]},
+    {"id": "c", "sequence": 3, "ok": True, "fee": -1.5e3, "path": "C:\\"},
+    {"id": "d", "sequence": 4, "note": "]}{[ unescaped", "nested": {"a": ["}"]}},
+]
+
+
+def _view(value, indent=None):
+    return lazy_view(json.dumps(value, indent=indent).encode(), get_decoder("json"))
+
+
+@pytest.mark.parametrize("indent", [None, 2])
+def test_array_matches_decoded(indent):
+    view = _view(RECORDS, indent)
+
+    assert isinstance(view, LazyArray)
+    assert len(view) == 4
+    assert [dict(record) for record in view] == RECORDS
+    assert view[2]["fee"] == -1500.0
+    assert [record["id"] for record in view[1:]] == ["b", "c", "d"]
+
+
+def test_index_out_of_range():
+    with pytest.raises(IndexError):
+        _view(RECORDS)[4]
+
+
+def test_empty_containers():
+    assert len(_view([])) == 0
+    assert dict(_view({})) == {}
+    assert _view({"data": []})["data"] == []
+
+
+def test_scalars_are_decoded():
+    assert _view(7) == 7
+    assert _view("x") == "x"
+
+
+def test_large_object_is_walked_lazily(monkeypatch):
+    page = {"pagination": {"next": 1}, "data": RECORDS * 200}
+    monkeypatch.setattr("pywormholescan._internal.lazy.EAGER_BYTES", 64)
+    view = _view(page)
+
+    assert isinstance(view, LazyObject)
+    assert sorted(view) == ["data", "pagination"]
+    assert view["pagination"]["next"] == 1
+    assert isinstance(view["data"], LazyArray)
+    assert view["data"][401]["sequence"] == 2
+    with pytest.raises(KeyError):
+        view["missing"]
+    assert view.get("missing") is None
+    assert view.decode() == page
+
+
+def test_iteration_scans_only_what_is_consumed():
+    view = _view(RECORDS)
+
+    assert next(iter(view))["id"] == "a"
+    assert len(view._spans) == 1
+
+
+def test_raw_returns_element_bytes():
+    assert json.loads(_view(RECORDS)[1].raw) == RECORDS[1]
+
+
+def test_truncated_document():
+    view = lazy_view(b'[{"id": "a"', get_decoder("json"))
+
+    with pytest.raises(ValueError):
+        view[0]
+
+
+@responses.activate
+def test_lazy_client_through_facade():
+    api = WormholescanAPI(api_client=APIClient(Network.MAINNET, lazy=True))
+    responses.add(
+        responses.GET,
+        f"{api.base_url}/api/v1/vaas?page=0&pageSize=3",
+        json={"data": RECORDS[:3]},
+    )
+    responses.add(
+        responses.GET,
+        f"{api.base_url}/api/v1/vaas?page=1&pageSize=3",
+        json={"data": []},
+    )
+
+    page = api.get_all_vaas(page=0, page_size=3)
+    assert isinstance(page, LazyObject)
+    assert [record["id"] for record in page["data"]] == ["a", "b", "c"]
+    assert [r["sequence"] for r in api.iter_all_vaas(page_size=3)] == [1, 2, 3]
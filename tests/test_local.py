@@ -0,0 +1,174 @@
+import pytest
+import responses
+
+from pywormholescan import LocalWormholescanAPI, Network, RecordStore
+from pywormholescan.models import VAA, Observation
+
+EMITTER = "0000000000000000000000003ee18b2214aff97000d974cf647e7c347e8fa585"
+BASE_URL = Network.MAINNET.value
+
+
+def _vaa(seq, chain=2):
+    return {
+        "id": f"{chain}/{EMITTER}/{seq}",
+        "emitterChain": chain,
+        "emitterAddr": EMITTER,
+        "sequence": seq,
+        "txHash": f"tx{seq}",
+        "timestamp": f"2024-03-01T00:00:{seq:02d}Z",
+    }
+
+
+def _transaction(seq):
+    return {"id": f"2/{EMITTER}/{seq}", "txHash": f"tx{seq}", "symbol": "WETH"}
+
+
+def _observation(seq, signer):
+    return {
+        "id": f"2/{EMITTER}/{seq}/{signer}/hash",
+        "emitterChain": 2,
+        "emitterAddr": EMITTER,
+        "sequence": str(seq),
+        "guardianAddr": signer,
+    }
+
+
+@pytest.fixture
+def store(tmp_path):
+    with RecordStore(str(tmp_path / "mirror.db")) as store:
+        store.save_vaas([_vaa(seq) for seq in range(5)], shard="vaas/2", done=True)
+        store.save_vaas([_vaa(9, chain=4)], shard="vaas/4", done=True)
+        store.save("transactions", [_transaction(1)])
+        store.save(
+            "observations",
+            [_observation(1, "0xa"), _observation(1, "0xb")],
+            shard=f"observations/2/{EMITTER}/1",
+            done=True,
+        )
+        yield store
+
+
+@pytest.fixture
+def local(store):
+    return LocalWormholescanAPI(store, Network.MAINNET)
+
+
+@responses.activate
+def test_get_vaa_by_id_from_store(local):
+    assert local.get_vaa_by_id(2, EMITTER.upper(), 3) == {"data": _vaa(3)}
+    assert local.local_hits == 1
+    assert len(responses.calls) == 0
+
+
+@responses.activate
+def test_get_vaa_by_id_falls_back_and_writes_back(local, store):
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/vaas/2/{EMITTER}/7",
+        json={"data": _vaa(7)},
+    )
+
+    assert local.get_vaa_by_id(2, EMITTER, 7) == {"data": _vaa(7)}
+    assert local.get_vaa_by_id(2, EMITTER, 7) == {"data": _vaa(7)}
+    assert len(responses.calls) == 1
+    assert local.local_misses == 1
+    assert store.count() == 7
+
+
+@responses.activate
+def test_unindexed_parameters_go_remote(local):
+    responses.add(
+        responses.GET,
+        f"{BASE_URL}/api/v1/vaas/2/{EMITTER}?toChain=4",
+        json={"data": []},
+    )
+
+    assert local.get_vaas_by_emitter(2, EMITTER, to_chain=4) == {"data": []}
+    assert len(responses.calls) == 1
+
+
+def test_get_vaas_by_emitter_pages(local):
+    first = local.get_vaas_by_emitter(2, EMITTER, page_size=2, sort_order="ASC")
+    second = local.get_vaas_by_emitter(
+        2, EMITTER, page=1, page_size=2, sort_order="ASC"
+    )
+
+    assert [vaa["sequence"] for vaa in first["data"]] == [0, 1]
+    assert [vaa["sequence"] for vaa in second["data"]] == [2, 3]
+    assert local.local_hits == 2
+
+
+def test_get_vaas_by_chain_sorts_by_timestamp(store):
+    late = dict(_vaa(5, chain=4), timestamp="2024-03-01T00:00:00Z")
+    store.save_vaas([late], shard="vaas/4", done=True)
+    local = LocalWormholescanAPI(store, Network.MAINNET)
+
+    page = local.get_vaas_by_chain(4, page_size=2, sort_order="ASC")
+    assert [vaa["sequence"] for vaa in page["data"]] == [5, 9]
+
+
+@responses.activate
+def test_pages_the_store_cannot_prove_complete_go_remote(local, store):
+    newest = f"{BASE_URL}/api/v1/vaas/2/{EMITTER}?pageSize=2"
+    last = f"{BASE_URL}/api/v1/vaas/2/{EMITTER}?page=2&pageSize=2&sortOrder=ASC"
+    unfinished = f"{BASE_URL}/api/v1/vaas/4?pageSize=1&sortOrder=ASC"
+    for url in (newest, last, unfinished):
+        responses.add(responses.GET, url, json={"data": []})
+    store.save_vaas([], shard="vaas/4", next_page=1)
+
+    local.get_vaas_by_emitter(2, EMITTER, page_size=2)
+    local.get_vaas_by_emitter(2, EMITTER, page=2, page_size=2, sort_order="ASC")
+    local.get_vaas_by_chain(4, page_size=1, sort_order="ASC")
+    assert [call.request.url for call in responses.calls] == [newest, last, unfinished]
+    assert local.local_hits == 0
+
+
+@responses.activate
+def test_unfinished_mirror_goes_remote(tmp_path):
+    responses.add(
+        responses.GET, f"{BASE_URL}/api/v1/vaas?txHash=tx1", json={"data": [_vaa(1)]}
+    )
+    with RecordStore(str(tmp_path / "partial.db")) as store:
+        store.save_vaas([_vaa(1)])
+        local = LocalWormholescanAPI(store, Network.MAINNET)
+
+        assert local.get_all_vaas(tx_hash="tx1") == {"data": [_vaa(1)]}
+        assert local.local_misses == 1
+
+
+def test_get_all_vaas_by_tx_hash(local):
+    assert local.get_all_vaas(tx_hash="tx2") == {"data": [_vaa(2)]}
+
+
+def test_get_transaction_by_id(local):
+    assert local.get_transaction_by_id(2, EMITTER, 1) == _transaction(1)
+
+
+def test_get_observations_by_sequence(local):
+    observations = local.get_observations_by_sequence(2, EMITTER, 1)
+
+    assert sorted(o["guardianAddr"] for o in observations) == ["0xa", "0xb"]
+
+
+@responses.activate
+def test_observations_are_served_locally_once_listed_in_full(local):
+    url = f"{BASE_URL}/api/v1/observations/2/{EMITTER}/2"
+    responses.add(responses.GET, url, json=[_observation(2, "0xa")])
+
+    assert local.get_observations_by_sequence(2, EMITTER, 2) == [_observation(2, "0xa")]
+    assert local.get_observations_by_sequence(2, EMITTER, 2) == [_observation(2, "0xa")]
+    assert len(responses.calls) == 1
+
+
+def test_models(store):
+    local = LocalWormholescanAPI(store, Network.MAINNET, models=True)
+
+    assert isinstance(local.get_vaa_by_id(2, EMITTER, 3)["data"], VAA)
+    assert isinstance(local.get_observations_by_sequence(2, EMITTER, 1)[0], Observation)
+
+
+def test_miss_without_fallback(store):
+    local = LocalWormholescanAPI(store, Network.MAINNET, fallback=False)
+
+    with pytest.raises(KeyError):
+        local.get_transaction_by_id(2, EMITTER, 99)
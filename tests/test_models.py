@@ -0,0 +1,182 @@
+import asyncio
+import json
+
+import pytest
+import responses
+
+from pywormholescan import (
+    AsyncWormholescanAPI,
+    GuardianAPI,
+    Network,
+    WormholescanAPI,
+)
+from pywormholescan._internal import APIClient
+from pywormholescan.models import VAA, Heartbeat, Observation, Transaction, to_models
+
+VAA_RECORD = {
+    "id": "2/0000000000000000000000003ee18b2214aff97000d974cf647e7c347e8fa585/1",
+    "sequence": 1,
+    "emitterChain": 2,
+    "emitterAddr": "0000000000000000000000003ee18b2214aff97000d974cf647e7c347e8fa585",
+    "guardianSetIndex": 4,
+    "timestamp": "2024-03-01T12:00:00Z",
+    "payload": {"payloadType": 1},
+}
+
+
+def test_from_dict_maps_keys_to_attributes():
+    vaa = VAA.from_dict(VAA_RECORD)
+
+    assert vaa.id == VAA_RECORD["id"]
+    assert vaa.emitter_chain == 2
+    assert vaa.guardian_set_index == 4
+    assert vaa.payload == {"payloadType": 1}
+    assert vaa.tx_hash is None
+    assert vaa.extra is None
+
+
+def test_models_have_no_instance_dict():
+    vaa = VAA.from_dict(VAA_RECORD)
+
+    assert not hasattr(vaa, "__dict__")
+    with pytest.raises(AttributeError):
+        vaa.unknown = 1
+
+
+def test_unknown_keys_are_kept_in_extra():
+    observation = Observation.from_dict({"id": "x", "newField": 7})
+
+    assert observation.extra == {"newField": 7}
+    assert observation["newField"] == 7
+    assert observation.to_dict() == {"id": "x", "newField": 7}
+
+
+def test_item_access_by_json_key():
+    vaa = VAA.from_dict(VAA_RECORD)
+
+    assert vaa["emitterChain"] == 2
+    assert vaa.get("txHash") is None
+    assert vaa.get("txHash", "-") == "-"
+    with pytest.raises(KeyError):
+        vaa["missing"]
+
+
+def test_repeated_addresses_are_shared():
+    first, second = (
+        Observation.from_dict(record)
+        for record in json.loads(
+            '[{"emitterAddr": "3ee18b22", "guardianAddr": null},'
+            ' {"emitterAddr": "3ee18b22"}]'
+        )
+    )
+
+    assert first.emitter_addr is second.emitter_addr
+    assert first["guardianAddr"] is None
+
+
+def test_null_values_are_kept():
+    vaa = VAA.from_dict({"id": "x", "txHash": None})
+
+    assert vaa.tx_hash is None
+    assert vaa["txHash"] is None
+    assert vaa.get("txHash", "-") is None
+    assert vaa.get("digest", "-") == "-"
+    with pytest.raises(KeyError):
+        vaa["digest"]
+    assert vaa.to_dict() == {"id": "x", "txHash": None}
+
+
+def test_to_dict_round_trips():
+    assert VAA.from_dict(VAA_RECORD).to_dict() == VAA_RECORD
+    assert VAA.from_dict(VAA_RECORD) == VAA.from_dict(dict(VAA_RECORD))
+
+
+def test_to_models_keeps_envelope():
+    page = {"data": [VAA_RECORD], "pagination": {"next": ""}}
+
+    converted = to_models(page, VAA, "data")
+
+    assert converted["pagination"] == {"next": ""}
+    assert isinstance(converted["data"][0], VAA)
+    assert page["data"][0] is VAA_RECORD
+
+
+def test_to_models_bare_list_and_single_record():
+    assert isinstance(to_models([{"id": "x"}], Observation)[0], Observation)
+    assert isinstance(to_models({"id": "x"}, Transaction), Transaction)
+    assert to_models({"error": "x"}, VAA, "data") == {"error": "x"}
+
+
+@responses.activate
+def test_facade_returns_models():
+    api = WormholescanAPI(Network.MAINNET, models=True)
+    responses.add(
+        responses.GET, f"{api.base_url}/api/v1/vaas", json={"data": [VAA_RECORD]}
+    )
+
+    result = api.get_all_vaas()
+
+    assert result["data"] == [VAA.from_dict(VAA_RECORD)]
+
+
+@responses.activate
+def test_facade_returns_dicts_by_default():
+    api = WormholescanAPI(Network.MAINNET)
+    responses.add(
+        responses.GET, f"{api.base_url}/api/v1/vaas", json={"data": [VAA_RECORD]}
+    )
+
+    assert api.get_all_vaas() == {"data": [VAA_RECORD]}
+
+
+def test_models_reject_lazy_clients():
+    client = APIClient(Network.MAINNET, lazy=True)
+
+    with pytest.raises(ValueError):
+        WormholescanAPI(api_client=client, models=True)
+    with pytest.raises(ValueError):
+        GuardianAPI(api_client=client, models=True)
+
+
+@responses.activate
+def test_iter_yields_models():
+    api = WormholescanAPI(Network.MAINNET, models=True)
+    responses.add(
+        responses.GET,
+        f"{api.base_url}/api/v1/observations?page=0&pageSize=2",
+        json=[{"id": "a"}, {"id": "b"}],
+    )
+    responses.add(
+        responses.GET,
+        f"{api.base_url}/api/v1/observations?page=1&pageSize=2",
+        json=[],
+    )
+
+    records = list(api.iter_observations(page_size=2))
+
+    assert [record.id for record in records] == ["a", "b"]
+
+
+@responses.activate
+def test_guardian_heartbeats_as_models():
+    api = GuardianAPI(Network.MAINNET, models=True)
+    entry = {"p2pNodeAddr": "12D3", "rawHeartbeat": {"nodeName": "a"}}
+    responses.add(
+        responses.GET, f"{api.base_url}/v1/heartbeats", json={"entries": [entry]}
+    )
+
+    heartbeat = api.get_guardians_hearbeats()["entries"][0]
+
+    assert isinstance(heartbeat, Heartbeat)
+    assert heartbeat.raw_heartbeat == {"nodeName": "a"}
+
+
+def test_async_facade_returns_models(stub_server):
+    stub_server.add("/api/v1/vaas", json={"data": [VAA_RECORD]})
+
+    async def main():
+        async with AsyncWormholescanAPI(Network.MAINNET, models=True) as api:
+            api._api_client.base_url = stub_server.url
+            return await api.get_all_vaas()
+
+    assert asyncio.run(main())["data"] == [VAA.from_dict(VAA_RECORD)]
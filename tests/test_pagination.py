@@ -0,0 +1,168 @@
+import asyncio
+import threading
+import time
+
+import pytest
+import responses
+
+from pywormholescan._internal.pagination import apaginate, extract_records, paginate
+
+
+def _pages(*pages):
+    calls = []
+
+    def fetch(page, page_size, **kwargs):
+        calls.append((page, page_size, kwargs))
+        return {"data": pages[page]} if page < len(pages) else {"data": []}
+
+    return fetch, calls
+
+
+@pytest.mark.parametrize(
+    "response, path, expected",
+    [
+        ([1, 2], ("data",), [1, 2]),
+        ({"data": [1]}, ("data",), [1]),
+        ({"data": {"vaas": [3]}}, ("data", "vaas"), [3]),
+        ({"transactions": None}, ("transactions",), []),
+        ({"data": []}, ("data", "vaas"), []),
+    ],
+)
+def test_extract_records(response, path, expected):
+    assert extract_records(response, path) == expected
+
+
+def test_paginate_stops_on_empty_page():
+    fetch, calls = _pages([1, 2], [3, 4], [5])
+
+    assert list(paginate(fetch, page_size=2, sort_order="ASC")) == [1, 2, 3, 4, 5]
+    assert calls == [(page, 2, {"sort_order": "ASC"}) for page in range(4)]
+
+
+def test_paginate_is_lazy():
+    fetch, calls = _pages([1, 2], [3, 4])
+    records = paginate(fetch, page_size=2)
+
+    assert calls == []
+    assert next(records) == 1
+    assert len(calls) == 1
+
+
+def test_paginate_max_items():
+    fetch, calls = _pages([1, 2], [3, 4], [5, 6])
+
+    assert list(paginate(fetch, page_size=2, max_items=3)) == [1, 2, 3]
+    assert len(calls) == 2
+
+
+def test_paginate_start_page():
+    fetch, calls = _pages([1], [2], [3])
+
+    assert list(paginate(fetch, page_size=1, page=1)) == [2, 3]
+
+
+@responses.activate
+def test_iter_vaas_by_chain(wormholescan):
+    url = f"{wormholescan.base_url}/api/v1/vaas/2"
+    for page, data in enumerate([[{"id": "a"}, {"id": "b"}], [{"id": "c"}], []]):
+        responses.add(
+            responses.GET,
+            f"{url}?page={page}&pageSize=2",
+            json={"data": data},
+            match=[
+                responses.matchers.query_param_matcher(
+                    {"page": str(page), "pageSize": "2"}
+                )
+            ],
+        )
+
+    records = list(wormholescan.iter_vaas_by_chain(2, page_size=2))
+    assert [r["id"] for r in records] == ["a", "b", "c"]
+
+
+@responses.activate
+def test_iter_observations_handles_bare_list(wormholescan):
+    responses.add(
+        responses.GET,
+        f"{wormholescan.base_url}/api/v1/observations",
+        json=[{"hash": "x"}],
+    )
+
+    records = list(wormholescan.iter_observations(page_size=5, max_items=1))
+    assert records == [{"hash": "x"}]
+
+
+@responses.activate
+def test_iter_address_walks_nested_records(wormholescan):
+    responses.add(
+        responses.GET,
+        f"{wormholescan.base_url}/api/v1/address/0x0",
+        json={"data": {"vaas": [{"id": "a"}]}},
+        match=[responses.matchers.query_param_matcher({"page": "0", "pageSize": "10"})],
+    )
+    responses.add(
+        responses.GET,
+        f"{wormholescan.base_url}/api/v1/address/0x0",
+        json={"data": {"vaas": []}},
+        match=[responses.matchers.query_param_matcher({"page": "1", "pageSize": "10"})],
+    )
+
+    assert list(wormholescan.iter_address("0x0", page_size=10)) == [{"id": "a"}]
+
+
+def test_prefetch_keeps_page_order():
+    pages = [[n, n + 1] for n in range(0, 20, 2)] + [[20]]
+
+    def fetch(page, page_size):
+        time.sleep(0.01 * (page % 3))
+        return {"data": pages[page]} if page < len(pages) else {"data": []}
+
+    assert list(paginate(fetch, page_size=2, prefetch=4)) == list(range(21))
+
+
+def test_prefetch_keeps_pages_in_flight():
+    in_flight = peak = 0
+    lock = threading.Lock()
+
+    def fetch(page, page_size):
+        nonlocal in_flight, peak
+        with lock:
+            in_flight += 1
+            peak = max(peak, in_flight)
+        time.sleep(0.02)
+        with lock:
+            in_flight -= 1
+        return {"data": [page, page] if page < 12 else []}
+
+    assert len(list(paginate(fetch, page_size=2, prefetch=4))) == 24
+    assert peak == 4
+
+
+def test_prefetch_stops_on_short_page():
+    fetch, calls = _pages([1, 2], [3])
+
+    assert list(paginate(fetch, page_size=2, prefetch=3)) == [1, 2, 3]
+    assert max(page for page, _, _ in calls) < 4
+
+
+def test_prefetch_max_items():
+    fetch, _ = _pages(*[[n, n] for n in range(50)])
+
+    assert list(paginate(fetch, page_size=2, prefetch=5, max_items=5)) == [
+        0,
+        0,
+        1,
+        1,
+        2,
+    ]
+
+
+def test_apaginate_prefetch():
+    async def fetch(page, page_size):
+        await asyncio.sleep(0.01 * (3 - page % 3))
+        return [page] * page_size if page < 5 else []
+
+    async def main():
+        return [r async for r in apaginate(fetch, page_size=2, prefetch=3)]
+
+    assert asyncio.run(main()) == [0, 0, 1, 1, 2, 2, 3, 3, 4, 4]
@@ -0,0 +1,95 @@
+import asyncio
+import threading
+import time
+
+import responses
+
+from pywormholescan import (
+    AsyncAPIClient,
+    GuardianAPI,
+    Network,
+    RateLimiter,
+    WormholescanAPI,
+)
+from pywormholescan._internal import APIClient, TokenBucket
+
+
+def test_bucket_allows_burst_then_paces(clock):
+    bucket = TokenBucket(rate=10, burst=2, clock=clock)
+
+    assert [bucket.reserve() for _ in range(2)] == [0, 0]
+    assert bucket.reserve() == 0.1
+    assert bucket.reserve() == 0.2
+
+
+def test_bucket_refills_over_time(clock):
+    bucket = TokenBucket(rate=10, burst=1, clock=clock)
+    bucket.reserve()
+    clock.now = 0.1
+
+    assert bucket.reserve() == 0
+
+
+def test_limiter_keeps_separate_buckets_per_network(clock):
+    limiter = RateLimiter(1, 1, clock=clock)
+
+    assert limiter.reserve(Network.MAINNET, "/api/v1/health") == 0
+    assert limiter.reserve(Network.TESTNET, "/api/v1/health") == 0
+    assert limiter.reserve(Network.MAINNET, "/api/v1/health") == 1
+
+
+def test_limiter_network_overrides(clock):
+    limiter = RateLimiter(1, 1, networks={Network.TESTNET: (100, 5)}, clock=clock)
+
+    waits = [limiter.reserve(Network.TESTNET, "/api/v1/health") for _ in range(5)]
+    assert waits == [0] * 5
+
+
+def test_limiter_applies_group_and_network_buckets(clock):
+    limiter = RateLimiter(100, 100, groups={"/v1/governor": (1, 1)}, clock=clock)
+
+    assert limiter.reserve(Network.MAINNET, "/v1/governor/token_list") == 0
+    assert limiter.reserve(Network.MAINNET, "/v1/governor/enqueued_vaas") == 1
+    assert limiter.reserve(Network.MAINNET, "/api/v1/vaas") == 0
+
+
+@responses.activate
+def test_limiter_shared_across_facades_and_threads(mocker):
+    sleeps = []
+    mocker.patch(
+        "pywormholescan._internal.rate_limiter.time.sleep", side_effect=sleeps.append
+    )
+    limiter = RateLimiter(10, 1)
+    wormholescan = WormholescanAPI(
+        api_client=APIClient(Network.MAINNET, rate_limiter=limiter)
+    )
+    guardian = GuardianAPI(api_client=APIClient(Network.MAINNET, rate_limiter=limiter))
+    responses.add(responses.GET, f"{wormholescan.base_url}/api/v1/health", json={})
+    responses.add(responses.GET, f"{guardian.base_url}/v1/heartbeats", json={})
+
+    threads = [
+        threading.Thread(target=wormholescan.get_health_check),
+        threading.Thread(target=guardian.get_guardians_hearbeats),
+        threading.Thread(target=wormholescan.get_health_check),
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(sleeps) == 2
+    assert sorted(round(wait, 1) for wait in sleeps) == [0.1, 0.2]
+
+
+def test_async_client_is_paced(stub_server):
+    stub_server.add("/api/v1/health", json={})
+    limiter = RateLimiter(50, 1)
+
+    async def main():
+        async with AsyncAPIClient(Network.MAINNET, rate_limiter=limiter) as client:
+            client.base_url = stub_server.url
+            start = time.monotonic()
+            await asyncio.gather(*(client.get("/api/v1/health") for _ in range(6)))
+            return time.monotonic() - start
+
+    assert asyncio.run(main()) >= 0.09
@@ -0,0 +1,141 @@
+import asyncio
+
+import aiohttp
+import pytest
+import requests
+import responses
+
+from pywormholescan import AsyncAPIClient, Network, RetryBudget, RetryPolicy
+from pywormholescan._internal import APIClient
+
+
+@pytest.fixture(autouse=True)
+def no_sleep(mocker):
+    sleeps = []
+    mocker.patch(
+        "pywormholescan._internal.api_client.time.sleep", side_effect=sleeps.append
+    )
+    return sleeps
+
+
+def _client(**kwargs):
+    policy = RetryPolicy(backoff_factor=1, jitter=False, **kwargs)
+    return APIClient(Network.MAINNET, retry=policy)
+
+
+def test_backoff_is_exponential_and_capped():
+    policy = RetryPolicy(backoff_factor=0.5, max_backoff=3, jitter=False)
+    assert [policy.backoff(n) for n in range(1, 6)] == [0.5, 1, 2, 3, 3]
+
+
+def test_backoff_jitter_stays_within_bounds():
+    policy = RetryPolicy(backoff_factor=1)
+    assert all(0 <= policy.backoff(3) <= 4 for _ in range(100))
+
+
+def test_backoff_honours_retry_after():
+    policy = RetryPolicy(max_retry_after=10)
+    assert policy.backoff(1, "7") == 7
+    assert policy.backoff(1, "Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert policy.backoff(1, "60") is None
+
+
+def test_budget_limits_retries():
+    budget = RetryBudget(ratio=0.5, min_retries=1)
+    assert budget.withdraw()
+    assert not budget.withdraw()
+    budget.deposit()
+    budget.deposit()
+    assert budget.withdraw()
+
+
+@responses.activate
+def test_retries_safe_status_until_success(no_sleep):
+    client = _client()
+    url = f"{client.base_url}/api/v1/vaas"
+    responses.add(responses.GET, url, status=503)
+    responses.add(responses.GET, url, status=429, headers={"Retry-After": "2"})
+    responses.add(responses.GET, url, json={"data": []})
+
+    assert client.get("/api/v1/vaas") == {"data": []}
+    assert no_sleep == [1, 2]
+    stats = client.stats.snapshot()
+    assert stats["requests"] == 1
+    assert stats["attempts"] == 3
+    assert stats["retry_reasons"] == {503: 1, 429: 1}
+
+
+@responses.activate
+def test_does_not_retry_client_errors():
+    client = _client()
+    responses.add(responses.GET, f"{client.base_url}/api/v1/health", status=404)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get("/api/v1/health")
+    assert client.stats.snapshot()["attempts"] == 1
+
+
+@responses.activate
+def test_gives_up_after_max_attempts():
+    client = _client(max_attempts=3)
+    responses.add(responses.GET, f"{client.base_url}/api/v1/health", status=502)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.get("/api/v1/health")
+    stats = client.stats.snapshot()
+    assert (stats["attempts"], stats["retries"], stats["retries_exhausted"]) == (
+        3,
+        2,
+        1,
+    )
+
+
+@responses.activate
+def test_retries_connection_errors():
+    client = _client()
+    url = f"{client.base_url}/api/v1/health"
+    responses.add(responses.GET, url, body=requests.ConnectionError("reset"))
+    responses.add(responses.GET, url, json={"status": "OK"})
+
+    assert client.get("/api/v1/health") == {"status": "OK"}
+    assert client.stats.snapshot()["retry_reasons"] == {"ConnectionError": 1}
+
+
+@responses.activate
+def test_budget_exhaustion_stops_retry_storm():
+    client = _client(budget=RetryBudget(ratio=0, min_retries=2))
+    responses.add(responses.GET, f"{client.base_url}/api/v1/health", status=503)
+
+    for _ in range(3):
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.get("/api/v1/health")
+    stats = client.stats.snapshot()
+    assert stats["retries"] == 2
+    assert stats["budget_exhausted"] == 3
+
+
+@responses.activate
+def test_post_is_never_retried():
+    client = _client()
+    responses.add(responses.POST, f"{client.base_url}/api/v1/vaas/parse/", status=503)
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.post("/api/v1/vaas/parse/", json={})
+    assert len(responses.calls) == 1
+
+
+def test_async_client_retries(stub_server, mocker):
+    mocker.patch("asyncio.sleep", mocker.AsyncMock())
+    stub_server.add("/api/v1/health", status=503, json={}, headers={"Retry-After": "1"})
+
+    async def main():
+        policy = RetryPolicy(max_attempts=3)
+        async with AsyncAPIClient(Network.MAINNET, retry=policy) as client:
+            client.base_url = stub_server.url
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client.get("/api/v1/health")
+            return client.stats.snapshot()
+
+    stats = asyncio.run(main())
+    assert stats["attempts"] == 3
+    assert len(stub_server.requests) == 3
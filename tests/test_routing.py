@@ -0,0 +1,200 @@
+import asyncio
+import time
+
+import pytest
+import requests
+
+import aiohttp
+
+from pywormholescan import (
+    APIClient,
+    AsyncAPIClient,
+    AsyncWormholescanAPI,
+    HedgePolicy,
+    Network,
+    RateLimiter,
+    WormholescanAPI,
+)
+from pywormholescan._internal.routing import endpoint_group
+
+VAA = "/api/v1/vaas/2/abc/1"
+
+
+def _client(*servers, **kwargs) -> APIClient:
+    client = APIClient(
+        Network.MAINNET, base_urls=[server.url for server in servers], **kwargs
+    )
+    client.router.explore = 0
+    return client
+
+
+@pytest.mark.parametrize(
+    "endpoint, group",
+    [
+        ("/api/v1/vaas/2/abc/1?parsedPayload=true", "/api/v1/vaas"),
+        ("/v1/signed_vaa/2/" + "0" * 64 + "/7", "/v1/signed_vaa"),
+        ("/api/v1/top-symbols-by-volume?timeSpan=7d", "/api/v1/top-symbols-by-volume"),
+        ("/api/v1/address/0x" + "a" * 40, "/api/v1/address"),
+        ("/v1/governor/notional/limit", "/v1/governor"),
+        ("/api/v1/x-chain-activity/tops?timeSpan=7d", "/api/v1/x-chain-activity"),
+    ],
+)
+def test_endpoint_group(endpoint, group):
+    assert endpoint_group(endpoint) == group
+
+
+def test_routes_to_the_fastest_base_url(stub_server, mirror_server):
+    stub_server.add(VAA, json={"data": "slow"}, delay=0.05)
+    mirror_server.add(VAA, json={"data": "fast"})
+    client = _client(stub_server, mirror_server)
+    api = WormholescanAPI(api_client=client)
+
+    results = [api.get_vaa_by_id(2, "abc", 1)["data"] for _ in range(10)]
+
+    assert results.count("slow") == 1
+    assert len(mirror_server.requests) == 9
+    assert client.router.latency(VAA, stub_server.url) > client.router.latency(
+        VAA, mirror_server.url
+    )
+
+
+def test_fails_over_to_the_next_base_url(stub_server, mirror_server):
+    stub_server.add(VAA, json={"error": "busy"}, status=503)
+    mirror_server.add(VAA, json={"data": 1})
+    client = _client(stub_server, mirror_server)
+
+    assert [client.get(VAA) for _ in range(3)] == [{"data": 1}] * 3
+    assert client.router.stats()["failovers"] == 1
+    assert len(stub_server.requests) == 1
+
+
+def test_unreachable_base_url(stub_server, mirror_server):
+    mirror_server.add(VAA, json={"data": 1})
+    client = _client(stub_server, mirror_server)
+    stub_server.stop()
+
+    assert client.get(VAA) == {"data": 1}
+
+
+def test_raises_once_every_base_url_failed(stub_server, mirror_server):
+    stub_server.add(VAA, json={}, status=502)
+    mirror_server.add(VAA, json={}, status=503)
+    client = _client(stub_server, mirror_server)
+
+    with pytest.raises(requests.HTTPError):
+        client.get(VAA)
+    assert len(stub_server.requests) + len(mirror_server.requests) == 2
+
+
+def test_hedges_slow_requests(stub_server, mirror_server):
+    stub_server.add(VAA, json={"data": "slow"}, delay=1)
+    mirror_server.add(VAA, json={"data": "fast"})
+    client = _client(stub_server, mirror_server, hedge=HedgePolicy(min_samples=20))
+    group = endpoint_group(VAA)
+    for _ in range(20):
+        client.router._record(group, stub_server.url, 0.001, ok=True)
+        client.router._record(group, mirror_server.url, 0.002, ok=True)
+
+    start = time.perf_counter()
+    assert client.get(VAA) == {"data": "fast"}
+
+    assert time.perf_counter() - start < 0.5
+    assert client.router.stats()["hedges"] == 1
+    assert client.router.stats()["hedge_wins"] == 1
+    client.close()
+
+
+def test_hedging_waits_for_enough_samples(stub_server):
+    stub_server.add(VAA, json={"data": 1})
+    client = APIClient(Network.MAINNET, hedge=HedgePolicy(min_samples=5))
+    client.base_url = stub_server.url
+
+    # Only the first five requests are made: from then on, hedging depends on timing.
+    for _ in range(5):
+        client.get(VAA)
+
+    assert client.router.stats()["hedges"] == 0
+    assert len(stub_server.requests) == 5
+
+
+def test_hedge_policy_prefixes():
+    policy = HedgePolicy(prefixes=["/api/v1/vaas/", "/v1/signed_vaa/"])
+
+    assert policy.applies(VAA)
+    assert not policy.applies("/api/v1/scorecards")
+
+
+def _async_client(*servers, **kwargs) -> AsyncAPIClient:
+    client = AsyncAPIClient(
+        Network.MAINNET, base_urls=[server.url for server in servers], **kwargs
+    )
+    client.router.explore = 0
+    return client
+
+
+def test_async_fails_over_to_the_next_base_url(stub_server, mirror_server):
+    stub_server.add(VAA, json={"error": "busy"}, status=503)
+    mirror_server.add(VAA, json={"data": 1})
+
+    async def main():
+        client = _async_client(stub_server, mirror_server)
+        async with AsyncWormholescanAPI(api_client=client) as api:
+            results = [await api.get_vaa_by_id(2, "abc", 1) for _ in range(3)]
+        return results, client.router.stats()
+
+    results, stats = asyncio.run(main())
+    assert results == [{"data": 1}] * 3
+    assert stats["failovers"] == 1
+    assert len(stub_server.requests) == 1
+
+
+def test_async_failover_requests_are_paced(stub_server, mirror_server, mocker):
+    stub_server.add(VAA, json={"error": "busy"}, status=503)
+    mirror_server.add(VAA, json={"data": 1})
+    limiter = RateLimiter(1000, 10)
+    acquire = mocker.spy(limiter, "acquire_async")
+
+    async def main():
+        async with _async_client(
+            stub_server, mirror_server, rate_limiter=limiter
+        ) as client:
+            return await client.get(VAA)
+
+    assert asyncio.run(main()) == {"data": 1}
+    assert acquire.call_count == 2
+
+
+def test_async_raises_once_every_base_url_failed(stub_server, mirror_server):
+    stub_server.add(VAA, json={}, status=502)
+    mirror_server.add(VAA, json={}, status=503)
+
+    async def main():
+        async with _async_client(stub_server, mirror_server) as client:
+            await client.get(VAA)
+
+    with pytest.raises(aiohttp.ClientResponseError):
+        asyncio.run(main())
+    assert len(stub_server.requests) + len(mirror_server.requests) == 2
+
+
+def test_async_hedges_slow_requests(stub_server, mirror_server):
+    stub_server.add(VAA, json={"data": "slow"}, delay=1)
+    mirror_server.add(VAA, json={"data": "fast"})
+
+    async def main():
+        client = _async_client(
+            stub_server, mirror_server, hedge=HedgePolicy(min_samples=20)
+        )
+        group = endpoint_group(VAA)
+        for _ in range(20):
+            client.router._record(group, stub_server.url, 0.001, ok=True)
+            client.router._record(group, mirror_server.url, 0.002, ok=True)
+        async with client:
+            start = time.perf_counter()
+            result = await client.get(VAA)
+            return result, time.perf_counter() - start, client.router.stats()
+
+    result, elapsed, stats = asyncio.run(main())
+    assert result == {"data": "fast"}
+    assert elapsed < 0.5
+    assert stats["hedges"] == stats["hedge_wins"] == 1
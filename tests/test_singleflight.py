@@ -0,0 +1,102 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from pywormholescan import AsyncAPIClient, Network, WormholescanAPI
+from pywormholescan._internal import APIClient
+from pywormholescan._internal.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    calls = []
+    barrier = threading.Barrier(10)
+
+    def slow():
+        calls.append(1)
+        time.sleep(0.1)
+        return "result"
+
+    def worker():
+        barrier.wait()
+        return flight.do("key", slow)
+
+    with ThreadPoolExecutor(10) as pool:
+        results = list(pool.map(lambda _: worker(), range(10)))
+
+    assert results == ["result"] * 10
+    assert len(calls) == 1
+    assert flight.stats() == {"calls": 1, "coalesced": 9}
+
+
+def test_errors_are_shared_and_not_remembered():
+    flight = SingleFlight()
+
+    def boom():
+        raise RuntimeError("upstream down")
+
+    with pytest.raises(RuntimeError):
+        flight.do("key", boom)
+    assert flight.do("key", lambda: "ok") == "ok"
+
+
+def test_async_single_flight():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def slow():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "result"
+
+    async def main():
+        return await asyncio.gather(*(flight.do("key", slow) for _ in range(20)))
+
+    assert asyncio.run(main()) == ["result"] * 20
+    assert len(calls) == 1
+    assert flight.stats() == {"calls": 1, "coalesced": 19}
+
+
+def test_thundering_herd_reduces_upstream_calls(stub_server):
+    endpoint = "/api/v1/governor/status"
+    stub_server.add(endpoint, json={"data": []}, delay=0.2)
+    client = APIClient(Network.MAINNET, coalesce=True, pool_maxsize=50)
+    client.base_url = stub_server.url
+    wormholescan = WormholescanAPI(api_client=client)
+    herd = 50
+    barrier = threading.Barrier(herd)
+
+    def worker(_):
+        barrier.wait()
+        return wormholescan.get_governor_status()
+
+    with ThreadPoolExecutor(herd) as pool:
+        results = list(pool.map(worker, range(herd)))
+
+    assert results == [{"data": []}] * herd
+    assert len(stub_server.requests) < herd // 10
+    assert client.single_flight.stats()["coalesced"] >= herd - herd // 10
+
+
+def test_async_thundering_herd(stub_server):
+    stub_server.add(
+        "/api/v1/transactions/2/0xabc/1", json={"id": "2/0xabc/1"}, delay=0.1
+    )
+
+    async def main():
+        async with AsyncAPIClient(Network.MAINNET, coalesce=True) as client:
+            client.base_url = stub_server.url
+            return await asyncio.gather(
+                *(
+                    client.get_with_url_builder("/api/v1/transactions", 2, "0xabc", 1)
+                    for _ in range(100)
+                )
+            )
+
+    results = asyncio.run(main())
+    assert len(results) == 100
+    assert results[0] is not results[1]
+    assert len(stub_server.requests) == 1
@@ -0,0 +1,144 @@
+import asyncio
+
+import aiohttp
+import pytest
+import requests
+
+from pywormholescan import (
+    AsyncWormholescanAPI,
+    ResponseCache,
+    WormholescanAPI,
+    prometheus_text,
+)
+from pywormholescan._internal import ConditionalCache
+from pywormholescan._internal.stats import ClientStats
+
+VAA_TEMPLATE = "/api/v1/vaas/{}/{}/{}"
+EMITTER = "ec7372995d5cc8732397fb0ad35c0121e0eaa90d26f828a534cab54391b3a4f5"
+
+
+def test_calls_are_labelled_by_endpoint_template(stub_server, stub_client):
+    for seq in (1, 2):
+        stub_server.add(f"/api/v1/vaas/2/{EMITTER}/{seq}", json={"data": {}})
+    api = WormholescanAPI(api_client=stub_client())
+    api.get_vaa_by_id(2, EMITTER, "1")
+    api.get_vaa_by_id(2, EMITTER, "2")
+
+    endpoints = api._api_client.stats.snapshot()["endpoints"]
+    assert list(endpoints) == [VAA_TEMPLATE]
+    vaas = endpoints[VAA_TEMPLATE]
+    assert vaas["calls"] == vaas["responses"] == 2
+    assert vaas["bytes_received"] == 2 * len(b'{"data": {}}')
+    for phase in ("connect", "ttfb", "download", "decode"):
+        assert vaas["latency"][phase]["count"] == 2
+        assert vaas["latency"][phase]["buckets"][float("inf")] == 2
+    assert vaas["seconds"] > 0
+
+
+def test_paths_without_a_template_are_labelled_without_their_query(
+    stub_server, stub_client
+):
+    stub_server.add("/api/v1/health", json={"status": "OK"})
+    client = stub_client()
+    client.get("/api/v1/health?x=1")
+
+    assert list(client.stats.snapshot()["endpoints"]) == ["/api/v1/health"]
+
+
+def test_cache_hit_ratio(stub_server, stub_client):
+    stub_server.add("/api/v1/scorecards", json={"tvl": "1"})
+    client = stub_client(cache=ResponseCache(ttl=60))
+    api = WormholescanAPI(api_client=client)
+    for _ in range(4):
+        api.get_scorecards()
+
+    scorecards = client.stats.snapshot()["endpoints"]["/api/v1/scorecards"]
+    assert scorecards["calls"] == 4
+    assert scorecards["cache_hits"] == 3
+    assert scorecards["cache_hit_ratio"] == 0.75
+    assert scorecards["responses"] == 1
+    assert scorecards["latency"]["decode"]["count"] == 4
+
+
+def test_not_modified_responses(stub_server, stub_client):
+    stub_server.add("/api/v1/scorecards", json={"tvl": "1"}, headers={"ETag": '"v1"'})
+    client = stub_client(conditional=ConditionalCache())
+    client.get("/api/v1/scorecards")
+    client.get("/api/v1/scorecards")
+
+    scorecards = client.stats.snapshot()["endpoints"]["/api/v1/scorecards"]
+    assert scorecards["responses"] == 2
+    assert scorecards["not_modified"] == 1
+    assert scorecards["bytes_received"] == len(b'{"tvl": "1"}')
+    assert scorecards["errors"] == {}
+
+
+def test_errors_by_status_and_class(stub_server, stub_client):
+    stub_server.add("/api/v1/health", json={}, status=503)
+    client = stub_client()
+    with pytest.raises(requests.HTTPError):
+        client.get("/api/v1/health")
+
+    client.base_url = "http://127.0.0.1:1"
+    with pytest.raises(requests.ConnectionError):
+        client.get("/api/v1/health")
+
+    errors = client.stats.snapshot()["endpoints"]["/api/v1/health"]["errors"]
+    assert errors == {"503": 1, "ConnectionError": 1}
+
+
+def test_streamed_download(stub_server, stub_client):
+    records = [{"id": str(i)} for i in range(50)]
+    stub_server.add("/api/v1/vaas", json={"data": records})
+    client = stub_client()
+    api = WormholescanAPI(api_client=client)
+
+    assert len(list(api.stream_all_vaas())) == 50
+    vaas = client.stats.snapshot()["endpoints"]["/api/v1/vaas"]
+    assert vaas["calls"] == vaas["responses"] == 1
+    assert vaas["bytes_received"] == len(stub_server.routes["/api/v1/vaas"][1])
+    assert vaas["latency"]["download"]["count"] == 1
+
+
+def test_prometheus_text():
+    stats = ClientStats()
+    stats.record_call(VAA_TEMPLATE, cached=False)
+    stats.record_response(VAA_TEMPLATE, 200, connect=0.02, ttfb=0.3, download=0.001)
+    stats.record_error(VAA_TEMPLATE, "ConnectionError")
+
+    text = prometheus_text(stats, namespace="wh")
+    lines = text.splitlines()
+    assert text.endswith("\n")
+    assert "# TYPE wh_calls_total counter" in lines
+    assert 'wh_calls_total{endpoint="/api/v1/vaas/{}/{}/{}"} 1' in lines
+    assert (
+        'wh_errors_total{endpoint="/api/v1/vaas/{}/{}/{}",error="ConnectionError"} 1'
+        in lines
+    )
+    assert "# TYPE wh_phase_seconds histogram" in lines
+    labels = 'endpoint="/api/v1/vaas/{}/{}/{}",phase="ttfb"'
+    assert f'wh_phase_seconds_bucket{{{labels},le="0.25"}} 0' in lines
+    assert f'wh_phase_seconds_bucket{{{labels},le="0.5"}} 1' in lines
+    assert f'wh_phase_seconds_bucket{{{labels},le="+Inf"}} 1' in lines
+    assert f"wh_phase_seconds_count{{{labels}}} 1" in lines
+    assert "wh_requests_total 0" in lines
+
+
+def test_async_metrics(stub_server, async_stub_client):
+    stub_server.add(f"/api/v1/vaas/2/{EMITTER}/1", json={"data": {}})
+    stub_server.add("/api/v1/health", json={}, status=500)
+
+    async def main():
+        client = async_stub_client()
+        async with AsyncWormholescanAPI(api_client=client) as api:
+            await api.get_vaa_by_id(2, EMITTER, "1")
+            with pytest.raises(aiohttp.ClientResponseError):
+                await client.get("/api/v1/health")
+        return client.stats.snapshot()["endpoints"]
+
+    endpoints = asyncio.run(main())
+    vaas = endpoints[VAA_TEMPLATE]
+    assert vaas["calls"] == vaas["responses"] == 1
+    assert vaas["latency"]["connect"]["sum"] > 0
+    assert vaas["latency"]["download"]["count"] == 1
+    assert endpoints["/api/v1/health"]["errors"] == {"500": 1}
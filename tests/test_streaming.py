@@ -0,0 +1,92 @@
+import asyncio
+import json
+
+import pytest
+
+from pywormholescan import AsyncWormholescanAPI, Network, WormholescanAPI
+from pywormholescan._internal import APIClient, get_decoder
+from pywormholescan._internal.pagination import extract_records
+from pywormholescan._internal.streaming import RecordParser
+from pywormholescan.models import VAA
+
+RECORDS = [
+    {"id": f"2/abc/{i}", "sequence": i, "note": 'esc"aped ]} ' * (i % 3), "n": -1.5e3}
+    for i in range(20)
+]
+
+
+def _feed(body: bytes, records_path, size: int) -> list:
+    parser = RecordParser(get_decoder(), records_path)
+    records = []
+    for start in range(0, len(body), size):
+        records.extend(parser.feed(body[start : start + size]))
+    parser.close()
+    return records
+
+
+@pytest.mark.parametrize("size", [1, 5, 64, 1 << 20])
+@pytest.mark.parametrize(
+    "document, records_path",
+    [
+        ({"pagination": {"next": 1}, "data": RECORDS, "after": [1]}, ("data",)),
+        ({"data": {"vaas": RECORDS}}, ("data", "vaas")),
+        (RECORDS, ()),
+        (RECORDS, ("data",)),
+        ({"data": [1, 22, 333, "x"]}, ("data",)),
+        ({"data": None}, ("data",)),
+        ({"other": []}, ("data",)),
+    ],
+)
+def test_parser_matches_extract_records(document, records_path, size):
+    body = json.dumps(document).encode()
+
+    assert _feed(body, records_path, size) == extract_records(document, records_path)
+
+
+def test_parser_returns_records_before_the_body_ends():
+    parser = RecordParser(get_decoder())
+
+    assert parser.feed(b'{"data": [{"a": 1}, {"a"') == [{"a": 1}]
+    assert parser.feed(b": 2}") == []
+    assert parser.feed(b"]}") == [{"a": 2}]
+
+
+def test_parser_truncated_body():
+    parser = RecordParser(get_decoder())
+    parser.feed(b'{"data": [{"a": 1},')
+
+    with pytest.raises(ValueError):
+        parser.close()
+
+
+def test_client_stream(stub_server):
+    stub_server.add("/api/v1/vaas?pageSize=20", json={"data": RECORDS})
+
+    with APIClient(Network.MAINNET) as client:
+        client.base_url = stub_server.url
+        records = client.stream_with_url_builder(
+            "/api/v1/vaas", chunk_size=16, kwargs={"page_size": 20}
+        )
+        assert list(records) == RECORDS
+
+
+def test_facade_stream_all_vaas_models(stub_server):
+    stub_server.add("/api/v1/vaas", json={"data": RECORDS[:2]})
+
+    with WormholescanAPI(Network.MAINNET, models=True) as api:
+        api._api_client.base_url = stub_server.url
+        vaas = list(api.stream_all_vaas())
+
+    assert all(isinstance(vaa, VAA) for vaa in vaas)
+    assert [vaa.sequence for vaa in vaas] == [0, 1]
+
+
+def test_async_facade_stream_observations(stub_server):
+    stub_server.add("/api/v1/observations?pageSize=20", json=RECORDS)
+
+    async def main():
+        async with AsyncWormholescanAPI(Network.MAINNET) as api:
+            api._api_client.base_url = stub_server.url
+            return [record async for record in api.stream_observations(page_size=20)]
+
+    assert asyncio.run(main()) == RECORDS
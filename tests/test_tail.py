@@ -0,0 +1,151 @@
+import asyncio
+from itertools import islice
+
+import pytest
+import responses
+
+from pywormholescan import AsyncWormholescanAPI, Network, WormholescanAPI
+from pywormholescan._internal import tail as tail_module
+from pywormholescan._internal.tail import atail, tail
+
+
+def _records(*ids, timestamp=None):
+    return [{"id": i, "timestamp": timestamp or f"t{i:03d}"} for i in ids]
+
+
+def _polls(*polls):
+    """Serves one newest-first snapshot per poll; each snapshot is split into pages."""
+    calls = []
+    state = {"poll": -1}
+
+    def fetch(page, page_size, **kwargs):
+        if page == 0:
+            state["poll"] = min(state["poll"] + 1, len(polls) - 1)
+        calls.append((state["poll"], page, kwargs))
+        snapshot = polls[state["poll"]]
+        return {"data": snapshot[page * page_size : (page + 1) * page_size]}
+
+    return fetch, calls
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(tail_module.time, "sleep", sleeps.append)
+    return sleeps
+
+
+def _ids(records):
+    return [record["id"] for record in records]
+
+
+def test_yields_only_new_records_oldest_first(sleeps):
+    fetch, calls = _polls(_records(3, 2, 1), _records(5, 4, 3, 2, 1))
+
+    records = list(islice(tail(fetch, page_size=10, sort_order="DESC"), 2))
+
+    assert _ids(records) == [4, 5]
+    assert calls == [(0, 0, {"sort_order": "DESC"}), (1, 0, {"sort_order": "DESC"})]
+
+
+def test_pages_back_through_a_burst(sleeps):
+    burst = _records(7, 6, 5, 4, 3, 2, 1)
+    fetch, calls = _polls(_records(2, 1), burst, _records(8) + burst)
+
+    records = list(islice(tail(fetch, page_size=2, min_interval=0.5), 6))
+
+    assert _ids(records) == [3, 4, 5, 6, 7, 8]
+    assert [call[:2] for call in calls] == [(0, 0), (1, 0), (1, 1), (1, 2), (2, 0)]
+    assert sleeps == [5, 0.5]
+
+
+def test_max_pages_bounds_the_walk_back(sleeps):
+    fetch, _ = _polls(_records(1), _records(9, 8, 7, 6, 5, 4, 3, 2, 1))
+
+    records = list(islice(tail(fetch, page_size=2, max_pages=2), 4))
+
+    assert _ids(records) == [6, 7, 8, 9]
+
+
+def test_include_existing(sleeps):
+    fetch, _ = _polls(_records(2, 1))
+
+    assert _ids(islice(tail(fetch, include_existing=True), 2)) == [1, 2]
+
+
+def test_interval_adapts_to_traffic(sleeps):
+    quiet = _records(1)
+    fetch, _ = _polls(quiet, quiet, quiet, quiet, _records(2, 1), _records(3, 2, 1))
+    follower = tail(fetch, interval=4, min_interval=1, max_interval=8)
+
+    assert next(follower)["id"] == 2
+    assert sleeps == [4, 6, 8, 8]
+    assert next(follower)["id"] == 3
+    assert sleeps[-1] == 4
+
+
+def test_dedup_set_is_bounded():
+    follower = tail_module._Follower(
+        page_size=10,
+        max_pages=1,
+        interval=1,
+        min_interval=1,
+        max_interval=1,
+        seen_size=2,
+        id_field="id",
+        timestamp_field=None,
+    )
+
+    follower.add_page(0, _records(3, 2, 1))
+
+    assert _ids(follower.flush()) == [1, 2, 3]
+    assert list(follower.seen) == [2, 3]
+
+
+@pytest.mark.parametrize(
+    "timestamp_field, expected", [(None, [1, 2, 4]), ("timestamp", [4])]
+)
+def test_timestamp_high_water_mark(sleeps, timestamp_field, expected):
+    # Only the newest ID is remembered, and 3 has since dropped out of the list.
+    fetch, _ = _polls(_records(3, 2, 1), _records(4, 2, 1))
+
+    follower = tail(fetch, seen_size=1, timestamp_field=timestamp_field)
+
+    assert _ids(islice(follower, len(expected))) == expected
+
+
+def test_atail():
+    fetch, _ = _polls(_records(2, 1), _records(4, 3, 2, 1))
+
+    async def afetch(**kwargs):
+        return fetch(**kwargs)
+
+    async def main():
+        follower = atail(afetch, interval=0, min_interval=0)
+        return [await follower.__anext__(), await follower.__anext__()]
+
+    assert _ids(asyncio.run(main())) == [3, 4]
+
+
+@responses.activate
+def test_facade_tail_vaas(sleeps):
+    api = WormholescanAPI(Network.MAINNET)
+    url = f"{api.base_url}/api/v1/vaas?page=0&pageSize=2&sortOrder=DESC"
+    responses.add(responses.GET, url, json={"data": _records(1)})
+    responses.add(responses.GET, url, json={"data": _records(2, 1)})
+
+    assert _ids(islice(api.tail_vaas(page_size=2), 1)) == [2]
+
+
+def test_async_facade_tail_observations(stub_server):
+    stub_server.add(
+        "/api/v1/observations?page=0&pageSize=5&sortOrder=DESC", json=_records(2, 1)
+    )
+
+    async def main():
+        async with AsyncWormholescanAPI(Network.MAINNET) as api:
+            api._api_client.base_url = stub_server.url
+            follower = api.tail_observations(page_size=5, include_existing=True)
+            return [await follower.__anext__(), await follower.__anext__()]
+
+    assert _ids(asyncio.run(main())) == [1, 2]
@@ -0,0 +1,132 @@
+import gzip
+import json
+
+import pytest
+import requests
+
+from pywormholescan import (
+    APIClient,
+    Network,
+    RecordingTransport,
+    ReplayTransport,
+    RetryPolicy,
+    WormholescanAPI,
+)
+from pywormholescan._internal.transport import _response
+
+
+def _record(tmp_path, stub_server, calls):
+    """Records `calls(client)` against the stub server and returns the fixture path."""
+    path = str(tmp_path / "fixtures.jsonl.gz")
+    with APIClient(Network.MAINNET, transport=RecordingTransport(path)) as client:
+        client.base_url = stub_server.url
+        calls(client)
+    return path
+
+
+def _replay(path, stub_server, **kwargs):
+    client = APIClient(Network.MAINNET, transport=ReplayTransport(path), **kwargs)
+    client.base_url = stub_server.url
+    return client
+
+
+def test_record_then_replay(tmp_path, stub_server):
+    stub_server.add("/api/v1/health", json={"status": "OK"})
+    stub_server.add("/api/v1/vaas/parse/", json={"parsed": True})
+
+    def calls(client):
+        assert client.get("/api/v1/health") == {"status": "OK"}
+        assert client.post("/api/v1/vaas/parse/", json={"vaa": "AQ=="}) == {
+            "parsed": True
+        }
+
+    path = _record(tmp_path, stub_server, calls)
+    with gzip.open(path, "rt") as file:
+        entries = [json.loads(line) for line in file]
+    assert [(entry["method"], entry["status"]) for entry in entries] == [
+        ("GET", 200),
+        ("POST", 200),
+    ]
+
+    stub_server.routes.clear()
+    client = _replay(path, stub_server)
+
+    assert client.get("/api/v1/health") == {"status": "OK"}
+    assert client.post("/api/v1/vaas/parse/", json={"vaa": "AQ=="}) == {"parsed": True}
+    assert len(stub_server.requests) == 2
+
+
+def test_replay_serves_repeated_requests_in_order(tmp_path, stub_server):
+    stub_server.add("/api/v1/health", json={"n": 1})
+
+    def calls(client):
+        client.get("/api/v1/health")
+        stub_server.add("/api/v1/health", json={"n": 2})
+        client.get("/api/v1/health")
+
+    client = _replay(_record(tmp_path, stub_server, calls), stub_server)
+
+    assert [client.get("/api/v1/health")["n"] for _ in range(3)] == [1, 2, 2]
+
+
+def test_replay_errors_go_through_retries(tmp_path, stub_server):
+    stub_server.add("/api/v1/health", json={"error": "busy"}, status=503)
+
+    def calls(client):
+        with pytest.raises(requests.HTTPError):
+            client.get("/api/v1/health")
+
+    path = _record(tmp_path, stub_server, calls)
+    client = _replay(
+        path, stub_server, retry=RetryPolicy(max_attempts=3, backoff_factor=0)
+    )
+
+    with pytest.raises(requests.HTTPError) as error:
+        client.get("/api/v1/health")
+    assert error.value.response.status_code == 503
+    assert client.stats.attempts == 3
+
+
+def test_recording_uses_the_client_session_settings(tmp_path, stub_server):
+    stub_server.add("/api/v1/health", json={"status": "OK"})
+    recorder = RecordingTransport(str(tmp_path / "fixtures.jsonl.gz"))
+    with APIClient(
+        Network.MAINNET, pool_maxsize=32, keep_alive=False, transport=recorder
+    ) as client:
+        client.base_url = stub_server.url
+        client.get("/api/v1/health")
+        adapter = client.session.get_adapter(client.base_url)
+
+    assert client.session is recorder.transport.session
+    assert adapter._pool_maxsize == 32
+    assert stub_server.requests[0][2]["Connection"] == "close"
+
+
+def test_replay_unknown_request(tmp_path, stub_server):
+    stub_server.add("/api/v1/health", json={"status": "OK"})
+    path = _record(tmp_path, stub_server, lambda client: client.get("/api/v1/health"))
+
+    with pytest.raises(KeyError):
+        _replay(path, stub_server).get("/api/v1/ready")
+
+
+def test_facade_over_replay(tmp_path, stub_server):
+    vaa = {"id": "2/abc/1", "sequence": 1}
+    stub_server.add("/api/v1/vaas/2/abc/1", json={"data": vaa})
+
+    def calls(client):
+        WormholescanAPI(api_client=client).get_vaa_by_id(2, "abc", 1)
+
+    client = _replay(_record(tmp_path, stub_server, calls), stub_server)
+
+    assert WormholescanAPI(api_client=client).get_vaa_by_id(2, "abc", 1) == {
+        "data": vaa
+    }
+
+
+def test_in_memory_response_streams():
+    response = _response("http://x", 200, {"ETag": "v1"}, b"0123456789")
+
+    assert list(response.iter_content(4)) == [b"0123", b"4567", b"89"]
+    assert response.headers["etag"] == "v1"
+    assert response.reason == "OK"
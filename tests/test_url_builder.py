@@ -0,0 +1,64 @@
+import pytest
+
+from pywormholescan._internal.url_builder import build_url, endpoint_template
+
+
+def test_path_and_query():
+    url = build_url(
+        "/api/v1/vaas", 2, "0xabc", kwargs={"page_size": 5, "sort_order": "ASC"}
+    )
+
+    assert url == "/api/v1/vaas/2/0xabc?pageSize=5&sortOrder=ASC"
+
+
+def test_no_query():
+    assert build_url("/api/v1/vaas", 2) == "/api/v1/vaas/2"
+    assert build_url("/api/v1/vaas", 2, kwargs={}) == "/api/v1/vaas/2"
+    assert build_url("/api/v1/health") == "/api/v1/health"
+
+
+@pytest.mark.parametrize(
+    "key, expected",
+    [
+        ("page", "page"),
+        ("time_span", "timeSpan"),
+        ("guardian_set_index", "guardianSetIndex"),
+        ("all apps", "all%20apps"),
+    ],
+)
+def test_camel_case_keys(key, expected):
+    assert build_url("/api/v1/x", kwargs={key: 1}) == f"/api/v1/x?{expected}=1"
+
+
+def test_percent_encoding():
+    url = build_url(
+        "/api/v1/address",
+        "a/b c",
+        kwargs={"from": "2006-01-02T15:04:05+07:00", "apps": "a,b", "q": "x&y=z"},
+    )
+
+    assert url == (
+        "/api/v1/address/a%2Fb%20c"
+        "?from=2006-01-02T15:04:05%2B07:00&apps=a,b&q=x%26y%3Dz"
+    )
+
+
+def test_bool_and_int_values_stay_distinct():
+    assert build_url("/api/v1/x", kwargs={"a": True, "b": 1}) == "/api/v1/x?a=True&b=1"
+
+
+def test_unhashable_values():
+    url = build_url("/api/v1/x", kwargs={"ids": [1, 2], "page": 0})
+
+    assert url == "/api/v1/x?ids=%5B1,%202%5D&page=0"
+
+
+def test_templates_are_created_once():
+    template = endpoint_template("/api/v1/vaas", 3)
+
+    assert template is endpoint_template("/api/v1/vaas", 3)
+    assert template.pattern == "/api/v1/vaas/{}/{}/{}"
+    assert template.render((2, "0xabc", 7)) == "/api/v1/vaas/2/0xabc/7"
+
+    with pytest.raises(TypeError):
+        template.render((2, "0xabc"))
@@ -0,0 +1,118 @@
+import base64
+import struct
+
+import pytest
+from mainnet_vaas import PYTHNET_VAA, PYTHNET_VAA_FIELDS, PYTHNET_VAA_SIGNERS
+
+from pywormholescan import decode_vaa, decode_vaas
+
+EMITTER = bytes.fromhex(
+    "0000000000000000000000003ee18b2214aff97000d974cf647e7c347e8fa585"
+)
+PAYLOAD = bytes.fromhex("01") + (1000).to_bytes(32, "big")
+
+
+def encode_vaa(sequence=90116, signatures=2, payload=PAYLOAD):
+    header = struct.pack(">BIB", 1, 4, signatures)
+    sigs = b"".join(
+        bytes([index]) + bytes([index + 1]) * 64 + bytes([index % 2])
+        for index in range(signatures)
+    )
+    body = (
+        struct.pack(">IIH", 1709294400, 42, 2)
+        + EMITTER
+        + struct.pack(">QB", sequence, 15)
+        + payload
+    )
+    return header + sigs + body
+
+
+# Fields of `encode_vaa()`, written out by hand from the VAA wire format.
+EXPECTED = {
+    "version": 1,
+    "guardianSetIndex": 4,
+    "signatures": [
+        {"index": 0, "signature": base64.b64encode(b"\x01" * 64 + b"\x00").decode()},
+        {"index": 1, "signature": base64.b64encode(b"\x02" * 64 + b"\x01").decode()},
+    ],
+    "timestamp": "2024-03-01T12:00:00Z",
+    "nonce": 42,
+    "emitterChain": 2,
+    "emitterAddress": EMITTER.hex(),
+    "sequence": 90116,
+    "consistencyLevel": 15,
+    "payload": base64.b64encode(PAYLOAD).decode(),
+}
+
+
+def test_decode_vaa_fields():
+    assert decode_vaa(encode_vaa()).to_dict() == EXPECTED
+
+
+def test_decode_mainnet_vaa():
+    vaa = decode_vaa(PYTHNET_VAA).to_dict()
+    signatures = vaa.pop("signatures")
+
+    assert vaa == PYTHNET_VAA_FIELDS
+    assert [signature["index"] for signature in signatures] == PYTHNET_VAA_SIGNERS
+    assert decode_vaa(PYTHNET_VAA).id == (
+        "26/e101faedac5851e32b9b23b5f9411a8c2bac4aae3ed4dd7b811dd1a72ea4aa71/9058660"
+    )
+
+
+@pytest.mark.parametrize(
+    "encode",
+    [
+        lambda raw: raw,
+        lambda raw: bytearray(raw),
+        lambda raw: base64.b64encode(raw).decode(),
+        lambda raw: "0x" + raw.hex(),
+    ],
+)
+def test_decode_vaa_accepts_bytes_and_strings(encode):
+    assert decode_vaa(encode(encode_vaa())).to_dict() == EXPECTED
+
+
+def test_decode_vaa_is_zero_copy():
+    raw = bytearray(encode_vaa())
+    vaa = decode_vaa(raw)
+
+    assert isinstance(vaa.payload, memoryview)
+    assert vaa.payload.obj is raw
+    assert bytes(vaa.payload) == PAYLOAD
+    assert bytes(vaa.body) == raw[1 + 4 + 1 + 2 * 66 :]
+
+
+def test_decode_vaa_signature_parts():
+    signature = decode_vaa(encode_vaa()).signatures[1]
+
+    assert signature.guardian_index == 1
+    assert signature.r == int.from_bytes(b"\x02" * 32, "big")
+    assert signature.recovery_id == 1
+
+
+def test_decode_vaa_id():
+    assert decode_vaa(encode_vaa()).id == f"2/{EMITTER.hex()}/90116"
+
+
+def test_decode_vaa_without_signatures_or_payload():
+    vaa = decode_vaa(encode_vaa(signatures=0, payload=b""))
+
+    assert vaa.signatures == []
+    assert bytes(vaa.payload) == b""
+
+
+@pytest.mark.parametrize("length", [0, 5, 50, 180])
+def test_decode_truncated_vaa(length):
+    with pytest.raises(ValueError):
+        decode_vaa(encode_vaa()[:length])
+
+
+def test_decode_invalid_string():
+    with pytest.raises(ValueError):
+        decode_vaa("not base64!")
+
+
+def test_decode_vaas_batch():
+    vaas = decode_vaas(encode_vaa(sequence=seq) for seq in range(100))
+    assert [vaa.sequence for vaa in vaas] == list(range(100))
@@ -0,0 +1,93 @@
+import pytest
+import requests
+import responses
+
+from pywormholescan import GuardianAPI, Network, VAAStore, WormholescanAPI
+from pywormholescan._internal import APIClient
+from pywormholescan._internal.vaa_store import is_immutable
+
+
+@pytest.mark.parametrize(
+    "endpoint, expected",
+    [
+        ("/v1/signed_vaa/1/emitter/7", True),
+        ("/v1/signed_batch_vaa/1/emitter/7", True),
+        ("/api/v1/vaas/2/0xabc/15", True),
+        ("/api/v1/vaas/2/0xabc/15?parsedPayload=true", True),
+        ("/api/v1/vaas/2/0xabc", False),
+        ("/api/v1/vaas/vaa-counts", False),
+        ("/api/v1/transactions/2/0xabc/15", False),
+    ],
+)
+def test_is_immutable(endpoint, expected):
+    assert is_immutable(endpoint) is expected
+
+
+def test_store_persists_across_instances(tmp_path):
+    path = str(tmp_path / "vaas.db")
+    store = VAAStore(path)
+    store.set("url", b'{"vaaBytes": "AQ=="}')
+    store.close()
+
+    warm = VAAStore(path)
+    assert warm.get("url") == b'{"vaaBytes": "AQ=="}'
+    assert warm.stats() == {"hits": 1, "misses": 0, "entries": 1, "bytes": 20}
+
+
+def test_store_evicts_least_recently_read(tmp_path):
+    store = VAAStore(str(tmp_path / "vaas.db"), max_bytes=10)
+    store.set("a", b"12345")
+    store.set("b", b"12345")
+    store.get("a")
+    store.set("c", b"123")
+
+    assert store.get("b") is None
+    assert store.get("a") == b"12345"
+    assert store.stats()["bytes"] == 8
+
+
+@responses.activate
+def test_guardian_signed_vaa_served_from_store(tmp_path):
+    store = VAAStore(str(tmp_path / "vaas.db"))
+    guardian = GuardianAPI(api_client=APIClient(Network.MAINNET, vaa_store=store))
+    responses.add(
+        responses.GET,
+        f"{guardian.base_url}/v1/signed_vaa/1/emitter/7",
+        json={"vaaBytes": "AQ=="},
+    )
+
+    assert guardian.get_guardians_signed_vaa(1, "emitter", 7) == {"vaaBytes": "AQ=="}
+    restarted = GuardianAPI(api_client=APIClient(Network.MAINNET, vaa_store=store))
+    assert restarted.get_guardians_signed_vaa(1, "emitter", 7) == {"vaaBytes": "AQ=="}
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_mutable_endpoints_bypass_store(tmp_path):
+    store = VAAStore(str(tmp_path / "vaas.db"))
+    wormholescan = WormholescanAPI(
+        api_client=APIClient(Network.MAINNET, vaa_store=store)
+    )
+    responses.add(
+        responses.GET, f"{wormholescan.base_url}/api/v1/vaas/2", json={"data": []}
+    )
+
+    wormholescan.get_vaas_by_chain(2)
+    wormholescan.get_vaas_by_chain(2)
+    assert len(responses.calls) == 2
+    assert len(store) == 0
+
+
+@responses.activate
+def test_missing_vaa_is_not_stored(tmp_path):
+    store = VAAStore(str(tmp_path / "vaas.db"))
+    wormholescan = WormholescanAPI(
+        api_client=APIClient(Network.MAINNET, vaa_store=store)
+    )
+    responses.add(
+        responses.GET, f"{wormholescan.base_url}/api/v1/vaas/2/0xabc/1", status=404
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        wormholescan.get_vaa_by_id(2, "0xabc", 1)
+    assert len(store) == 0
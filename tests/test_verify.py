@@ -0,0 +1,218 @@
+import base64
+import hashlib
+import struct
+
+import pytest
+import responses
+from mainnet_vaas import MAINNET_GUARDIAN_SET_3, PYTHNET_VAA, PYTHNET_VAA_SIGNERS
+
+from pywormholescan import GuardianAPI, Network
+from pywormholescan._internal.crypto import (
+    _G,
+    _N,
+    _jacobian_multiply,
+    _keccak256_python,
+    _recover_python,
+    _to_affine,
+    keccak256,
+    public_key_to_address,
+    recover_public_key,
+)
+from pywormholescan.verify import GuardianSetCache, VAAVerifier, quorum
+
+PRIVATE_KEYS = [
+    int.from_bytes(hashlib.sha256(bytes([i])).digest(), "big") for i in range(4)
+]
+
+
+def _address(private_key):
+    x, y = _to_affine(_jacobian_multiply(_G, private_key))
+    return public_key_to_address(x.to_bytes(32, "big") + y.to_bytes(32, "big"))
+
+
+ADDRESSES = ["0x" + _address(key).hex() for key in PRIVATE_KEYS]
+
+
+def _sign(private_key, digest):
+    e = int.from_bytes(digest, "big")
+    k = (
+        int.from_bytes(
+            hashlib.sha256(digest + private_key.to_bytes(32, "big")).digest(), "big"
+        )
+        % _N
+    )
+    x, y = _to_affine(_jacobian_multiply(_G, k))
+    r = x % _N
+    s = pow(k, -1, _N) * (e + r * private_key) % _N
+    v = y % 2
+    if s > _N // 2:
+        s, v = _N - s, v ^ 1
+    return r.to_bytes(32, "big") + s.to_bytes(32, "big") + bytes([v])
+
+
+def signed_vaa(signers=(0, 1, 2), guardian_set_index=4, sequence=1, tamper=False):
+    body = (
+        struct.pack(">IIH", 1709294400, 42, 2)
+        + bytes(32)
+        + struct.pack(">QB", sequence, 15)
+        + b"payload"
+    )
+    digest = keccak256(keccak256(body))
+    signatures = b"".join(bytes([i]) + _sign(PRIVATE_KEYS[i], digest) for i in signers)
+    if tamper:
+        body = body[:-1] + b"!"
+    return struct.pack(">BIB", 1, guardian_set_index, len(signers)) + signatures + body
+
+
+# Signature from the EIP-155 example transaction, signed by private key 0x4646...46.
+EIP155_DIGEST = bytes.fromhex(
+    "daf5a779ae972f972197303d7b574746c7ef83eadac0f2791ad23db92e4c8e53"
+)
+EIP155_SIGNATURE = (
+    (
+        18515461264373351373200002665853028612451056578545711640558177340181847433846
+    ).to_bytes(32, "big")
+    + (
+        46948507304638947509940763649030358759909902576025900602547168820602576006531
+    ).to_bytes(32, "big")
+    + bytes([0])
+)
+EIP155_ADDRESS = "9d8a62f656a8d1615c1294fd71e9cfb3e4855a4f"
+
+
+@pytest.mark.parametrize("hash_function", [keccak256, _keccak256_python])
+@pytest.mark.parametrize(
+    "data, expected",
+    [
+        (b"", "c5d2460186f7233c927e7db2dcc703c0e500b653ca82273b7bfad8045d85a470"),
+        (b"abc", "4e03657aea45a94fc7d47ba826c8d667c0d1e6e33a64a036ec44f58fa12d6c45"),
+    ],
+)
+def test_keccak256_known_answers(hash_function, data, expected):
+    assert hash_function(data).hex() == expected
+
+
+def test_address_of_private_key_one():
+    assert _address(1).hex() == "7e5f4552091a69125d5dfcb7b8c2659029395bdf"
+
+
+@pytest.mark.parametrize("recover", [recover_public_key, _recover_python])
+def test_recovers_known_signer(recover):
+    public_key = recover(EIP155_DIGEST, EIP155_SIGNATURE)
+    assert public_key_to_address(public_key).hex() == EIP155_ADDRESS
+
+    tampered = recover(EIP155_DIGEST[:-1] + b"\x00", EIP155_SIGNATURE)
+    assert public_key_to_address(tampered).hex() != EIP155_ADDRESS
+
+
+def test_native_backends_match_fallbacks():
+    keccak = pytest.importorskip("Crypto.Hash.keccak")
+    coincurve = pytest.importorskip("coincurve")
+    for data in (b"", b"abc", bytes(range(256)) * 3):
+        assert keccak.new(data=data, digest_bits=256).digest() == _keccak256_python(
+            data
+        )
+    key = coincurve.PrivateKey((7).to_bytes(32, "big"))
+    signature = key.sign_recoverable(EIP155_DIGEST, hasher=None)
+    assert (
+        _recover_python(EIP155_DIGEST, signature)
+        == key.public_key.format(compressed=False)[1:]
+    )
+
+
+@pytest.fixture
+def verifier():
+    guardian_sets = GuardianSetCache()
+    guardian_sets.add(4, ADDRESSES)
+    return VAAVerifier(guardian_sets)
+
+
+@pytest.mark.parametrize("count, expected", [(1, 1), (4, 3), (19, 13)])
+def test_quorum(count, expected):
+    assert quorum(count) == expected
+
+
+def test_verify_valid_vaa(verifier):
+    result = verifier.verify(signed_vaa())
+    assert result
+    assert (result.signatures, result.quorum) == (3, 3)
+
+
+def test_verify_mainnet_vaa():
+    cache = GuardianSetCache()
+    cache.add(3, MAINNET_GUARDIAN_SET_3)
+    result = VAAVerifier(cache).verify(PYTHNET_VAA)
+
+    assert result, result.error
+    assert result.guardian_set_index == 3
+    assert (result.signatures, result.quorum) == (len(PYTHNET_VAA_SIGNERS), 13)
+
+
+def test_verify_accepts_base64(verifier):
+    assert verifier.verify(base64.b64encode(signed_vaa()).decode())
+
+
+def test_verify_rejects_missing_quorum(verifier):
+    result = verifier.verify(signed_vaa(signers=(0, 1)))
+    assert not result
+    assert result.error == "no quorum"
+
+
+def test_verify_rejects_tampered_body(verifier):
+    result = verifier.verify(signed_vaa(tamper=True))
+    assert not result
+    assert result.error == "invalid signature from guardian 0"
+
+
+def test_verify_rejects_duplicate_signers(verifier):
+    assert not verifier.verify(signed_vaa(signers=(0, 0, 1)))
+
+
+def test_verify_unknown_guardian_set(verifier):
+    result = verifier.verify(signed_vaa(guardian_set_index=3))
+    assert not result
+    assert "not cached" in result.error
+
+
+@responses.activate
+def test_guardian_set_fetched_once(tmp_path):
+    guardian = GuardianAPI(Network.MAINNET)
+    responses.add(
+        responses.GET,
+        f"{guardian.base_url}/v1/guardianset/current",
+        json={"guardianSet": {"index": 4, "addresses": ADDRESSES}},
+    )
+    verifier = VAAVerifier(guardian_api=guardian)
+
+    assert verifier.verify(signed_vaa(sequence=1))
+    assert verifier.verify(signed_vaa(sequence=2))
+    assert len(responses.calls) == 1
+
+    path = str(tmp_path / "guardian_sets.json")
+    verifier.guardian_sets.save(path)
+    offline = GuardianSetCache()
+    offline.load(path)
+    assert VAAVerifier(offline).verify(signed_vaa(sequence=3))
+
+
+@pytest.mark.parametrize("processes", [1, 2])
+def test_verify_many_keeps_order(verifier, processes):
+    vaas = [
+        signed_vaa(sequence=1),
+        signed_vaa(tamper=True),
+        signed_vaa(guardian_set_index=9),
+        signed_vaa(signers=(1, 2, 3)),
+    ]
+
+    results = verifier.verify_many(vaas, processes=processes, chunksize=1)
+    assert [bool(result) for result in results] == [True, False, False, True]
+
+
+def test_verify_many_reports_malformed_vaas(verifier):
+    results = verifier.verify_many(
+        [signed_vaa(), b"\x01\x00", "not a vaa!", signed_vaa(sequence=2)], processes=1
+    )
+
+    assert [bool(result) for result in results] == [True, False, False, True]
+    assert results[1].guardian_set_index is None
+    assert "truncated" in results[1].error